@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Data Backends
+
+This module defines the interface the crawler uses to reach LinkedIn data and
+its implementations: the data_api client of the sandbox runtime, the simulated
+responses of the public API script, seeded synthetic data for load testing,
+and a plain HTTP client for services such as mock_linkedin_api.py. Backends
+only move data; rate limiting, caching, metrics and error handling live once
+in crawler.py.
+
+Besides single profile lookups, every backend offers get_profiles(usernames).
+Backends with a bulk endpoint serve it in one round trip per batch of
+max_batch usernames; the others fall back to one call per username.
+"""
+
+import sys
+import threading
+
+from client_pool import HTTP_SESSIONS, ResourcePool
+from rate_limiter import PROFILE_ENDPOINT, PROFILES_ENDPOINT, SEARCH_ENDPOINT
+from synthetic_data import SyntheticGenerator
+
+# Location of the data_api module in the sandbox runtime
+DATA_API_PATH = "/opt/.manus/.sandbox-runtime"
+
+# Default backend settings
+BACKEND_DEFAULTS = {
+    "pool_size": 16,  # API clients per backend; above max_concurrency so hedged calls need not wait
+    "http_base_url": "http://127.0.0.1:8765",
+    "http_timeout": 30,  # seconds
+    "bulk_batch_size": 25  # usernames per bulk profile call
+}
+
+class SearchBackend:
+    """Interface of a LinkedIn data source."""
+
+    name = "backend"
+    max_batch = 1  # usernames per get_profiles round trip; 1 means no bulk support
+
+    def search(self, keywords, location="", start=0):
+        """
+        Run one people search.
+
+        Args:
+            keywords: Search keywords
+            location: Optional location
+            start: Pagination offset
+
+        Returns:
+            Search response dictionary ({"success", "message", "data": {"items"}})
+        """
+        raise NotImplementedError
+
+    def get_profile(self, username):
+        """
+        Look up one profile.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Profile response dictionary ({"success", "message", "data"})
+        """
+        raise NotImplementedError
+
+    def get_profiles(self, usernames):
+        """
+        Look up several profiles.
+
+        Args:
+            usernames: LinkedIn usernames, at most max_batch of them
+
+        Returns:
+            Dictionary mapping each username to its profile response
+        """
+        return {username: self.get_profile(username) for username in usernames}
+
+    def stats(self):
+        """Return backend-specific usage statistics."""
+        return {}
+
+    def close(self):
+        """Release connections held by the backend."""
+
+def _import_api_client():
+    """Import the data_api client lazily, so other backends run without the sandbox runtime."""
+    if DATA_API_PATH not in sys.path:
+        sys.path.append(DATA_API_PATH)
+    from data_api import ApiClient
+    return ApiClient
+
+class DataApiBackend(SearchBackend):
+    """Backend calling the LinkedIn endpoints of data_api.ApiClient."""
+
+    name = "data_api"
+
+    def __init__(self, pool_size=None, client_factory=None):
+        self.clients = ResourcePool(client_factory or (lambda: _import_api_client()()),
+                                    max_size=pool_size or BACKEND_DEFAULTS["pool_size"],
+                                    name="data_api")
+
+    def search(self, keywords, location="", start=0):
+        with self.clients.lease() as client:
+            return client.call_api(SEARCH_ENDPOINT, query={
+                'keywords': keywords,
+                'start': str(start)
+            })
+
+    def get_profile(self, username):
+        with self.clients.lease() as client:
+            return client.call_api(PROFILE_ENDPOINT, query={
+                'username': username
+            })
+
+    def stats(self):
+        return self.clients.stats()
+
+class SimulatedBackend(SearchBackend):
+    """Backend returning simulated data, as the real LinkedIn API requires authentication."""
+
+    name = "simulated"
+
+    def __init__(self, bulk_batch_size=None):
+        self.max_batch = bulk_batch_size or BACKEND_DEFAULTS["bulk_batch_size"]
+        self.lock = threading.Lock()
+        self.calls = {SEARCH_ENDPOINT: 0, PROFILE_ENDPOINT: 0, PROFILES_ENDPOINT: 0}
+
+    def _count(self, endpoint):
+        with self.lock:
+            self.calls[endpoint] += 1
+
+    def search(self, keywords, location="", start=0):
+        # This is a placeholder for actual LinkedIn API call
+        # In a real implementation, you would use LinkedIn's official API or web scraping
+        self._count(SEARCH_ENDPOINT)
+        return {
+            "success": True,
+            "message": "Simulated search results",
+            "data": {
+                "total": 10,
+                "items": [
+                    {
+                        "fullName": f"Sample Person {i}",
+                        "headline": f"{keywords} at Sample Company",
+                        "summary": f"Experienced professional in {keywords}",
+                        "profilePicture": "https://example.com/profile.jpg",
+                        "location": location if location else "Porto, Portugal",
+                        "profileURL": f"https://linkedin.com/in/sample-person-{i}",
+                        "username": f"sample-person-{i}"
+                    } for i in range(1, 6)
+                ]
+            }
+        }
+
+    def _profile(self, username):
+        """Return the simulated profile response."""
+        return {
+            "success": True,
+            "message": "Simulated profile details",
+            "data": {
+                "firstName": "Sample",
+                "lastName": "Person",
+                "headline": "VP of Business Development at Tech Company",
+                "location": "Porto, Portugal",
+                "summary": "Experienced business development professional with expertise in SaaS and digital platforms.",
+                "experience": [
+                    {
+                        "title": "VP of Business Development",
+                        "company": "Tech Company",
+                        "location": "Porto, Portugal",
+                        "description": "Leading business development initiatives for a SaaS platform.",
+                        "startDate": "2020-01",
+                        "endDate": "Present"
+                    }
+                ],
+                "education": [
+                    {
+                        "school": "Sample University",
+                        "degree": "MBA",
+                        "field": "Business Administration",
+                        "startDate": "2015",
+                        "endDate": "2017"
+                    }
+                ],
+                "skills": ["Business Development", "SaaS", "Strategic Partnerships"]
+            }
+        }
+
+    def get_profile(self, username):
+        self._count(PROFILE_ENDPOINT)
+        return self._profile(username)
+
+    def get_profiles(self, usernames):
+        self._count(PROFILES_ENDPOINT)
+        return {username: self._profile(username) for username in usernames}
+
+    def stats(self):
+        with self.lock:
+            return {"name": self.name, "calls": dict(self.calls)}
+
+class SyntheticBackend(SimulatedBackend):
+    """Backend serving varied, reproducible profiles from synthetic_data.py."""
+
+    name = "synthetic"
+
+    def __init__(self, bulk_batch_size=None, **settings):
+        super().__init__(bulk_batch_size)
+        self.generator = SyntheticGenerator(**settings)
+
+    def search(self, keywords, location="", start=0):
+        self._count(SEARCH_ENDPOINT)
+        return self.generator.search(f"{keywords} {location}".strip(), start)
+
+    def _profile(self, username):
+        return self.generator.profile(username)
+
+class HttpBackend(SearchBackend):
+    """Backend speaking plain HTTP GET to a LinkedIn-compatible JSON service."""
+
+    name = "http"
+
+    def __init__(self, base_url=None, timeout=None, bulk_batch_size=None, sessions=None):
+        self.base_url = (base_url or BACKEND_DEFAULTS["http_base_url"]).rstrip("/")
+        self.timeout = timeout or BACKEND_DEFAULTS["http_timeout"]
+        self.max_batch = BACKEND_DEFAULTS["bulk_batch_size"] if bulk_batch_size is None else max(1, bulk_batch_size)
+        self.sessions = sessions or HTTP_SESSIONS
+
+    def _get(self, endpoint, params):
+        """Send one GET request and decode its JSON response."""
+        with self.sessions.lease() as session:
+            response = session.get(f"{self.base_url}/{endpoint}", params=params, timeout=self.timeout)
+        try:
+            return response.json()
+        except ValueError:
+            return {"success": False, "message": f"HTTP {response.status_code}: invalid JSON response"}
+
+    def search(self, keywords, location="", start=0):
+        params = {"keywords": keywords, "start": str(start)}
+        if location:
+            params["location"] = location
+        return self._get(SEARCH_ENDPOINT, params)
+
+    def get_profile(self, username):
+        return self._get(PROFILE_ENDPOINT, {"username": username})
+
+    def get_profiles(self, usernames):
+        if self.max_batch <= 1:
+            return super().get_profiles(usernames)
+        response = self._get(PROFILES_ENDPOINT, {"usernames": ",".join(usernames)})
+        if not response.get("success", False):
+            return {username: response for username in usernames}
+        return (response.get("data") or {}).get("profiles") or {}
+
+    def stats(self):
+        return self.sessions.stats()
+
+    def close(self):
+        self.sessions.close()
+
+# Backends selectable by name
+BACKENDS = {
+    DataApiBackend.name: DataApiBackend,
+    SimulatedBackend.name: SimulatedBackend,
+    SyntheticBackend.name: SyntheticBackend,
+    HttpBackend.name: HttpBackend
+}
+
+def create_backend(name, **settings):
+    """
+    Create a backend by name.
+
+    Args:
+        name: "data_api", "simulated", "synthetic" or "http"
+        **settings: Constructor arguments of the backend
+
+    Returns:
+        SearchBackend instance
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name} (expected one of {', '.join(BACKENDS)})")
+    return BACKENDS[name](**settings)
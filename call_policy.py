@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+LinkedIn API Call Policy
+
+This module bounds how long any single LinkedIn API call can hold up a crawl.
+Every call runs on a shared thread pool under a per-attempt timeout and an
+overall deadline. Transient failures (timeouts, server errors, rate limits,
+client exceptions) are retried with jittered exponential backoff; import,
+type and value errors fail at once. A call that is slower than a recent
+latency percentile gets a hedged duplicate, and the first good answer wins.
+A per-endpoint circuit breaker stops calling an endpoint after repeated
+failures and lets a single trial call through once its cool-down has passed.
+
+Rate-limiter tokens are taken before an attempt starts, so time spent
+waiting for one counts toward neither the attempt timeout nor the hedge
+delay. A hedge is only sent if a token is available at once; an endpoint
+that is being throttled is not hedged.
+
+A timed-out attempt cannot be interrupted; its worker thread finishes in the
+background while the caller moves on.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from metrics import METRICS
+from rate_limiter import PROFILE_ENDPOINT, PROFILES_ENDPOINT, SEARCH_ENDPOINT, is_rate_limit_message
+
+# Per-endpoint call policies (times are in seconds)
+CALL_POLICIES = {
+    "default": {
+        "attempt_timeout": 20.0,  # one attempt, including its hedge
+        "deadline": 60.0,  # all attempts and backoff together
+        "max_attempts": 3,
+        "backoff_base": 0.5,  # first retry waits up to this long
+        "backoff_max": 8.0,
+        "hedge_quantile": 0.95,  # hedge calls slower than this latency percentile (None = off)
+        "hedge_min_samples": 20,  # latency observations needed before hedging
+        "hedge_min_delay": 0.05,
+        "hedge_budget": 0.05,  # maximum share of calls that may be hedged
+        "breaker_failures": 5,  # consecutive failures that open the circuit
+        "breaker_reset": 30.0  # seconds before a trial call is let through
+    },
+    SEARCH_ENDPOINT: {
+        "attempt_timeout": 30.0
+    },
+    PROFILE_ENDPOINT: {
+        "attempt_timeout": 15.0
+    },
+    PROFILES_ENDPOINT: {
+        "attempt_timeout": 45.0,
+        "deadline": 120.0
+    }
+}
+
+# Failure messages worth retrying besides rate limits
+TRANSIENT_MARKERS = ("timeout", "timed out", "temporarily", "unavailable", "internal server error",
+                     "bad gateway", "connection", "500", "502", "503", "504")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call gets no answer before its timeout or deadline."""
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its endpoint's circuit is open."""
+
+# Exceptions that no retry can fix
+PERMANENT_ERRORS = (CircuitOpenError, ImportError, TypeError, ValueError)
+
+def is_transient(response=None, error=None):
+    """
+    Check whether a failed call is worth retrying.
+
+    Args:
+        response: Response dictionary of a failed call
+        error: Exception raised by the call
+
+    Returns:
+        Boolean indicating if another attempt may succeed
+    """
+    if error is not None:
+        # A missing client library or a malformed call fails the same way every time
+        return not isinstance(error, PERMANENT_ERRORS)
+    message = str((response or {}).get("message", "")).lower()
+    return is_rate_limit_message(message) or any(marker in message for marker in TRANSIENT_MARKERS)
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint."""
+
+    def __init__(self, endpoint, failures, reset):
+        self.endpoint = endpoint
+        self.failures = int(failures)
+        self.reset = float(reset)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_running = False
+        self.opened = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """
+        Decide whether a call may proceed.
+
+        Returns:
+            True if the circuit is closed, or if this call is the half-open trial
+        """
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self.trial_running:
+                self.trial_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Close the circuit after a call reached a healthy endpoint."""
+        with self.lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.trial_running = False
+
+    def record_failure(self):
+        """Count a failure; open the circuit at the threshold or when the trial fails."""
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failures:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+            self.trial_running = False
+
+    def release_trial(self):
+        """Give up the half-open trial without a verdict, so the next call can be the trial."""
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+            self.trial_running = False
+
+    def stats(self):
+        """Return the breaker state and counters."""
+        with self.lock:
+            return {"state": self.state, "consecutive_failures": self.consecutive_failures,
+                    "opened": self.opened, "rejected": self.rejected}
+
+class CallPolicy:
+    """Registry of per-endpoint deadlines, retries, hedging and circuit breakers."""
+
+    def __init__(self, policies=None, max_workers=32):
+        self.policies = policies if policies is not None else CALL_POLICIES
+        self.max_workers = max_workers
+        self.overrides = {}
+        self.breakers = {}
+        self.counts = {}
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def settings(self, endpoint):
+        """Return the effective policy of an endpoint."""
+        settings = dict(self.policies.get("default", {}))
+        settings.update(self.policies.get(endpoint, {}))
+        settings.update(self.overrides.get(endpoint, {}))
+        return settings
+
+    def configure(self, endpoint, **settings):
+        """
+        Override the policy of an endpoint.
+
+        Args:
+            endpoint: API endpoint name
+            **settings: Policy settings such as attempt_timeout or hedge_quantile
+        """
+        with self.lock:
+            self.overrides.setdefault(endpoint, {}).update(settings)
+            self.breakers.pop(endpoint, None)
+
+    def breaker(self, endpoint):
+        """Return the circuit breaker of an endpoint, creating it on first use."""
+        with self.lock:
+            if endpoint not in self.breakers:
+                settings = self.settings(endpoint)
+                self.breakers[endpoint] = CircuitBreaker(endpoint, settings["breaker_failures"],
+                                                         settings["breaker_reset"])
+            return self.breakers[endpoint]
+
+    def _count(self, endpoint, name):
+        """Increment a per-endpoint counter and its metric."""
+        with self.lock:
+            counts = self.counts.setdefault(endpoint, {"calls": 0, "retries": 0, "hedges": 0,
+                                                       "deadline_exceeded": 0, "circuit_open": 0})
+            counts[name] += 1
+        if name != "calls":
+            METRICS.increment(f"api_{name}_total", endpoint=endpoint)
+
+    def _executor(self):
+        """Return the shared thread pool, starting it on first use."""
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="api-call")
+            return self.executor
+
+    def _hedge_delay(self, endpoint, settings):
+        """Return how long to wait before hedging, or None if this call may not be hedged."""
+        if settings["hedge_quantile"] is None:
+            return None
+        with self.lock:
+            counts = self.counts.get(endpoint, {})
+            if counts.get("hedges", 0) >= settings["hedge_budget"] * counts.get("calls", 0):
+                return None
+        delay = METRICS.quantile("api_call_seconds", settings["hedge_quantile"],
+                                 min_count=settings["hedge_min_samples"], endpoint=endpoint)
+        if delay is None:
+            return None
+        return max(delay, settings["hedge_min_delay"])
+
+    def _attempt(self, endpoint, send, timeout, settings, limiter=None):
+        """
+        Run one attempt, hedging it if it is slow and a rate-limiter token is free.
+
+        Returns:
+            The first successful response, else the last response received
+
+        Raises:
+            DeadlineExceeded: No response arrived within the timeout
+            Exception: The exception of the last failed call
+        """
+        executor = self._executor()
+        started = time.monotonic()
+        pending = {executor.submit(send)}
+        hedge_delay = self._hedge_delay(endpoint, settings)
+        if hedge_delay is not None and hedge_delay < timeout:
+            done, _ = wait(pending, timeout=hedge_delay)
+            if not done and (limiter is None or limiter.try_acquire(endpoint)):
+                self._count(endpoint, "hedges")
+                pending.add(executor.submit(send))
+
+        response, error = None, None
+        while pending:
+            remaining = timeout - (time.monotonic() - started)
+            done, pending = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                try:
+                    response, error = future.result(), None
+                except Exception as e:
+                    error = e
+                    continue
+                if response.get("success", False):
+                    return response
+        if response is not None:
+            return response
+        if error is not None:
+            raise error
+        self._count(endpoint, "deadline_exceeded")
+        raise DeadlineExceeded(f"{endpoint}: no response within {timeout:.1f}s")
+
+    def call(self, endpoint, send, limiter=None):
+        """
+        Make an API call under the endpoint's policy.
+
+        Args:
+            endpoint: API endpoint name
+            send: Callable making one call and returning its response dictionary
+            limiter: Optional RateLimiter to take a token from before every attempt and hedge
+
+        Returns:
+            The first successful response, or the last failed one
+
+        Raises:
+            CircuitOpenError: The endpoint's circuit is open
+            DeadlineExceeded: No attempt answered before the deadline
+            Exception: The exception of the last attempt
+        """
+        settings = self.settings(endpoint)
+        breaker = self.breaker(endpoint)
+        deadline = time.monotonic() + settings["deadline"]
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self._count(endpoint, "circuit_open")
+                raise CircuitOpenError(f"{endpoint}: circuit open after repeated failures")
+            if limiter is not None:
+                # Waiting for a token does not use up the attempt's time
+                waited = limiter.acquire(endpoint)
+                METRICS.observe("stage_seconds", waited, stage="rate_limit_wait")
+                deadline += waited
+            attempt += 1
+            self._count(endpoint, "calls")
+            timeout = min(settings["attempt_timeout"], deadline - time.monotonic())
+            try:
+                response, error = self._attempt(endpoint, send, timeout, settings, limiter), None
+            except Exception as e:
+                response, error = None, e
+
+            if response is not None and response.get("success", False):
+                breaker.record_success()
+                return response
+            if not is_transient(response, error):
+                if error is not None:
+                    # Raised before the endpoint was reached; says nothing about its health
+                    breaker.release_trial()
+                    raise error
+                # The endpoint answered; the request itself was bad
+                breaker.record_success()
+                return response
+            if response is not None and is_rate_limit_message(response.get("message", "")):
+                # Throttled, not down: the rate limiter backs off instead
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+            # Full jitter keeps retrying callers from moving in lockstep
+            backoff = random.uniform(0, min(settings["backoff_max"],
+                                            settings["backoff_base"] * 2 ** (attempt - 1)))
+            if attempt >= settings["max_attempts"] or time.monotonic() + backoff >= deadline:
+                if error is not None:
+                    raise error
+                return response
+            self._count(endpoint, "retries")
+            time.sleep(backoff)
+
+    def stats(self):
+        """Return call counters and breaker state per endpoint."""
+        with self.lock:
+            counts = {endpoint: dict(values) for endpoint, values in self.counts.items()}
+            breakers = dict(self.breakers)
+        return {endpoint: {**values, "breaker": breakers[endpoint].stats() if endpoint in breakers else None}
+                for endpoint, values in counts.items()}
+
+    def shutdown(self):
+        """Stop the thread pool once its running attempts finish; the next call starts a new one."""
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def reset(self):
+        """Forget counters and breaker state."""
+        with self.lock:
+            self.breakers = {}
+            self.counts = {}
+
+# Shared policy used by all scripts
+CALL_POLICY = CallPolicy()
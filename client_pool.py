@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+LinkedIn API Client Pool
+
+This module keeps long-lived API clients and keep-alive HTTP sessions and
+hands them out to concurrent workers, so a crawl reuses connections instead of
+constructing a new client for every call. Each pool tracks how many of its
+clients are in use and how many sit idle.
+"""
+
+import threading
+from contextlib import contextmanager
+
+# Default pool settings
+POOL_DEFAULTS = {
+    "max_size": 8,  # clients per pool
+    "http_sessions": 16,  # shared HTTP sessions; above max_concurrency so hedged calls need not wait
+    "http_pool_maxsize": 8  # keep-alive connections per host and session
+}
+
+class ResourcePool:
+    """Thread-safe pool of reusable clients created on demand by a factory."""
+
+    def __init__(self, factory, max_size=None, name="pool"):
+        self.factory = factory
+        self.max_size = max_size or POOL_DEFAULTS["max_size"]
+        self.name = name
+        self.idle = []
+        self.in_use = 0
+        self.created = 0
+        self.leases = 0
+        self.waits = 0
+        self.peak_in_use = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Take a client from the pool, creating one if the pool is not full.
+
+        Returns:
+            A client instance; it must be handed back with release()
+        """
+        with self.condition:
+            if not self.idle and self.created >= self.max_size:
+                self.waits += 1
+                # A failed or closed client frees a slot to create one in
+                while not self.idle and self.created >= self.max_size:
+                    self.condition.wait()
+            if self.idle:
+                client = self.idle.pop()
+            else:
+                # Reserve the slot before constructing outside the lock
+                self.created += 1
+                client = None
+            self.in_use += 1
+            self.leases += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        if client is None:
+            try:
+                client = self.factory()
+            except Exception:
+                with self.condition:
+                    self.created -= 1
+                    self.in_use -= 1
+                    self.condition.notify()
+                raise
+        return client
+
+    def release(self, client):
+        """
+        Hand a client back to the pool.
+
+        Args:
+            client: Client previously returned by acquire()
+        """
+        with self.condition:
+            self.in_use -= 1
+            self.idle.append(client)
+            self.condition.notify()
+
+    @contextmanager
+    def lease(self):
+        """Context manager that acquires a client and always releases it."""
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self):
+        """Close and drop all idle clients that support close()."""
+        with self.condition:
+            idle, self.idle = self.idle, []
+            self.created -= len(idle)
+            self.condition.notify_all()
+        for client in idle:
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+
+    def stats(self):
+        """
+        Report pool usage.
+
+        Returns:
+            Dictionary with in-use, idle and lifetime counts
+        """
+        with self.condition:
+            return {
+                "name": self.name,
+                "max_size": self.max_size,
+                "created": self.created,
+                "in_use": self.in_use,
+                "idle": len(self.idle),
+                "peak_in_use": self.peak_in_use,
+                "leases": self.leases,
+                "waits": self.waits
+            }
+
+def create_http_session(pool_maxsize=None):
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    Args:
+        pool_maxsize: Connections kept open per host
+
+    Returns:
+        Configured requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    pool_maxsize = pool_maxsize or POOL_DEFAULTS["http_pool_maxsize"]
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+# Shared pool of keep-alive HTTP sessions
+HTTP_SESSIONS = ResourcePool(create_http_session, max_size=POOL_DEFAULTS["http_sessions"],
+                             name="http_sessions")
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+End-to-End Crawl Benchmark
+
+This script runs the real crawl path of linkedin_search_automation.py against
+the local mock LinkedIn API and records crawl throughput, p50/p99 call latency
+and peak memory for a range of concurrency settings, so performance
+regressions show up before production.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import mock_linkedin_api
+
+# Benchmark configuration
+CONFIG = {
+    "concurrency_levels": [1, 4, 8, 16],
+    "positions": ["Head of Growth", "VP of Business Development", "COO"],
+    "industries": ["SaaS", "Ecommerce"],
+    "pagination": {"max_pages": 3},
+    "unthrottled_rate": 10000.0,  # calls/s given to the rate limiter during runs
+    "mock": {
+        "latency_ms": 20,
+        "latency_jitter_ms": 10,
+        "tail_rate": 0.0,
+        "tail_latency_ms": 2000,
+        "error_rate": 0.01,
+        "rate_limit_rate": 0.0,
+        "results_per_page": 10,
+        "total_results": 30,
+        "profile_pool": 400
+    },
+    "results_file": "linkedin_benchmark_results.json"
+}
+
+def percentile(values, fraction):
+    """
+    Return a percentile of a list of values.
+
+    Args:
+        values: Numbers
+        fraction: Percentile between 0 and 1
+
+    Returns:
+        Nearest-rank percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+class LatencyRecorder:
+    """Thread-safe collection of call latencies per operation."""
+
+    def __init__(self):
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def wrap(self, name, func):
+        """Return func wrapped so each call's duration is recorded under name."""
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self.lock:
+                    self.samples.setdefault(name, []).append(elapsed)
+        return timed
+
+    def summary(self):
+        """Return call counts and p50/p99/mean latencies in milliseconds."""
+        return {
+            name: {
+                "calls": len(values),
+                "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+                "mean_ms": round(statistics.fmean(values) * 1000, 2)
+            }
+            for name, values in self.samples.items()
+        }
+
+def run_once(automation, concurrency, track_memory, workdir):
+    """
+    Run one crawl at a given concurrency.
+
+    Args:
+        automation: Imported linkedin_search_automation module
+        concurrency: Maximum API calls in flight
+        track_memory: Measure peak Python memory with tracemalloc
+        workdir: Directory for the per-run profile cache
+
+    Returns:
+        Dictionary with throughput, latency and memory figures
+    """
+    from backends import DataApiBackend
+    from call_policy import CALL_POLICY
+    from crawl_engine import run_crawl
+    from profile_cache import ProfileCache
+    from query_planner import build_search_units
+    from rate_limiter import RATE_LIMITER
+
+    backend = mock_linkedin_api.configure_mock(**CONFIG["mock"])
+
+    # Fresh shared state, so runs do not warm each other up
+    crawler = automation.CRAWLER
+    crawler.backend = DataApiBackend(pool_size=2 * concurrency)  # room for hedged calls
+    crawler.profile_cache = ProfileCache(os.path.join(workdir, f"cache-{concurrency}.sqlite"))
+    RATE_LIMITER.buckets = {}
+    CALL_POLICY.reset()
+    for endpoint in (mock_linkedin_api.SEARCH_ENDPOINT, mock_linkedin_api.PROFILE_ENDPOINT):
+        RATE_LIMITER.configure(endpoint, rate=CONFIG["unthrottled_rate"],
+                               max_rate=CONFIG["unthrottled_rate"], burst=concurrency)
+
+    recorder = LatencyRecorder()
+    units = build_search_units(CONFIG["positions"], CONFIG["industries"])
+    records = [0]
+
+    def count_page(unit, page, page_records):
+        records[0] += len(page_records)
+
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    run_crawl(
+        units,
+        recorder.wrap("search", crawler.search_unit),
+        recorder.wrap("profile", crawler.get_profile_details),
+        crawler.is_job_relevant,
+        log=lambda message: None,
+        max_concurrency=concurrency,
+        on_page_complete=count_page,
+        pagination=CONFIG["pagination"]
+    )
+    elapsed = time.perf_counter() - start
+    peak_bytes = None
+    if track_memory:
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    crawler.profile_cache.close()
+
+    api_calls = sum(backend.calls.values())
+    return {
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "api_calls": api_calls,
+        "calls_per_second": round(api_calls / elapsed, 1) if elapsed else 0.0,
+        "records": records[0],
+        "records_per_second": round(records[0] / elapsed, 1) if elapsed else 0.0,
+        "latency": recorder.summary(),
+        "peak_memory_kb": round(peak_bytes / 1024, 1) if peak_bytes is not None else None
+    }
+
+def main(argv=None):
+    """Run the benchmark suite and save the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the crawl against the mock LinkedIn API")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=CONFIG["concurrency_levels"])
+    parser.add_argument("--latency-ms", type=float, default=CONFIG["mock"]["latency_ms"])
+    parser.add_argument("--error-rate", type=float, default=CONFIG["mock"]["error_rate"])
+    parser.add_argument("--tail-rate", type=float, default=CONFIG["mock"]["tail_rate"],
+                        help="share of calls delayed by the mock's tail latency")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak memory tracking")
+    parser.add_argument("--output", default=CONFIG["results_file"])
+    args = parser.parse_args(argv)
+
+    CONFIG["mock"]["latency_ms"] = args.latency_ms
+    CONFIG["mock"]["error_rate"] = args.error_rate
+    CONFIG["mock"]["tail_rate"] = args.tail_rate
+
+    # The fake data_api must be registered before the script imports it
+    mock_linkedin_api.install_fake_data_api(**CONFIG["mock"])
+    import linkedin_search_automation as automation
+    automation.LOG.set_console_level("WARNING")
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for concurrency in args.concurrency:
+            result = run_once(automation, concurrency, not args.no_memory, workdir)
+            results.append(result)
+            search = result["latency"].get("search", {})
+            profile = result["latency"].get("profile", {})
+            # Peak memory is only known when tracemalloc ran
+            peak = f" peak {result['peak_memory_kb']} KB" if result["peak_memory_kb"] is not None else ""
+            print(f"concurrency {concurrency:3d}: {result['seconds']:7.2f}s "
+                  f"{result['calls_per_second']:8.1f} calls/s "
+                  f"search p50/p99 {search.get('p50_ms', 0):.1f}/{search.get('p99_ms', 0):.1f} ms "
+                  f"profile p50/p99 {profile.get('p50_ms', 0):.1f}/{profile.get('p99_ms', 0):.1f} ms"
+                  f"{peak}")
+
+    report = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "mock": CONFIG["mock"], "runs": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark results saved to {args.output}")
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Crawl Engine
+
+This module runs the search and profile lookups of the job search scripts
+concurrently on an asyncio event loop, bounded by a configurable concurrency
+limit, while producing the same result records as the sequential loops.
+Search results are streamed page by page through paginator.py. Request rates
+are not enforced here: the API functions take their rate-limiter tokens
+through the call policy in call_policy.py.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from paginator import iter_search_pages, keyword_relevance
+from records import ResultRecord
+
+# Default engine settings
+CRAWL_DEFAULTS = {
+    "max_concurrency": 8
+}
+
+async def _call(semaphore, loop, executor, func, *args):
+    """Run a blocking API function in the executor under the concurrency limit."""
+    async with semaphore:
+        return await loop.run_in_executor(executor, func, *args)
+
+async def _crawl_unit(unit, search_fn, profile_fn, relevance_fn, log, call, on_unit_complete,
+                      on_page_complete, pagination, should_fetch, profiles_fn, profile_batch_size,
+                      prefilter):
+    """
+    Run one search unit page by page and fetch the profiles it returns.
+
+    Args:
+        unit: Crawl unit built by build_search_units
+        search_fn: Callable taking a unit and a start offset and returning a search response
+        profile_fn: Callable taking a username and returning a profile response
+        relevance_fn: Callable deciding whether profile data is relevant
+        log: Logging callable
+        call: Coroutine factory running blocking calls under the limit
+        on_unit_complete: Optional callable receiving the unit and its statistics
+        on_page_complete: Optional callable consuming each page's records
+        pagination: Stop rules passed to iter_search_pages
+        should_fetch: Optional callable deciding from a search item whether to fetch its profile
+        profiles_fn: Optional bulk callable taking a list of usernames and
+            returning {username: profile response}
+        profile_batch_size: Usernames per profiles_fn call
+        prefilter: Optional callable taking the unit and a page's new search
+            items and returning those worth fetching, in fetch order
+
+    Returns:
+        List of ResultRecord objects for the unit (empty when on_page_complete consumes them)
+    """
+    log(f"Using search query: {unit['query']}")
+    resume = unit.get("resume") or {"page": 1, "start": 0}
+    # The next page is prefetched here, through call(), so it counts against the concurrency limit
+    options = dict(pagination)
+    prefetch = options.pop("prefetch", True)
+    pages = iter_search_pages(
+        lambda start: search_fn(unit, start),
+        relevance_fn=keyword_relevance(unit["query"]),
+        log=log,
+        start=resume["start"],
+        first_page=resume["page"],
+        prefetch=False,
+        **options
+    )
+
+    records = []
+    relevant_usernames = []
+    # A resumed unit skips the hits of the pages it already processed
+    fetched_usernames = set(resume.get("usernames", ()))
+    calls = 0
+    skipped = 0
+    rejected = 0
+    failed = False
+    pending = None
+    try:
+        while True:
+            page = await (pending or call(next, pages, None))
+            pending = None
+            if page is None:
+                break
+            calls += 1
+            response = page["response"]
+            if not response.get("success", False):
+                log(f"Search failed: {response.get('message', 'Unknown error')}")
+                failed = True
+                break
+
+            items = page["items"]
+            log(f"Found {len(items)} results on page {page['page']}")
+
+            # Profiles are fetched while the next page is prefetched; the
+            # paginator applies its stop rules before requesting it
+            if prefetch:
+                pending = asyncio.ensure_future(call(next, pages, None))
+            candidates = []
+            for item in items:
+                username = item.get("username")
+                if username and username not in fetched_usernames:
+                    fetched_usernames.add(username)
+                    candidates.append(item)
+            if prefilter is not None:
+                # Drop hits whose search fields already rule them out, best first
+                selected = prefilter(unit, candidates)
+                rejected += len(candidates) - len(selected)
+                candidates = selected
+            usernames = []
+            for item in candidates:
+                if should_fetch is None or should_fetch(item):
+                    usernames.append(item["username"])
+                else:
+                    skipped += 1
+            if profiles_fn is not None:
+                # One round trip per batch instead of one per profile
+                batches = [usernames[offset:offset + profile_batch_size]
+                           for offset in range(0, len(usernames), profile_batch_size)]
+                results = await asyncio.gather(*(call(profiles_fn, batch) for batch in batches))
+                by_username = {username: profile for result in results for username, profile in result.items()}
+                profiles = [by_username.get(username) or {} for username in usernames]
+                calls += len(batches)
+            else:
+                profiles = await asyncio.gather(*(call(profile_fn, username) for username in usernames))
+                calls += len(usernames)
+
+            page_records = []
+            for username, profile in zip(usernames, profiles):
+                profile_data = profile.get("data", {})
+                if relevance_fn(profile_data):
+                    page_records.append(ResultRecord.from_api(unit["fields"], username, profile_data))
+                    relevant_usernames.append(username)
+                    log(f"Added relevant profile: {username}")
+
+            if on_page_complete:
+                on_page_complete(unit, page, page_records)
+            else:
+                records.extend(page_records)
+    finally:
+        if pending is not None:
+            # The generator cannot be closed while the prefetch is running it
+            await asyncio.gather(pending, return_exceptions=True)
+        pages.close()
+
+    if on_unit_complete:
+        on_unit_complete(unit, {"calls": calls, "relevant_usernames": relevant_usernames,
+                                "skipped": skipped, "rejected": rejected, "failed": failed})
+    return records
+
+async def crawl(units, search_fn, profile_fn, relevance_fn, log=print, max_concurrency=None,
+                on_unit_complete=None, on_page_complete=None, pagination=None,
+                should_fetch=None, profiles_fn=None, profile_batch_size=1, prefilter=None):
+    """
+    Crawl all units concurrently.
+
+    Args:
+        units: Crawl units built by build_search_units; a unit may carry a
+            "resume" point ({"page", "start", "usernames"}) to continue a partial crawl
+        search_fn: Callable taking a unit and a start offset and returning a search response
+        profile_fn: Callable taking a username and returning a profile response
+        relevance_fn: Callable deciding whether profile data is relevant
+        log: Logging callable
+        max_concurrency: Maximum number of API calls in flight
+        on_unit_complete: Optional callable receiving each finished unit and its
+            statistics ({"calls", "relevant_usernames", "skipped", "rejected", "failed"})
+        on_page_complete: Optional callable receiving the unit, the page and its
+            records as soon as the page is processed; records are then streamed
+            to it instead of being collected in memory
+        pagination: Optional stop rules passed to iter_search_pages
+        should_fetch: Optional callable taking a search item and returning
+            False when its profile need not be fetched
+        profiles_fn: Optional bulk callable taking a list of usernames and
+            returning {username: profile response}; used instead of profile_fn
+        profile_batch_size: Usernames per profiles_fn call
+        prefilter: Optional callable taking a unit and a page's new search
+            items and returning those worth fetching, in fetch order; runs
+            before should_fetch
+
+    Returns:
+        List of ResultRecord objects in unit order (empty when on_page_complete is set)
+    """
+    max_concurrency = max_concurrency or CRAWL_DEFAULTS["max_concurrency"]
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        def call(func, *args):
+            return _call(semaphore, loop, executor, func, *args)
+
+        # Bound the units in progress so each keeps at most one page and prefetch in flight
+        unit_slots = asyncio.Semaphore(max_concurrency)
+
+        async def crawl_unit(unit):
+            async with unit_slots:
+                return await _crawl_unit(unit, search_fn, profile_fn, relevance_fn, log, call,
+                                         on_unit_complete, on_page_complete, pagination or {},
+                                         should_fetch, profiles_fn, max(1, profile_batch_size),
+                                         prefilter)
+
+        per_unit = await asyncio.gather(*(crawl_unit(unit) for unit in units))
+
+    return [record for records in per_unit for record in records]
+
+def run_crawl(units, search_fn, profile_fn, relevance_fn, log=print, max_concurrency=None,
+              on_unit_complete=None, on_page_complete=None, pagination=None,
+              should_fetch=None, profiles_fn=None, profile_batch_size=1, prefilter=None):
+    """
+    Synchronous entry point for crawl().
+
+    Args:
+        units: Crawl units built by build_search_units
+        search_fn: Callable taking a unit and a start offset and returning a search response
+        profile_fn: Callable taking a username and returning a profile response
+        relevance_fn: Callable deciding whether profile data is relevant
+        log: Logging callable
+        max_concurrency: Maximum number of API calls in flight
+        on_unit_complete: Optional callable receiving each finished unit and its
+            statistics ({"calls", "relevant_usernames", "skipped", "rejected", "failed"})
+        on_page_complete: Optional callable receiving the unit, the page and its
+            records as soon as the page is processed; records are then streamed
+            to it instead of being collected in memory
+        pagination: Optional stop rules passed to iter_search_pages
+        should_fetch: Optional callable taking a search item and returning
+            False when its profile need not be fetched
+        profiles_fn: Optional bulk callable taking a list of usernames and
+            returning {username: profile response}; used instead of profile_fn
+        profile_batch_size: Usernames per profiles_fn call
+        prefilter: Optional callable taking a unit and a page's new search
+            items and returning those worth fetching, in fetch order; runs
+            before should_fetch
+
+    Returns:
+        List of ResultRecord objects in unit order (empty when on_page_complete is set)
+    """
+    return asyncio.run(crawl(units, search_fn, profile_fn, relevance_fn, log, max_concurrency,
+                             on_unit_complete, on_page_complete, pagination, should_fetch,
+                             profiles_fn, profile_batch_size, prefilter))
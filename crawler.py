@@ -0,0 +1,624 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Crawler Core
+
+This module holds the one implementation of the job search crawl shared by
+linkedin_search_automation.py, linkedin_search_public_api.py and the
+validation script. A LinkedInCrawler wraps a data backend from backends.py
+with everything that is independent of where the data comes from: rate
+limiting, the profile cache, metrics, filtering, the search plan, streaming
+results with checkpoints, and the cross-run seen index. The scripts only
+supply their CONFIG and backend.
+"""
+
+import argparse
+import json
+import signal
+import threading
+import time
+
+from backends import create_backend
+from call_policy import CALL_POLICY
+from filter_engine import FilterEngine
+from log_pipeline import get_log_pipeline
+from metrics import METRICS, profiled
+from poll_schedule import PollSchedule
+from prefilter import SearchPrefilter
+from profile_cache import ProfileCache
+from query_planner import build_search_plan, format_search_plan, load_query_history, record_query_yields, unit_key
+from rate_limiter import RATE_LIMITER, SEARCH_ENDPOINT, PROFILE_ENDPOINT, PROFILES_ENDPOINT
+from results_sink import CrawlCheckpoint, JsonlResultsSink, iter_jsonl, write_json_array
+from seen_index import SeenIndex, format_delta_report
+
+# Settings a script CONFIG may leave out
+CRAWLER_DEFAULTS = {
+    "backend": "data_api",
+    "backend_settings": {},
+    "search_by_location": False,  # combine every position/industry pair with CONFIG["locations"]
+    "locations": [],
+    "drop_subsumed_locations": True,
+    "exclude_locations": [],
+    "require_location_match": False,
+    "preferred_formats": [],
+    "results_file": "linkedin_job_results.json",
+    "results_stream_file": "linkedin_job_results.jsonl",
+    "results_store_dir": "linkedin_results_store",
+    "checkpoint_file": "linkedin_crawl_checkpoint.jsonl",
+    "console_log_level": "INFO",
+    "log_file": "linkedin_search_log.jsonl",
+    "profile_cache_file": "linkedin_profile_cache.sqlite",
+    "profile_cache_ttl_hours": 24,
+    "profile_cache_max_entries": 50000,
+    "max_concurrency": 8,
+    "pagination": {},
+    "api_call_budget": None,
+    "prefilter_search_hits": True,
+    "profile_call_budget": None,
+    "min_prefilter_score": 0.0,
+    "query_history_file": "linkedin_query_history.json",
+    "rate_limits": {},
+    "call_policies": {},
+    "metrics_file": "linkedin_metrics.json",
+    "prometheus_file": "linkedin_metrics.prom",
+    "profile_file": "linkedin_search.prof",
+    "seen_index_file": "linkedin_seen_index.sqlite",
+    "delta_report_file": "linkedin_delta_report.json",
+    "skip_unchanged_profiles": True,
+    "watch": {},  # overrides of poll_schedule.WATCH_DEFAULTS
+    "watch_schedule_file": "linkedin_watch_schedule.json"
+}
+
+class LinkedInCrawler:
+    """Job search crawl over a pluggable data backend."""
+
+    def __init__(self, config, backend=None, rate_limiter=None, call_policy=None):
+        for name, value in CRAWLER_DEFAULTS.items():
+            config.setdefault(name, value)
+        self.config = config
+
+        # Filtering criteria compiled once
+        self.filter_engine = FilterEngine.from_config(config)
+
+        # Buffered log writer shared by every log_message call
+        self.log = get_log_pipeline(config["log_file"], console_level=config["console_log_level"])
+
+        # Where the data comes from
+        self.backend = backend or create_backend(config["backend"], **config["backend_settings"])
+
+        # Quotas and call policies, shared by every crawler of the process unless given
+        self.rate_limiter = rate_limiter or RATE_LIMITER
+        self.call_policy = call_policy or CALL_POLICY
+
+        # Profile responses shared across runs and scripts
+        self.profile_cache = ProfileCache(
+            config["profile_cache_file"],
+            ttl_hours=config["profile_cache_ttl_hours"],
+            max_entries=config["profile_cache_max_entries"]
+        )
+
+        # Profiles seen by earlier runs, for skipping unchanged ones and delta reports
+        self.seen_index = SeenIndex(config["seen_index_file"],
+                                    skip_unchanged=config["skip_unchanged_profiles"])
+
+    def log_message(self, message, level="INFO", **fields):
+        """Log a message with timestamp to the log file."""
+        self.log.log(message, level, **fields)
+
+    def call_api(self, endpoint, request, *args):
+        """
+        Make one backend call under the endpoint's deadline, retry, hedging and breaker policy.
+
+        Args:
+            endpoint: API endpoint name, used for the rate limiter, call policy and metrics
+            request: Backend method performing the call
+            *args: Arguments of the backend method
+
+        Returns:
+            The backend's response; bulk lookups are wrapped as {"success", "message", "data": {"profiles"}}
+        """
+        return self.call_policy.call(endpoint, lambda: self._send(endpoint, request, *args),
+                                     limiter=self.rate_limiter)
+
+    def _send(self, endpoint, request, *args):
+        """Make one instrumented attempt of a backend call; the call policy has taken its rate-limit token."""
+        started = time.perf_counter()
+        try:
+            response = request(*args)
+        except Exception as e:
+            METRICS.increment("api_calls_total", endpoint=endpoint, outcome="exception")
+            self.rate_limiter.report_error(endpoint, e)
+            raise
+        if endpoint == PROFILES_ENDPOINT:
+            # A bulk response succeeds if any of its profiles does
+            failures = [profile for profile in response.values() if not profile.get("success", False)]
+            response = {"success": len(failures) < len(response) or not response,
+                        "message": failures[0].get("message", "") if failures else "",
+                        "data": {"profiles": response}}
+        METRICS.record_api_call(endpoint, time.perf_counter() - started, response)
+        self.rate_limiter.report(endpoint, response)
+        return response
+
+    @METRICS.timed("stage_seconds", stage="search")
+    def search_linkedin_jobs(self, keywords, location="", start=0):
+        """
+        Search for jobs on LinkedIn through the backend.
+
+        Args:
+            keywords: Search keywords
+            location: Location for job search
+            start: Starting position for pagination
+
+        Returns:
+            Search results from LinkedIn API
+        """
+        try:
+            self.log_message(f"Searching LinkedIn with keywords: {keywords}, location: {location}, start: {start}", "DEBUG")
+            return self.call_api(SEARCH_ENDPOINT, self.backend.search, keywords, location, start)
+        except Exception as e:
+            self.log_message(f"Error searching LinkedIn: {str(e)}", "ERROR")
+            return {"success": False, "message": str(e), "data": {"items": []}}
+
+    def search_unit(self, unit, start):
+        """Run the search of a crawl unit at a pagination offset."""
+        return self.search_linkedin_jobs(unit["query"], unit.get("location", ""), start)
+
+    @METRICS.timed("stage_seconds", stage="profile")
+    def get_profile_details(self, username):
+        """
+        Get detailed profile information for a LinkedIn user, using the profile cache.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Profile details from the cache or the LinkedIn API
+        """
+        return self.profile_cache.get_or_fetch(username, self.fetch_profile_details)
+
+    def fetch_profile_details(self, username):
+        """
+        Fetch detailed profile information for a LinkedIn user from the backend.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Profile details from LinkedIn API
+        """
+        try:
+            self.log_message(f"Getting profile details for: {username}", "DEBUG")
+            return self.call_api(PROFILE_ENDPOINT, self.backend.get_profile, username)
+        except Exception as e:
+            self.log_message(f"Error getting profile details: {str(e)}", "ERROR")
+            return {"success": False, "message": str(e), "data": {}}
+
+    @METRICS.timed("stage_seconds", stage="profile")
+    def get_profiles(self, usernames):
+        """
+        Get several profiles, using the cache and one bulk backend call for the rest.
+
+        Args:
+            usernames: LinkedIn usernames, at most the backend's max_batch
+
+        Returns:
+            Dictionary mapping each username to its profile response
+        """
+        profiles = {}
+        missing = []
+        for username in usernames:
+            cached = self.profile_cache.get(username)
+            if cached is None:
+                missing.append(username)
+            else:
+                profiles[username] = cached
+        if not missing:
+            return profiles
+
+        try:
+            self.log_message(f"Getting profile details for {len(missing)} users", "DEBUG")
+            fetched = self.call_api(PROFILES_ENDPOINT, self.backend.get_profiles, missing)["data"]["profiles"]
+        except Exception as e:
+            self.log_message(f"Error getting profile details: {str(e)}", "ERROR")
+            fetched = {}
+        for username in missing:
+            response = fetched.get(username) or {"success": False, "message": "missing from bulk response", "data": {}}
+            if response.get("success", False):
+                self.profile_cache.put(username, response)
+            profiles[username] = response
+        return profiles
+
+    @METRICS.timed("stage_seconds", stage="filter")
+    def is_job_relevant(self, job_data):
+        """
+        Check if a job posting meets the criteria.
+
+        Args:
+            job_data: Job posting data
+
+        Returns:
+            Boolean indicating if the job is relevant
+        """
+        if not job_data:
+            return False
+
+        # Check excluded locations and preferred formats (remote/hybrid) in one compiled pass
+        result = self.filter_engine.evaluate(job_data)
+        if not result.relevant:
+            self.log_message(f"Excluding job in location: {job_data.get('location', '').lower()}",
+                             reasons=result.reasons)
+            return False
+
+        for reason in result.reasons:
+            self.log_message(f"Job matches {reason}", "DEBUG")
+
+        # Additional filtering criteria would be implemented here
+        return True
+
+    @METRICS.timed("stage_seconds", stage="serialize")
+    def save_results(self, results):
+        """
+        Save search results to a JSON file.
+
+        Args:
+            results: Search results to save (any iterable, written without loading it into memory)
+        """
+        try:
+            write_json_array(results, self.config["results_file"])
+            self.log_message(f"Results saved to {self.config['results_file']}")
+        except Exception as e:
+            self.log_message(f"Error saving results: {str(e)}", "ERROR")
+
+    def export_results(self, results, run=None):
+        """
+        Append results to the columnar results store for offline analysis.
+
+        Args:
+            results: Result records or dictionaries
+            run: Optional run identifier stored with the rows
+        """
+        if not self.config["results_store_dir"]:
+            return
+        # NumPy is only loaded by runs that export
+        from results_store import ResultsStore
+        try:
+            store = ResultsStore(self.config["results_store_dir"])
+            added = store.append(results, run=run, fetched_at=self.profile_cache.fetched_times,
+                                 filter_engine=self.filter_engine)
+            self.log_message(f"Added {added} rows to {self.config['results_store_dir']} ({len(store)} total)")
+        except Exception as e:
+            self.log_message(f"Error exporting results: {str(e)}", "ERROR")
+
+    def configure_rate_limits(self):
+        """Apply the per-endpoint quota and call policy overrides of CONFIG to the crawler's limiter and policy."""
+        for endpoint, settings in self.config["rate_limits"].items():
+            self.rate_limiter.configure(endpoint, **settings)
+        for endpoint, settings in self.config["call_policies"].items():
+            self.call_policy.configure(endpoint, **settings)
+
+    def plan_search(self, budget=None):
+        """
+        Build the search plan from CONFIG.
+
+        Args:
+            budget: Optional maximum number of API calls
+
+        Returns:
+            Plan dictionary from build_search_plan
+        """
+        return build_search_plan(
+            self.config["positions"],
+            self.config["industries"],
+            self.config["locations"] if self.config["search_by_location"] else None,
+            budget=budget,
+            history=load_query_history(self.config["query_history_file"]),
+            drop_subsumed=self.config["drop_subsumed_locations"]
+        )
+
+    def new_prefilter(self, budget=None):
+        """
+        Build the search hit pre-filter of a run from CONFIG.
+
+        Args:
+            budget: Maximum profile lookups (default CONFIG["profile_call_budget"])
+
+        Returns:
+            SearchPrefilter instance
+        """
+        return SearchPrefilter(
+            self.filter_engine if self.config["prefilter_search_hits"] else None,
+            budget=self.config["profile_call_budget"] if budget is None else budget,
+            min_score=self.config["min_prefilter_score"],
+            is_cached=self.profile_cache.contains
+        )
+
+    def crawl(self, units, log=None, on_unit_complete=None, on_page_complete=None, should_fetch=None,
+              prefilter=None, on_over_budget=None, pagination=None):
+        """
+        Crawl units with this crawler's API functions and settings.
+
+        Args:
+            units: Crawl units from the search plan
+            log: Logging callable (default log_message)
+            on_unit_complete: Optional callable receiving each finished unit and its statistics
+            on_page_complete: Optional callable receiving each page's records
+            should_fetch: Optional callable deciding from a search item whether to fetch its profile
+            prefilter: Optional SearchPrefilter selecting, ordering and budgeting profile lookups
+            on_over_budget: Optional callable receiving search items left unfetched by the budget
+            pagination: Stop rules to use instead of CONFIG["pagination"]
+
+        Returns:
+            Result records (empty when on_page_complete consumes them)
+        """
+        # asyncio is only loaded by commands that crawl
+        from crawl_engine import run_crawl
+
+        select = None
+        if prefilter is not None:
+            select = prefilter.select
+            should_fetch = prefilter.budgeted(should_fetch, on_over_budget)
+        batch_size = self.backend.max_batch
+        return run_crawl(
+            units,
+            self.search_unit,
+            self.get_profile_details,
+            self.is_job_relevant,
+            log=log or self.log_message,
+            max_concurrency=self.config["max_concurrency"],
+            on_unit_complete=on_unit_complete,
+            on_page_complete=on_page_complete,
+            pagination=self.config["pagination"] if pagination is None else pagination,
+            should_fetch=should_fetch,
+            profiles_fn=self.get_profiles if batch_size > 1 else None,
+            profile_batch_size=batch_size,
+            prefilter=select
+        )
+
+    def parse_args(self, argv=None):
+        """Parse command line arguments."""
+        parser = argparse.ArgumentParser(description="LinkedIn job search automation")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="print the search plan without calling the API")
+        parser.add_argument("--resume", action="store_true",
+                            help="continue an interrupted crawl from its checkpoint")
+        parser.add_argument("--budget", type=int, default=self.config["api_call_budget"],
+                            help="maximum number of API calls to plan for")
+        parser.add_argument("--profile-budget", type=int, default=self.config["profile_call_budget"],
+                            help="maximum number of profile lookups in this run")
+        parser.add_argument("--watch", action="store_true",
+                            help="stay resident and re-poll each query on its own schedule")
+        parser.add_argument("--cycles", type=int, default=None,
+                            help="stop watching after this many cycles (default: until interrupted)")
+        parser.add_argument("--profile", nargs="?", const=self.config["profile_file"], default=None,
+                            help="run under cProfile and save the profile to this file")
+        parser.add_argument("--backend", default=None,
+                            help=f"data backend to use instead of {self.config['backend']}")
+        parser.add_argument("--base-url", default=None, help="service URL of the http backend")
+        return parser.parse_args(argv)
+
+    def main(self, argv=None):
+        """Main execution function."""
+        args = self.parse_args(argv)
+        if args.backend or args.base_url:
+            settings = {"base_url": args.base_url} if args.base_url else {}
+            self.backend = create_backend(args.backend or "http", **settings)
+        run = self.watch if args.watch else self.run
+        if not args.profile:
+            return run(args)
+
+        # Profile the whole run to find where its time goes. The API call threads are
+        # restarted inside the block, so they are profiled, and stopped with it.
+        self.call_policy.shutdown()
+        with profiled(args.profile, stop_threads=self.call_policy.shutdown) as profile:
+            run(args)
+        with open(f"{args.profile}.txt", "w") as f:
+            f.write(profile["report"])
+        self.log_message(f"cProfile saved to {args.profile}, top functions in {args.profile}.txt")
+
+    def run(self, args):
+        """Plan, run and save one crawl."""
+        config = self.config
+        self.log_message("Starting LinkedIn job search automation")
+
+        self.configure_rate_limits()
+
+        plan = self.plan_search(args.budget)
+        self.log_message(format_search_plan(plan))
+        if args.dry_run:
+            return
+        units = plan["units"]
+
+        # Stream results to disk and checkpoint every finished page
+        checkpoint = CrawlCheckpoint(config["checkpoint_file"], resume=args.resume)
+        sink = JsonlResultsSink(config["results_stream_file"], resume=args.resume,
+                                truncate_to=checkpoint.results_offset)
+        if args.resume:
+            pending_units = [unit for unit in units if not checkpoint.is_done(unit_key(unit))]
+            self.log_message(f"Resuming crawl: {len(units) - len(pending_units)} queries already complete")
+            units = pending_units
+            for unit in units:
+                unit["resume"] = checkpoint.resume_point(unit_key(unit))
+
+        def record_page(unit, page, records):
+            self.seen_index.mark_relevant(record.username for record in records)
+            offset = sink.write(records)
+            checkpoint.page_done(unit_key(unit), page["page"], page["next_start"], offset,
+                                 (item["username"] for item in page["items"] if item.get("username")))
+
+        # Count the profiles each query contributes that no earlier query found
+        seen_usernames = set()
+        unit_stats = {}
+
+        def record_unit(unit, stats):
+            new_usernames = set(stats["relevant_usernames"]) - seen_usernames
+            seen_usernames.update(new_usernames)
+            unit_stats[unit_key(unit)] = {"new_profiles": len(new_usernames), "calls": stats["calls"]}
+            if not stats["failed"]:
+                checkpoint.unit_done(unit_key(unit))
+
+        self.seen_index.start_run()
+        self.log_message(f"Running {len(units)} searches on the {self.backend.name} backend "
+                         f"with up to {config['max_concurrency']} concurrent calls")
+
+        # Filter and rank search hits before fetching profiles; hits over the budget wait for the next run
+        prefilter = self.new_prefilter(args.profile_budget)
+        self.crawl(units, on_unit_complete=record_unit, on_page_complete=record_page,
+                   should_fetch=self.seen_index.should_fetch, prefilter=prefilter,
+                   on_over_budget=self.seen_index.defer)
+        self.log_message(f"Pre-filter: {json.dumps(prefilter.stats())}")
+
+        # Remember which queries found new profiles to prioritize them next run
+        record_query_yields(config["query_history_file"], unit_stats)
+
+        sink.close()
+        checkpoint.close()
+
+        # Report what changed since the last run; a partial run cannot tell what disappeared
+        delta = self.seen_index.finish_run(complete=not args.resume and not plan["cut"] and not prefilter.exhausted)
+        self.seen_index.close()
+        run_id = self.seen_index.run_id
+        with open(config["delta_report_file"], "w") as f:
+            json.dump(delta, f, indent=2)
+        self.log_message(format_delta_report(delta))
+
+        # Save all results, including those of resumed runs
+        self.log_message(f"Search complete. Found {sink.written} relevant profiles/jobs")
+        self.save_results(iter_jsonl(config["results_stream_file"]))
+        self.export_results(iter_jsonl(config["results_stream_file"]), run=run_id)
+
+        self.log_message(f"Profile cache: {json.dumps(self.profile_cache.stats())}")
+        self.profile_cache.close()
+
+        # Report the final rate-limiter and backend state for quota tuning
+        for endpoint, stats in self.rate_limiter.stats().items():
+            self.log_message(f"Rate limiter {endpoint}: {json.dumps(stats)}")
+        for endpoint, stats in self.call_policy.stats().items():
+            self.log_message(f"Call policy {endpoint}: {json.dumps(stats)}")
+        self.log_message(f"Backend {self.backend.name}: {json.dumps(self.backend.stats())}")
+        self.backend.close()
+
+        # Export latency histograms, call outcomes and stage timings
+        METRICS.write(config["metrics_file"], config["prometheus_file"])
+        for line in METRICS.stage_report():
+            self.log_message(f"Stage {line}")
+        self.log_message(f"Metrics saved to {config['metrics_file']} and {config['prometheus_file']}")
+
+    def watch(self, args):
+        """
+        Keep the crawl resident and re-poll each query on its own schedule.
+
+        Every cycle polls the due queries, best yield per call first, within
+        the hourly quota and the cycle's time budget. Pagination stops at the
+        first page without usernames seen in earlier runs, unchanged profiles
+        are not fetched again, and the backend, caches and seen index stay
+        open between cycles. SIGTERM or Ctrl-C stops the watch after the
+        running query.
+        """
+        config = self.config
+        self.log_message("Starting LinkedIn job search watch")
+        self.configure_rate_limits()
+
+        units = self.plan_search()["units"]
+        schedule = PollSchedule(config["watch_schedule_file"], config["watch"])
+        settings = schedule.settings
+        schedule.fit_to_quota(units)
+        self.log_message(f"Watching {len(units)} queries within {settings['calls_per_hour']} API calls per hour, "
+                         f"polling every {settings['min_interval']}-{settings['max_interval']}s")
+        if args.dry_run:
+            return
+
+        # Usernames of earlier runs do not count as new when deciding to fetch another page
+        known = self.seen_index.usernames()
+        pagination = {**config["pagination"], "known_usernames": known}
+        sink = JsonlResultsSink(config["results_stream_file"], resume=True)
+
+        stop = threading.Event()
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+        except ValueError:
+            pass  # not the main thread
+
+        cycle = 0
+        try:
+            while not stop.is_set() and (args.cycles is None or cycle < args.cycles):
+                cycle += 1
+                started = time.time()
+                schedule.refill(started)
+                due = schedule.due(units, started)
+                if due:
+                    self._watch_cycle(cycle, due, schedule, sink, known, pagination, stop, started)
+                schedule.fit_to_quota(units)
+                schedule.save()
+                METRICS.write(config["metrics_file"], config["prometheus_file"])
+                if args.cycles is not None and cycle >= args.cycles:
+                    break
+                # Sleep until the next cycle, or longer if no query is due before then
+                wake = max(started + settings["cycle_seconds"], schedule.next_due(units) or 0)
+                stop.wait(max(0.0, wake - time.time()))
+        except KeyboardInterrupt:
+            self.log_message("Watch interrupted")
+        finally:
+            sink.close()
+            schedule.save()
+            self.log_message(f"Watch stopped after {cycle} cycles, {sink.written} relevant profiles found")
+            self.save_results(iter_jsonl(config["results_stream_file"]))
+            self.log_message(f"Profile cache: {json.dumps(self.profile_cache.stats())}")
+            self.profile_cache.close()
+            self.seen_index.close()
+            for endpoint, stats in self.rate_limiter.stats().items():
+                self.log_message(f"Rate limiter {endpoint}: {json.dumps(stats)}")
+            self.backend.close()
+            METRICS.write(config["metrics_file"], config["prometheus_file"])
+
+    def _watch_cycle(self, cycle, due, schedule, sink, known, pagination, stop, started):
+        """Poll the due units of one watch cycle and reschedule them."""
+        config = self.config
+        settings = schedule.settings
+        records = []
+        polls = []
+
+        def record_page(unit, page, page_records):
+            self.seen_index.mark_relevant(record.username for record in page_records)
+            records.extend(page_records)
+
+        def record_unit(unit, stats):
+            polls.append((unit, set(stats["relevant_usernames"]), stats["calls"]))
+
+        self.seen_index.start_run()
+        # Profile lookups share the cycle's allowance with one search per due query
+        prefilter = self.new_prefilter(max(0, int(schedule.allowance) - len(due)))
+        polled = 0
+        step = max(1, config["max_concurrency"])
+        for offset in range(0, len(due), step):
+            if stop.is_set() or time.time() - started > settings["cycle_time_budget"]:
+                break
+            chunk = due[offset:offset + step]
+            self.crawl(chunk, on_unit_complete=record_unit, on_page_complete=record_page,
+                       should_fetch=self.seen_index.should_fetch, prefilter=prefilter,
+                       on_over_budget=self.seen_index.defer, pagination=pagination)
+            polled += len(chunk)
+
+        known.update(self.seen_index.observed)
+        delta = self.seen_index.finish_run(complete=False)
+        if delta["new"] or delta["changed"]:
+            with open(config["delta_report_file"], "w") as f:
+                json.dump(delta, f, indent=2)
+            self.log_message(format_delta_report(delta))
+
+        # Only relevant profiles the index reports as new or changed count as yield and are saved;
+        # a profile's status can still turn unchanged after its first observation in the cycle
+        fresh = {entry["username"] for entry in delta["new"] + delta["changed"]}
+        unit_stats = {}
+        for unit, relevant_usernames, calls in polls:
+            new_profiles = len(relevant_usernames & fresh)
+            schedule.record(unit, new_profiles, calls)
+            unit_stats[unit_key(unit)] = {"new_profiles": new_profiles, "calls": calls}
+        record_query_yields(config["query_history_file"], unit_stats)
+        records = [record for record in records if record.username in fresh]
+        if records:
+            sink.write(records)
+            self.export_results(records, run=delta["run"])
+        self.log_message(
+            f"Cycle {cycle}: polled {polled} of {len(due)} due queries in {time.time() - started:.1f}s, "
+            f"{sum(stats['calls'] for stats in unit_stats.values())} calls, "
+            f"{len(delta['new'])} new and {len(delta['changed'])} changed profiles"
+        )
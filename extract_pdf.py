@@ -1,16 +1,202 @@
-import PyPDF2
+#!/usr/bin/env python3
+"""
+PDF Resume Text Extraction
 
-# Open the PDF file
-pdf_file = '/home/ubuntu/upload/Ivan_Dobrovolskyi_VP_PT.pdf'
-pdf_reader = PyPDF2.PdfReader(pdf_file)
+This module extracts text from PDF resumes. Pages are extracted in parallel
+with a process pool and joined once at the end, and the text of every PDF is
+cached by the SHA-256 of its content, so unchanged files are never parsed
+twice. Run it with a list of PDFs or directories to refresh a resume corpus.
+"""
 
-# Extract text from all pages
-text = ""
-for page in pdf_reader.pages:
-    text += page.extract_text()
+import argparse
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Save the extracted text to a file
-with open('/home/ubuntu/resume_analysis/resume_text.txt', 'w', encoding='utf-8') as f:
-    f.write(text)
+# Extraction configuration
+CONFIG = {
+    "inputs": ["Ivan_Dobrovolskyi_VP_PT.pdf"],
+    "output_file": "resume_text.txt",
+    "cache_dir": ".pdf_text_cache",
+    "max_workers": None,  # None: one process per CPU
+    "pages_per_task": 4,  # pages extracted by one worker task
+    "min_pages_for_pool": 8  # smaller documents are extracted in-process
+}
 
-print("PDF extraction completed successfully")
+def file_hash(path):
+    """
+    Hash a file's content.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def collect_pdfs(inputs):
+    """
+    Expand files and directories into a sorted list of PDF paths.
+
+    Args:
+        inputs: PDF files and/or directories containing PDFs
+
+    Returns:
+        List of PDF file paths without duplicates
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item))
+                         if name.lower().endswith(".pdf"))
+        else:
+            paths.append(item)
+    return list(dict.fromkeys(paths))
+
+def count_pages(path):
+    """Return the number of pages of a PDF."""
+    import PyPDF2
+
+    return len(PyPDF2.PdfReader(path).pages)
+
+def extract_page_range(path, start, end):
+    """
+    Extract the text of a range of pages.
+
+    Runs in a worker process, which opens its own reader.
+
+    Args:
+        path: PDF file path
+        start: First page index
+        end: Page index after the last page
+
+    Returns:
+        List of page texts
+    """
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[number].extract_text() for number in range(start, end)]
+
+def cache_path(cache_dir, digest):
+    """Return the cache file holding the text of a PDF with the given hash."""
+    return os.path.join(cache_dir, f"{digest}.txt")
+
+def read_cache(cache_dir, digest):
+    """Return cached text for a content hash, or None."""
+    path = cache_path(cache_dir, digest)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def write_cache(cache_dir, digest, text):
+    """Store extracted text under its content hash, atomically."""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_path(cache_dir, digest)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temporary, path)
+
+def extract_pdfs(paths, cache_dir=None, max_workers=None, pages_per_task=None):
+    """
+    Extract the text of several PDFs, using the cache and a shared process pool.
+
+    Args:
+        paths: PDF file paths
+        cache_dir: Directory of cached texts keyed by content hash
+        max_workers: Worker processes (None: one per CPU)
+        pages_per_task: Pages extracted by one worker task
+
+    Returns:
+        Tuple of ({path: text}, {"cached": n, "extracted": n})
+    """
+    cache_dir = cache_dir or CONFIG["cache_dir"]
+    max_workers = max_workers or CONFIG["max_workers"]
+    pages_per_task = pages_per_task or CONFIG["pages_per_task"]
+
+    texts = {}
+    pending = {}
+    for path in paths:
+        digest = file_hash(path)
+        cached = read_cache(cache_dir, digest)
+        if cached is not None:
+            texts[path] = cached
+        else:
+            pending[path] = digest
+
+    stats = {"cached": len(texts), "extracted": len(pending)}
+    if not pending:
+        return texts, stats
+
+    page_counts = {path: count_pages(path) for path in pending}
+    use_pool = sum(page_counts.values()) >= CONFIG["min_pages_for_pool"]
+
+    pages = {}
+    if use_pool:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            tasks = {}
+            for path, total in page_counts.items():
+                for start in range(0, total, pages_per_task):
+                    end = min(start + pages_per_task, total)
+                    tasks[(path, start)] = executor.submit(extract_page_range, path, start, end)
+            for (path, start), task in sorted(tasks.items()):
+                pages.setdefault(path, []).extend(task.result())
+    else:
+        for path, total in page_counts.items():
+            pages[path] = extract_page_range(path, 0, total)
+
+    for path, digest in pending.items():
+        # One join per document instead of growing a string page by page
+        text = "".join(pages.get(path, []))
+        write_cache(cache_dir, digest, text)
+        texts[path] = text
+    return texts, stats
+
+def output_path(pdf_path, output_dir):
+    """Return the text file written for a PDF in an output directory."""
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(output_dir, f"{name}.txt")
+
+def main(argv=None):
+    """Extract the configured or given PDFs and write their text files."""
+    parser = argparse.ArgumentParser(description="Extract text from PDF resumes")
+    parser.add_argument("inputs", nargs="*", default=CONFIG["inputs"],
+                        help="PDF files or directories")
+    parser.add_argument("--output", default=None,
+                        help=f"text file for a single PDF (default {CONFIG['output_file']})")
+    parser.add_argument("--output-dir", default=None,
+                        help="directory receiving one .txt per PDF")
+    parser.add_argument("--cache-dir", default=CONFIG["cache_dir"])
+    parser.add_argument("--workers", type=int, default=CONFIG["max_workers"])
+    args = parser.parse_args(argv)
+
+    paths = collect_pdfs(args.inputs)
+    if not paths:
+        print("No PDF files found")
+        return {}
+
+    texts, stats = extract_pdfs(paths, args.cache_dir, args.workers)
+
+    if len(paths) == 1 and not args.output_dir:
+        with open(args.output or CONFIG["output_file"], "w", encoding="utf-8") as f:
+            f.write(texts[paths[0]])
+    else:
+        output_dir = args.output_dir or "."
+        os.makedirs(output_dir, exist_ok=True)
+        for path, text in texts.items():
+            with open(output_path(path, output_dir), "w", encoding="utf-8") as f:
+                f.write(text)
+
+    print(f"PDF extraction completed successfully "
+          f"({stats['extracted']} extracted, {stats['cached']} from cache)")
+    return texts
+
+if __name__ == "__main__":
+    main()
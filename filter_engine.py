@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Compiled Profile Filter Engine
+
+This module compiles the filtering criteria of CONFIG once and evaluates
+profiles against them, either one at a time or as a whole batch. Locations
+are resolved through the gazetteer and matched by set membership. Because
+free text such as "Based in Russia" does not resolve, every excluded term,
+with the names and aliases of the places it covers, is also matched as whole
+words in the raw location. Preferred formats are found by one combined
+regular expression scanning the batch in a single pass. Every decision comes
+with the reasons that produced it.
+"""
+
+import re
+from bisect import bisect_right
+from collections import namedtuple
+
+from gazetteer import GAZETTEER, normalize_location
+
+FilterResult = namedtuple("FilterResult", ["relevant", "reasons"])
+
+# Separates the fields of a batch so no match can span two of them
+FIELD_SEPARATOR = "\x00"
+
+def compile_terms(terms):
+    """
+    Compile terms into one alternation that matches any of them as a substring.
+
+    Args:
+        terms: Terms to match (case-insensitive)
+
+    Returns:
+        Tuple of (compiled pattern or None, {lowercase term: original term})
+    """
+    lookup = {}
+    for term in terms:
+        lookup.setdefault(term.lower(), term)
+    if not lookup:
+        return None, lookup
+    # Longest first, so "russian federation" wins over "russia" in reasons
+    alternation = "|".join(re.escape(term) for term in sorted(lookup, key=len, reverse=True))
+    return re.compile(alternation), lookup
+
+def compile_names(names):
+    """
+    Compile place names into one alternation that matches any of them as whole words.
+
+    Words of a name may be separated by spaces or hyphens ("Saint-Petersburg").
+
+    Args:
+        names: Dictionary of normalized name -> term reported for a match
+
+    Returns:
+        Tuple of (compiled pattern or None, {normalized name: term})
+    """
+    if not names:
+        return None, {}
+    words = [r"[\s\-]+".join(map(re.escape, name.split()))
+             for name in sorted(names, key=len, reverse=True)]
+    return re.compile(rf"(?<!\w)(?:{'|'.join(words)})(?!\w)"), dict(names)
+
+def _name(match):
+    """Return the normalized name a compile_names match stands for."""
+    return " ".join(re.split(r"[\s\-]+", match.group(0)))
+
+def _text(value):
+    """Return a lowercase string for a possibly missing profile field."""
+    return value.lower() if isinstance(value, str) else ""
+
+def _field(profile, field):
+    """Return a field of a profile dictionary or records.Profile object."""
+    if not profile:
+        return None
+    if isinstance(profile, dict):
+        return profile.get(field)
+    return getattr(profile, field, None)
+
+class FilterEngine:
+    """Matcher compiled from the location and preferred_formats criteria."""
+
+    def __init__(self, exclude_locations=(), preferred_formats=(), include_locations=(), gazetteer=None):
+        self.gazetteer = gazetteer or GAZETTEER
+        # Gazetteer key -> configured term, and the words that exclude a location the gazetteer cannot resolve
+        self.exclude_keys = {}
+        exclude_names = {}
+        for term in exclude_locations:
+            key = self.gazetteer.term_key(term)
+            if key is not None:
+                self.exclude_keys.setdefault(key, term)
+            for name in [normalize_location(term)] + (self.gazetteer.names(key) if key else []):
+                exclude_names.setdefault(name, term)
+        self.exclude_pattern, self.exclude_terms = compile_names(exclude_names)
+        self.include_keys = {key for key in map(self.gazetteer.term_key, include_locations) if key}
+        self.format_pattern, self.format_terms = compile_terms(preferred_formats)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build an engine from a script CONFIG dictionary.
+
+        Args:
+            config: Configuration with "exclude_locations" and "preferred_formats", and
+                "locations" that results must lie in when "require_location_match" is set
+
+        Returns:
+            FilterEngine instance
+        """
+        include = config.get("locations", ()) if config.get("require_location_match") else ()
+        return cls(config.get("exclude_locations", ()), config.get("preferred_formats", ()), include)
+
+    def evaluate(self, job_data):
+        """
+        Check one profile against the criteria.
+
+        Args:
+            job_data: Profile or job posting data
+
+        Returns:
+            FilterResult with the decision and the reasons behind it
+        """
+        return self.evaluate_batch([job_data])[0]
+
+    def evaluate_batch(self, profiles):
+        """
+        Check a batch of profiles.
+
+        Each location is resolved once (memoized across batches) and checked
+        against the excluded and included places by set membership. For text
+        criteria, the relevant fields of all profiles are joined into one text
+        and each compiled pattern scans it once; match offsets are mapped back
+        to the profile they belong to.
+
+        Args:
+            profiles: Sequence of profile or job posting dictionaries, or records.Profile objects
+
+        Returns:
+            List of FilterResult, one per profile, in input order
+        """
+        profiles = list(profiles)
+        reasons = [[] for _ in profiles]
+        excluded = [False] * len(profiles)
+
+        if self.exclude_keys or self.include_keys:
+            location_keys = self.gazetteer.location_keys
+            for index, profile in enumerate(profiles):
+                location = _field(profile, "location")
+                if not isinstance(location, str) or not location:
+                    continue
+                keys = location_keys(location)
+                matched = keys & self.exclude_keys.keys()
+                if matched:
+                    excluded[index] = True
+                    reasons[index].append(f"excluded location: {self.exclude_keys[min(matched)]}")
+                elif self.include_keys and keys and not keys & self.include_keys:
+                    excluded[index] = True
+                    reasons[index].append(f"outside configured locations: {location}")
+
+        if self.exclude_pattern is not None:
+            owners, starts, text = self._join(profiles, ("location",))
+            for match in self.exclude_pattern.finditer(text):
+                index = owners[bisect_right(starts, match.start()) - 1]
+                term = self.exclude_terms[_name(match)]
+                if not excluded[index]:
+                    excluded[index] = True
+                    reasons[index].append(f"excluded location: {term}")
+
+        if self.format_pattern is not None:
+            owners, starts, text = self._join(profiles, ("headline", "summary"))
+            for match in self.format_pattern.finditer(text):
+                index = owners[bisect_right(starts, match.start()) - 1]
+                reason = f"preferred format: {self.format_terms[match.group(0)]}"
+                if reason not in reasons[index]:
+                    reasons[index].append(reason)
+
+        results = []
+        for index, profile in enumerate(profiles):
+            if not profile:
+                results.append(FilterResult(False, ["no profile data"]))
+            else:
+                results.append(FilterResult(not excluded[index], reasons[index]))
+        return results
+
+    @staticmethod
+    def _join(profiles, fields):
+        """
+        Join the given fields of all profiles into one lowercase text.
+
+        Returns:
+            Tuple of (profile index per field, start offset per field, text)
+        """
+        parts = []
+        owners = []
+        starts = []
+        offset = 0
+        for index, profile in enumerate(profiles):
+            for field in fields:
+                value = _text(_field(profile, field))
+                owners.append(index)
+                starts.append(offset)
+                parts.append(value)
+                offset += len(value) + len(FIELD_SEPARATOR)
+        return owners, starts, FIELD_SEPARATOR.join(parts)
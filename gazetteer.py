@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Location Gazetteer
+
+This module resolves free-text LinkedIn locations ("Greater Lisbon Area",
+"Porto Alegre, Brazil", "Remote, Europe") into structured places: city,
+country, region and a remote flag. Names and aliases are normalized once into
+one lookup table, each distinct location string is resolved once and
+memoized, and location filters become set membership tests on the resolved
+place instead of substring scans, so "Porto Alegre" no longer matches
+"Porto".
+"""
+
+import re
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+Place = namedtuple("Place", ["city", "country", "region", "remote"])
+
+UNKNOWN = Place(None, None, None, False)
+
+# Country -> region (lowercase)
+COUNTRIES = {
+    "portugal": "europe", "spain": "europe", "france": "europe", "germany": "europe",
+    "netherlands": "europe", "belgium": "europe", "luxembourg": "europe", "ireland": "europe",
+    "united kingdom": "europe", "italy": "europe", "switzerland": "europe", "austria": "europe",
+    "poland": "europe", "czech republic": "europe", "slovakia": "europe", "hungary": "europe",
+    "romania": "europe", "bulgaria": "europe", "greece": "europe", "croatia": "europe",
+    "slovenia": "europe", "serbia": "europe", "denmark": "europe", "sweden": "europe",
+    "norway": "europe", "finland": "europe", "estonia": "europe", "latvia": "europe",
+    "lithuania": "europe", "ukraine": "europe", "belarus": "europe", "russia": "europe",
+    "cyprus": "europe", "malta": "europe", "iceland": "europe",
+    "turkey": "middle east", "israel": "middle east", "united arab emirates": "middle east",
+    "saudi arabia": "middle east", "qatar": "middle east",
+    "united states": "north america", "canada": "north america", "mexico": "north america",
+    "brazil": "south america", "argentina": "south america", "chile": "south america",
+    "colombia": "south america", "peru": "south america",
+    "india": "asia", "china": "asia", "japan": "asia", "singapore": "asia", "south korea": "asia",
+    "indonesia": "asia", "vietnam": "asia", "philippines": "asia", "thailand": "asia",
+    "kazakhstan": "asia",
+    "australia": "oceania", "new zealand": "oceania",
+    "south africa": "africa", "nigeria": "africa", "egypt": "africa", "kenya": "africa",
+    "morocco": "africa"
+}
+
+# City -> country (lowercase)
+CITIES = {
+    "porto": "portugal", "lisbon": "portugal", "braga": "portugal", "coimbra": "portugal",
+    "faro": "portugal", "aveiro": "portugal", "funchal": "portugal",
+    "madrid": "spain", "barcelona": "spain", "valencia": "spain", "seville": "spain", "malaga": "spain",
+    "paris": "france", "lyon": "france", "marseille": "france",
+    "berlin": "germany", "munich": "germany", "hamburg": "germany", "frankfurt": "germany",
+    "cologne": "germany",
+    "amsterdam": "netherlands", "rotterdam": "netherlands", "utrecht": "netherlands",
+    "the hague": "netherlands", "brussels": "belgium", "antwerp": "belgium",
+    "dublin": "ireland", "cork": "ireland",
+    "london": "united kingdom", "manchester": "united kingdom", "edinburgh": "united kingdom",
+    "milan": "italy", "rome": "italy", "turin": "italy",
+    "zurich": "switzerland", "geneva": "switzerland", "vienna": "austria",
+    "warsaw": "poland", "krakow": "poland", "prague": "czech republic", "budapest": "hungary",
+    "bucharest": "romania", "sofia": "bulgaria", "athens": "greece",
+    "copenhagen": "denmark", "stockholm": "sweden", "oslo": "norway", "helsinki": "finland",
+    "tallinn": "estonia", "riga": "latvia", "vilnius": "lithuania", "kyiv": "ukraine",
+    "minsk": "belarus", "moscow": "russia", "saint petersburg": "russia", "kazan": "russia",
+    "novosibirsk": "russia", "yekaterinburg": "russia",
+    "istanbul": "turkey", "tel aviv": "israel", "dubai": "united arab emirates",
+    "new york": "united states", "san francisco": "united states", "austin": "united states",
+    "boston": "united states", "toronto": "canada", "vancouver": "canada", "mexico city": "mexico",
+    "sao paulo": "brazil", "rio de janeiro": "brazil", "porto alegre": "brazil",
+    "belo horizonte": "brazil", "buenos aires": "argentina", "santiago": "chile", "bogota": "colombia",
+    "bangalore": "india", "mumbai": "india", "singapore": "singapore", "tokyo": "japan",
+    "almaty": "kazakhstan", "sydney": "australia", "melbourne": "australia",
+    "cape town": "south africa", "lagos": "nigeria", "cairo": "egypt"
+}
+
+REGIONS = ["europe", "middle east", "north america", "south america", "asia", "oceania", "africa"]
+
+# Alternative names (lowercase, without accents) -> canonical name
+ALIASES = {
+    "lisboa": "lisbon", "oporto": "porto", "sevilla": "seville", "munchen": "munich",
+    "koln": "cologne", "den haag": "the hague", "bruxelles": "brussels", "milano": "milan",
+    "roma": "rome", "wien": "vienna", "praha": "prague", "warszawa": "warsaw",
+    "kobenhavn": "copenhagen", "kiev": "kyiv", "st petersburg": "saint petersburg",
+    "st. petersburg": "saint petersburg", "sankt petersburg": "saint petersburg",
+    "nyc": "new york", "sf": "san francisco", "bengaluru": "bangalore",
+    "russian federation": "russia", "uk": "united kingdom", "great britain": "united kingdom",
+    "england": "united kingdom", "scotland": "united kingdom", "the netherlands": "netherlands",
+    "holland": "netherlands", "czechia": "czech republic", "usa": "united states",
+    "us": "united states", "united states of america": "united states", "uae": "united arab emirates",
+    "espana": "spain", "deutschland": "germany", "brasil": "brazil",
+    "eu": "europe", "european union": "europe", "emea": "europe", "latam": "south america"
+}
+
+# Phrases marking a remote location
+REMOTE_TERMS = ("remote", "anywhere", "worldwide", "work from home", "wfh", "distributed")
+
+# Words describing an area around a place, dropped before lookup
+NOISE_WORDS = re.compile(r"\b(greater|area|metropolitan|metro|region|district|city of|hybrid|on-site|onsite)\b")
+
+PART_SEPARATORS = re.compile(r"[,;/|()\[\]]| - ")
+
+def normalize_location(text):
+    """
+    Normalize a location string for lookup.
+
+    Args:
+        text: Free-text location
+
+    Returns:
+        Lowercase text without accents and with single spaces
+    """
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.lower().split())
+
+class Gazetteer:
+    """Lookup table of cities, countries, regions and aliases with memoized resolution."""
+
+    def __init__(self, cities=None, countries=None, regions=None, aliases=None, cache_size=65536):
+        self.countries = dict(COUNTRIES if countries is None else countries)
+        self.cities = dict(CITIES if cities is None else cities)
+        # name -> (kind, canonical name); cities win over same-named countries
+        self.index = {}
+        for region in (REGIONS if regions is None else regions):
+            self.index[region] = ("region", region)
+        for country in self.countries:
+            self.index[country] = ("country", country)
+        for city in self.cities:
+            self.index[city] = ("city", city)
+        for alias, name in (ALIASES if aliases is None else aliases).items():
+            if name in self.index:
+                self.index[normalize_location(alias)] = self.index[name]
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+        self.location_keys = lru_cache(maxsize=cache_size)(self._location_keys)
+
+    def lookup(self, part):
+        """
+        Look up one location part.
+
+        Args:
+            part: Normalized location part
+
+        Returns:
+            Tuple of (kind, canonical name), or None if unknown
+        """
+        entry = self.index.get(part)
+        if entry is None:
+            stripped = " ".join(NOISE_WORDS.sub(" ", part).split())
+            entry = self.index.get(stripped)
+        return entry
+
+    def place(self, kind, name, remote=False):
+        """Return the place of a canonical gazetteer entry."""
+        if kind == "city":
+            country = self.cities[name]
+            return Place(name, country, self.countries.get(country), remote)
+        if kind == "country":
+            return Place(None, name, self.countries.get(name), remote)
+        return Place(None, None, name, remote)
+
+    def _resolve(self, location):
+        """
+        Resolve a free-text location.
+
+        An explicit country overrides the country of a city that does not
+        belong to it ("Porto, Brazil" is a place in Brazil, not Porto).
+
+        Args:
+            location: Free-text location
+
+        Returns:
+            Place tuple; UNKNOWN fields are None when nothing was recognized
+        """
+        text = normalize_location(location)
+        if not text:
+            return UNKNOWN
+        remote = any(term in text for term in REMOTE_TERMS)
+        entry = self.lookup(text)
+        if entry is not None:
+            return self.place(*entry, remote=remote)
+
+        cities, countries, regions = [], [], []
+        for part in PART_SEPARATORS.split(text):
+            part = part.strip()
+            entry = self.lookup(part) if part else None
+            if entry is None:
+                continue
+            kind, name = entry
+            # A city-state after a city is the country part ("Helsinki, Singapore")
+            if kind == "city" and cities and name in self.countries:
+                kind = "country"
+            (cities if kind == "city" else countries if kind == "country" else regions).append(name)
+
+        country = countries[0] if countries else (self.cities[cities[0]] if cities else None)
+        city = next((name for name in cities if self.cities[name] == country), None)
+        region = self.countries.get(country) if country else (regions[0] if regions else None)
+        return Place(city, country, region, remote)
+
+    def keys(self, place):
+        """
+        Return the set-membership keys of a place.
+
+        Args:
+            place: Place tuple
+
+        Returns:
+            Set of ("city" | "country" | "region" | "remote", name) keys
+        """
+        keys = set()
+        if place.city:
+            keys.add(("city", place.city))
+        if place.country:
+            keys.add(("country", place.country))
+        if place.region:
+            keys.add(("region", place.region))
+        if place.remote:
+            keys.add(("remote", "remote"))
+        return keys
+
+    def _location_keys(self, location):
+        """Return the keys of a free-text location as a frozenset (memoized as location_keys)."""
+        return frozenset(self.keys(self.resolve(location)))
+
+    def term_key(self, term):
+        """
+        Return the key a configured location term matches on.
+
+        Args:
+            term: Configured location such as "Porto", "Russia" or "Remote"
+
+        Returns:
+            The most specific key of the term, or None if it is not in the gazetteer
+        """
+        place = self.resolve(term)
+        if place.city:
+            return ("city", place.city)
+        if place.country:
+            return ("country", place.country)
+        if place.region:
+            return ("region", place.region)
+        if place.remote:
+            return ("remote", "remote")
+        return None
+
+    def names(self, key):
+        """
+        List every name and alias of the places a key covers.
+
+        Args:
+            key: Key as returned by term_key
+
+        Returns:
+            Sorted list of normalized names; a country key covers its cities,
+            a region key its countries and their cities
+        """
+        if key == ("remote", "remote"):
+            return sorted(REMOTE_TERMS)
+        return sorted(text for text, entry in self.index.items() if key in self.keys(self.place(*entry)))
+
+    def ancestors(self, location):
+        """
+        List the broader areas that cover a location.
+
+        Args:
+            location: Location name
+
+        Returns:
+            List of covering areas, nearest first (lowercase)
+        """
+        place = self.resolve(location)
+        if place.city:
+            return [area for area in (place.country, place.region) if area]
+        if place.country:
+            return [place.region] if place.region else []
+        return []
+
+# Gazetteer shared by the filter engine and the query planner
+GAZETTEER = Gazetteer()
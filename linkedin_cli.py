@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Job Search Command Line
+
+This module is the single entry point of the job search tools:
+
+    python linkedin_cli.py search [--script public] [--watch] [--dry-run] ...
+    python linkedin_cli.py validate
+    python linkedin_cli.py filter "Porto, Portugal" "Moscow"
+    python linkedin_cli.py extract resume.pdf
+    python linkedin_cli.py rank --top 10
+    python linkedin_cli.py store report --by industry
+    python linkedin_cli.py queue status
+    python linkedin_cli.py startup
+
+Only the standard library is imported up front. Each subcommand imports its
+own modules when it runs, so the data API client, requests, PyPDF2 and NumPy
+are only loaded by the commands that use them. The startup subcommand measures
+what every command costs to import, in the manner of python -X importtime,
+and fails if a lightweight command loads a module it must not.
+"""
+
+import argparse
+import importlib
+import os
+import re
+import subprocess
+import sys
+import time
+
+# Search scripts selectable with --script
+SCRIPTS = {
+    "automation": "linkedin_search_automation",
+    "public": "linkedin_search_public_api"
+}
+
+# Modules each command imports before doing any work
+COMMAND_MODULES = {
+    "search": ["{script}"],
+    "validate": ["linkedin_validation"],
+    "filter": ["filter_engine", "search_criteria"],
+    "extract": ["extract_pdf"],
+    "rank": ["ranking"],
+    "store": ["results_store"],
+    "queue": ["work_queue"]
+}
+
+# Modules that commands must not load; the crawler pulls in every backend and the call machinery
+FORBIDDEN_MODULES = {
+    "filter": ["crawler"],
+    "extract": ["crawler"],
+    "rank": ["crawler"],
+    "store": ["crawler"]
+}
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+def _script_module(argv):
+    """Split a --script option off the arguments and return the script module name."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--script", default="automation")
+    args, rest = parser.parse_known_args(argv)
+    return SCRIPTS.get(args.script, args.script), rest
+
+def search(argv):
+    """Run a search script; --watch keeps it polling."""
+    module, rest = _script_module(argv)
+    return importlib.import_module(module).main(rest)
+
+def validate(argv):
+    """Run the validation script."""
+    return importlib.import_module("linkedin_validation").main(argv)
+
+def check_filter(argv):
+    """Check locations or profiles against the search scripts' filter criteria."""
+    parser = argparse.ArgumentParser(prog="linkedin_cli.py filter",
+                                     description="Check locations against the filter criteria")
+    parser.add_argument("locations", nargs="*", help="free-text locations to check")
+    parser.add_argument("--profile-json", default=None,
+                        help="JSON file with a profile (or a list of profiles) to check instead")
+    args = parser.parse_args(argv)
+
+    import json
+
+    from filter_engine import FilterEngine
+    from search_criteria import FILTER_CONFIG
+
+    engine = FilterEngine.from_config(FILTER_CONFIG)
+    if args.profile_json:
+        with open(args.profile_json, encoding="utf-8") as f:
+            profiles = json.load(f)
+        profiles = profiles if isinstance(profiles, list) else [profiles]
+    else:
+        profiles = [{"location": location} for location in args.locations]
+
+    results = engine.evaluate_batch(profiles)
+    for profile, result in zip(profiles, results):
+        label = profile.get("location") or profile.get("username") or "-"
+        verdict = "relevant" if result.relevant else "filtered"
+        reasons = f" ({'; '.join(result.reasons)})" if result.reasons else ""
+        print(f"{verdict:8s}  {label}{reasons}")
+    return results
+
+def extract(argv):
+    """Extract text from PDF resumes."""
+    return importlib.import_module("extract_pdf").main(argv)
+
+def rank(argv):
+    """Rank collected profiles against the resume."""
+    return importlib.import_module("ranking").main(argv)
+
+def store(argv):
+    """Import into or report over the columnar results store."""
+    return importlib.import_module("results_store").main(argv)
+
+def queue(argv):
+    """Plan, work on or collect a sharded crawl."""
+    return importlib.import_module("work_queue").main(argv)
+
+def measure_import(modules, runs=3):
+    """
+    Measure the import cost of modules in fresh interpreters.
+
+    Args:
+        modules: Module names to import together
+        runs: Interpreter starts to take the fastest of
+
+    Returns:
+        Dictionary with the wall time of the interpreter ("wall_ms"), the
+        import time of the modules ("import_ms"), the modules they load
+        with the highest self time ("heaviest": list of (module, ms)) and
+        every module they load ("loaded")
+    """
+    code = "; ".join(f"import {module}" for module in modules) or "pass"
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=here,
+                                capture_output=True, text=True)
+        wall = (time.perf_counter() - started) * 1000
+        if result.returncode:
+            raise RuntimeError(f"importing {', '.join(modules)} failed:\n{result.stderr[-2000:]}")
+
+        # Entries after the interpreter's own "site" import belong to the measured modules
+        top = {}
+        own = {}
+        after_site = not modules
+        for line in result.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if not match:
+                continue
+            name = match.group(4)
+            if after_site:
+                own[name] = int(match.group(1)) / 1000
+            if not match.group(3):
+                top[name] = int(match.group(2)) / 1000
+                after_site = after_site or name == "site"
+        total = sum(ms for name, ms in top.items() if name in modules)
+        if best is None or wall < best["wall_ms"]:
+            heaviest = sorted(own.items(), key=lambda entry: -entry[1])[:3]
+            best = {"wall_ms": round(wall, 1), "import_ms": round(total, 1),
+                    "heaviest": [(name, round(ms, 1)) for name, ms in heaviest],
+                    "loaded": sorted(own)}
+    return best
+
+def startup(argv):
+    """Report the startup cost of every command and fail if one loads a forbidden module."""
+    parser = argparse.ArgumentParser(prog="linkedin_cli.py startup",
+                                     description="Measure the import time of each command")
+    parser.add_argument("--script", default="automation", help="search script to measure")
+    parser.add_argument("--runs", type=int, default=3, help="interpreter starts per command")
+    args = parser.parse_args(argv)
+    script = SCRIPTS.get(args.script, args.script)
+
+    report = {"python": measure_import([], args.runs)}
+    violations = []
+    print(f"{'command':10s} {'wall ms':>8s} {'import ms':>10s}  slowest modules (self ms)")
+    print(f"{'python':10s} {report['python']['wall_ms']:8.1f} {'-':>10s}  interpreter only")
+    for command, modules in COMMAND_MODULES.items():
+        modules = [module.format(script=script) for module in modules]
+        try:
+            result = measure_import(modules, args.runs)
+        except RuntimeError as e:
+            print(f"{command:10s} {'-':>8s} {'-':>10s}  {str(e).splitlines()[-1]}")
+            continue
+        report[command] = result
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in result["heaviest"])
+        print(f"{command:10s} {result['wall_ms']:8.1f} {result['import_ms']:10.1f}  {heaviest}")
+        forbidden = [module for module in FORBIDDEN_MODULES.get(command, []) if module in result["loaded"]]
+        if forbidden:
+            violations.append(f"{command} imports {', '.join(forbidden)}")
+    if violations:
+        sys.exit(f"startup check failed: {'; '.join(violations)}")
+    return report
+
+# Subcommand -> (help, handler)
+COMMANDS = {
+    "search": ("run the job search; --watch keeps polling, --script public uses the public API script",
+               search),
+    "validate": ("validate API access, the filters and crawl performance against the mock API", validate),
+    "filter": ("check locations or profiles against the filter criteria", check_filter),
+    "extract": ("extract text from PDF resumes", extract),
+    "rank": ("rank collected profiles against the resume", rank),
+    "store": ("import into or report over the columnar results store", store),
+    "queue": ("plan, work on or collect a sharded crawl", queue),
+    "startup": ("measure the import time of each command", startup)
+}
+
+def main(argv=None):
+    """Dispatch to a subcommand."""
+    parser = argparse.ArgumentParser(
+        description="LinkedIn job search tools",
+        epilog="\n".join(f"  {name:10s}{text}" for name, (text, _) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments of the command")
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command][1](args.args)
+
+if __name__ == "__main__":
+    main()
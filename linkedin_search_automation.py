@@ -6,12 +6,8 @@ This script automates the search for job opportunities on LinkedIn based on
 specified criteria and user preferences.
 """
 
-import sys
-import json
-import time
-from datetime import datetime
-sys.path.append('/opt/.manus/.sandbox-runtime')
-from data_api import ApiClient
+from crawler import LinkedInCrawler
+from search_criteria import FILTER_CONFIG
 
 # Configuration
 CONFIG = {
@@ -30,161 +26,69 @@ CONFIG = {
         "Ecommerce",
         "Performance Marketing"
     ],
-    "locations": [
-        "Porto",
-        "Lisbon",
-        "Portugal",
-        "Remote",
-        "Europe"
-    ],
-    "exclude_locations": ["Russia", "Russian Federation"],
+    **FILTER_CONFIG,  # locations, exclude_locations, require_location_match, preferred_formats
     "min_salary": 8200,  # EUR per month
-    "preferred_formats": ["hybrid", "remote"],
     "results_file": "linkedin_job_results.json",
-    "log_file": "linkedin_search_log.txt"
+    "results_stream_file": "linkedin_job_results.jsonl",  # appended as results arrive
+    "results_store_dir": "linkedin_results_store",  # columnar store accumulating results across runs (None = off)
+    "checkpoint_file": "linkedin_crawl_checkpoint.jsonl",
+    "console_log_level": "INFO",  # DEBUG also echoes every API call
+    "log_file": "linkedin_search_log.jsonl",
+    "profile_cache_file": "linkedin_profile_cache.sqlite",
+    "profile_cache_ttl_hours": 24,
+    "profile_cache_max_entries": 50000,
+    "max_concurrency": 8,  # API calls in flight
+    "pagination": {
+        "max_pages": 3,  # search pages per query
+        "stop_on_no_new_usernames": True,
+        "min_page_relevance": None  # e.g. 0.3 to stop once results drift off-topic
+    },
+    "api_call_budget": None,  # maximum API calls per run (None = unlimited)
+    "prefilter_search_hits": True,  # filter and rank search hits before fetching their profiles
+    "profile_call_budget": None,  # maximum profile lookups per run, best hits first (None = unlimited)
+    "min_prefilter_score": 0.0,  # skip hits whose keyword relevance is below this
+    "drop_subsumed_locations": True,  # skip e.g. "Porto" when "Portugal" is also searched
+    "query_history_file": "linkedin_query_history.json",
+    "rate_limits": {},  # per-endpoint overrides, e.g. {"LinkedIn/search_people": {"rate": 2.0}}
+    "metrics_file": "linkedin_metrics.json",
+    "prometheus_file": "linkedin_metrics.prom",
+    "profile_file": "linkedin_search.prof",  # written with --profile
+    "seen_index_file": "linkedin_seen_index.sqlite",
+    "delta_report_file": "linkedin_delta_report.json",
+    "skip_unchanged_profiles": True,  # no profile call for hits unchanged since the last run
+    "watch": {  # --watch: re-poll each query on its own schedule (see poll_schedule.py)
+        "cycle_seconds": 60,
+        "calls_per_hour": 600,  # steady-state API quota of the watch
+        "min_interval": 300,  # high-yield queries are polled at most every 5 minutes
+        "max_interval": 6 * 3600  # stale queries at least every 6 hours
+    },
+    "watch_schedule_file": "linkedin_watch_schedule.json",
+    "backend": "data_api",  # "data_api", "simulated", "synthetic" or "http" (see backends.py)
+    "search_by_location": False  # data_api searches are not location-scoped
 }
 
-def log_message(message):
-    """Log a message with timestamp to the log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(CONFIG["log_file"], "a") as log_file:
-        log_file.write(f"[{timestamp}] {message}\n")
-    print(f"[{timestamp}] {message}")
-
-def search_linkedin_jobs(keywords, start=0):
-    """
-    Search for jobs on LinkedIn using the LinkedIn API.
-    
-    Args:
-        keywords: Search keywords
-        start: Starting position for pagination
-        
-    Returns:
-        Search results from LinkedIn API
-    """
-    client = ApiClient()
-    try:
-        log_message(f"Searching LinkedIn with keywords: {keywords}, start: {start}")
-        results = client.call_api('LinkedIn/search_people', query={
-            'keywords': keywords,
-            'start': str(start)
-        })
-        return results
-    except Exception as e:
-        log_message(f"Error searching LinkedIn: {str(e)}")
-        return {"success": False, "message": str(e), "data": {"items": []}}
-
-def get_profile_details(username):
-    """
-    Get detailed profile information for a LinkedIn user.
-    
-    Args:
-        username: LinkedIn username
-        
-    Returns:
-        Profile details from LinkedIn API
-    """
-    client = ApiClient()
-    try:
-        log_message(f"Getting profile details for: {username}")
-        profile = client.call_api('LinkedIn/get_user_profile_by_username', query={
-            'username': username
-        })
-        return profile
-    except Exception as e:
-        log_message(f"Error getting profile details: {str(e)}")
-        return {"success": False, "message": str(e), "data": {}}
-
-def is_job_relevant(job_data):
-    """
-    Check if a job posting meets the criteria.
-    
-    Args:
-        job_data: Job posting data
-        
-    Returns:
-        Boolean indicating if the job is relevant
-    """
-    # This is a placeholder for actual job filtering logic
-    # In a real implementation, we would parse job details and check against criteria
-    
-    # Example filtering logic (to be expanded with actual API response structure)
-    if not job_data:
-        return False
-        
-    # Check for excluded locations
-    location = job_data.get("location", "").lower()
-    for excluded in CONFIG["exclude_locations"]:
-        if excluded.lower() in location:
-            log_message(f"Excluding job in location: {location}")
-            return False
-    
-    # Additional filtering criteria would be implemented here
-    return True
+# One crawler holds the backend, caches, seen index and log pipeline
+CRAWLER = LinkedInCrawler(CONFIG)
+LOG = CRAWLER.log
+PROFILE_CACHE = CRAWLER.profile_cache
+SEEN_INDEX = CRAWLER.seen_index
 
-def save_results(results):
-    """
-    Save search results to a JSON file.
-    
-    Args:
-        results: Search results to save
-    """
-    try:
-        with open(CONFIG["results_file"], "w") as f:
-            json.dump(results, f, indent=2)
-        log_message(f"Results saved to {CONFIG['results_file']}")
-    except Exception as e:
-        log_message(f"Error saving results: {str(e)}")
+# API functions used by the work queue, the benchmark and the validation script
+log_message = CRAWLER.log_message
+search_linkedin_jobs = CRAWLER.search_linkedin_jobs
+search_unit = CRAWLER.search_unit
+get_profile_details = CRAWLER.get_profile_details
+fetch_profile_details = CRAWLER.fetch_profile_details
+get_profiles = CRAWLER.get_profiles
+is_job_relevant = CRAWLER.is_job_relevant
+save_results = CRAWLER.save_results
+export_results = CRAWLER.export_results
+configure_rate_limits = CRAWLER.configure_rate_limits
+plan_search = CRAWLER.plan_search
 
-def main():
+def main(argv=None):
     """Main execution function."""
-    log_message("Starting LinkedIn job search automation")
-    
-    all_results = []
-    
-    # Search for each position
-    for position in CONFIG["positions"]:
-        log_message(f"Searching for position: {position}")
-        
-        # Combine with industries for better targeting
-        for industry in CONFIG["industries"]:
-            search_query = f"{position} {industry}"
-            log_message(f"Using search query: {search_query}")
-            
-            # Initial search
-            results = search_linkedin_jobs(search_query)
-            
-            if results.get("success", False):
-                items = results.get("data", {}).get("items", [])
-                log_message(f"Found {len(items)} initial results")
-                
-                # Process results
-                for item in items:
-                    username = item.get("username")
-                    if username:
-                        # Get detailed profile
-                        profile = get_profile_details(username)
-                        
-                        # Check if profile meets criteria
-                        if is_job_relevant(profile.get("data", {})):
-                            all_results.append({
-                                "position": position,
-                                "industry": industry,
-                                "profile_data": profile.get("data", {})
-                            })
-                            log_message(f"Added relevant profile: {username}")
-                    
-                    # Pause to avoid rate limiting
-                    time.sleep(1)
-            else:
-                log_message(f"Search failed: {results.get('message', 'Unknown error')}")
-            
-            # Pause between searches
-            time.sleep(2)
-    
-    # Save all results
-    log_message(f"Search complete. Found {len(all_results)} relevant profiles/jobs")
-    save_results(all_results)
+    return CRAWLER.main(argv)
 
 if __name__ == "__main__":
     main()
@@ -4,14 +4,33 @@ LinkedIn Job Search Validation Script
 
 This script validates the LinkedIn job search automation by performing test searches
 and checking the results against specified criteria.
+
+Independent checks run concurrently: API access, profile retrieval, the
+hand-written filter cases, the filter engine fuzz, a property check of
+is_job_relevant on thousands of generated profiles with known places and the
+call policy's handling of permanent errors. Timed smoke tests then crawl the
+local mock API and time the filter, and fail when throughput or latency miss
+the thresholds in CONFIG["smoke"]. They run after the concurrent checks so
+that those do not skew their timings; the crawl uses its own rate limiter and
+call policy. Every check's outcome, timing and figures are saved as JSON.
 """
 
-import sys
+import argparse
 import json
+import os
+import random
+import re
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-sys.path.append('/opt/.manus/.sandbox-runtime')
-from data_api import ApiClient
+from backends import DataApiBackend
+from call_policy import CALL_POLICIES, CallPolicy, CircuitOpenError
+from crawler import LinkedInCrawler
+from filter_engine import FilterEngine
+from gazetteer import ALIASES, CITIES, COUNTRIES, REGIONS, Place, UNKNOWN
+from rate_limiter import RATE_LIMITER, RateLimiter
+from search_criteria import FILTER_CONFIG
 
 # Configuration
 CONFIG = {
@@ -23,26 +42,44 @@ CONFIG = {
         "SaaS",
         "Digital Platforms"
     ],
-    "locations": [
-        "Porto",
-        "Lisbon",
-        "Portugal",
-        "Remote",
-        "Europe"
-    ],
-    "exclude_locations": ["Russia", "Russian Federation"],
+    **FILTER_CONFIG,  # locations, exclude_locations, require_location_match, preferred_formats
     "min_salary": 8200,  # EUR per month
-    "preferred_formats": ["hybrid", "remote"],
+    "profile_cache_file": "linkedin_profile_cache.sqlite",
+    "profile_cache_ttl_hours": 24,
+    "filter_fuzz_cases": 5000,  # generated profiles checked against the filter engine
+    "filter_fuzz_seed": 42,
+    "relevance_fuzz_cases": 5000,  # generated profiles checked through is_job_relevant
+    "validation_workers": 4,  # checks run concurrently
+    "fuzz_log_file": "linkedin_validation_fuzz_log.jsonl",  # exclusions logged by the fuzz checks
+    "smoke": {
+        "max_concurrency": 8,
+        "pagination": {"max_pages": 2},
+        "unthrottled_rate": 10000.0,  # calls/s given to the rate limiter during the smoke crawl
+        "filter_profiles": 20000,  # synthetic profiles timed through the filter engine
+        "log_file": "linkedin_validation_smoke_log.jsonl",
+        "mock": {
+            "latency_ms": 10,
+            "latency_jitter_ms": 5,
+            "results_per_page": 10,
+            "total_results": 20,
+            "profile_pool": 300
+        },
+        # Pass/fail thresholds
+        "min_calls_per_second": 100.0,
+        "max_p95_latency_ms": 100.0,
+        "min_filter_profiles_per_second": 20000.0
+    },
     "validation_results_file": "linkedin_validation_results.json",
-    "log_file": "linkedin_validation_log.txt"
+    "console_log_level": "INFO",  # DEBUG also echoes every API call
+    "log_file": "linkedin_validation_log.jsonl"
 }
 
-def log_message(message):
-    """Log a message with timestamp to the log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(CONFIG["log_file"], "a") as log_file:
-        log_file.write(f"[{timestamp}] {message}\n")
-    print(f"[{timestamp}] {message}")
+# Crawler with two long-lived API clients; profile responses are shared with the crawl scripts
+CRAWLER = LinkedInCrawler(CONFIG, backend=DataApiBackend(pool_size=2))
+LOG = CRAWLER.log
+PROFILE_CACHE = CRAWLER.profile_cache
+
+log_message = CRAWLER.log_message
 
 def test_search_linkedin_jobs(keywords, start=0):
     """
@@ -55,38 +92,19 @@ def test_search_linkedin_jobs(keywords, start=0):
     Returns:
         Search results from LinkedIn API
     """
-    client = ApiClient()
-    try:
-        log_message(f"TEST: Searching LinkedIn with keywords: {keywords}, start: {start}")
-        results = client.call_api('LinkedIn/search_people', query={
-            'keywords': keywords,
-            'start': str(start)
-        })
-        return results
-    except Exception as e:
-        log_message(f"TEST ERROR: Error searching LinkedIn: {str(e)}")
-        return {"success": False, "message": str(e), "data": {"items": []}}
+    return CRAWLER.search_linkedin_jobs(keywords, start=start)
 
 def test_get_profile_details(username):
     """
-    Test getting detailed profile information for a LinkedIn user.
+    Test getting detailed profile information for a LinkedIn user, using the profile cache.
     
     Args:
         username: LinkedIn username
         
     Returns:
-        Profile details from LinkedIn API
+        Profile details from the cache or the LinkedIn API
     """
-    client = ApiClient()
-    try:
-        log_message(f"TEST: Getting profile details for: {username}")
-        profile = client.call_api('LinkedIn/get_user_profile_by_username', query={
-            'username': username
-        })
-        return profile
-    except Exception as e:
-        log_message(f"TEST ERROR: Error getting profile details: {str(e)}")
-        return {"success": False, "message": str(e), "data": {}}
+    return CRAWLER.get_profile_details(username)
 
 def validate_api_access():
     """
@@ -151,6 +169,57 @@ def validate_filtering_logic():
             "location": "Remote, Europe",
             "expected_result": True,
             "reason": "Remote location is allowed"
+        },
+        {
+            "location": "Porto Alegre, Brazil",
+            "expected_result": False,
+            "reason": "Porto Alegre is not Porto"
+        },
+        {
+            "location": "Moscow",
+            "expected_result": False,
+            "reason": "City in an excluded country"
+        },
+        # Free text the gazetteer cannot resolve must still be excluded
+        {
+            "location": "Based in Russia",
+            "expected_result": False,
+            "reason": "Excluded country in free text"
+        },
+        {
+            "location": "Russia-based",
+            "expected_result": False,
+            "reason": "Hyphenated excluded country"
+        },
+        {
+            "location": "Russia Remote",
+            "expected_result": False,
+            "reason": "Remote within an excluded country"
+        },
+        {
+            "location": "Anywhere in Russia",
+            "expected_result": False,
+            "reason": "Anywhere within an excluded country"
+        },
+        {
+            "location": "Russia and CIS",
+            "expected_result": False,
+            "reason": "Excluded country with other areas"
+        },
+        {
+            "location": "russia.",
+            "expected_result": False,
+            "reason": "Excluded country with punctuation"
+        },
+        {
+            "location": "Saint-Petersburg",
+            "expected_result": False,
+            "reason": "Hyphenated city in an excluded country"
+        },
+        {
+            "location": "Russian-speaking team, Lisbon",
+            "expected_result": True,
+            "reason": "Excluded terms match whole words only"
         }
     ]
     
@@ -161,8 +230,7 @@ def validate_filtering_logic():
         mock_job = {"location": test_case["location"]}
         
         # Test the filtering function
-        from linkedin_search_automation import is_job_relevant
-        result = is_job_relevant(mock_job)
+        result = CRAWLER.is_job_relevant(mock_job)
         
         # Check if result matches expected
         if result == test_case["expected_result"]:
@@ -173,6 +241,483 @@ def validate_filtering_logic():
     
     return all_passed
 
+def generate_filter_cases(count, seed):
+    """
+    Generate random profiles mixing allowed, excluded and missing locations and formats.
+    
+    Args:
+        count: Number of profiles to generate
+        seed: Random seed, so failures are reproducible
+        
+    Returns:
+        List of profile dictionaries
+    """
+    rng = random.Random(seed)
+    cities = ["Porto", "Lisbon", "Moscow", "Berlin", "Saint Petersburg", "Madrid", "Kazan"]
+    countries = CONFIG["locations"] + CONFIG["exclude_locations"] + ["Germany", "Spain", "Brazil", ""]
+    words = ["VP", "Growth", "SaaS", "Partnerships", "Revenue", "Lead", "Ecommerce", "Strategy"]
+    formats = CONFIG["preferred_formats"] + ["on-site", "office"]
+    
+    def vary_case(text):
+        return rng.choice([text, text.lower(), text.upper(), text.title()])
+    
+    cases = []
+    for _ in range(count):
+        location = vary_case(f"{rng.choice(cities)}, {rng.choice(countries)}")
+        headline = " ".join(rng.sample(words, 3) + [vary_case(rng.choice(formats))] * rng.randint(0, 1))
+        summary = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        profile = {"location": location, "headline": headline, "summary": summary}
+        # Some profiles lack fields entirely, like sparse API responses
+        if rng.random() < 0.05:
+            profile.pop(rng.choice(["location", "headline", "summary"]))
+        cases.append(profile)
+    return cases
+
+# Country of each generated city
+FUZZ_CITY_COUNTRIES = {"porto": "portugal", "lisbon": "portugal", "moscow": "russia", "berlin": "germany",
+                       "saint petersburg": "russia", "madrid": "spain", "kazan": "russia"}
+
+def reference_filter(profile):
+    """Straightforward "city, country" check of a generated case used as the expected result."""
+    location = (profile.get("location") or "").lower()
+    if not location:
+        return True
+    city, _, country = location.partition(", ")
+    # Naming an excluded country, or a city in one, excludes the profile
+    excluded = ("russia", "russian federation")
+    return FUZZ_CITY_COUNTRIES[city] not in excluded and country not in excluded
+
+def validate_filter_engine_fuzz(count, seed):
+    """
+    Validate the compiled filter engine on generated profiles.
+    
+    Args:
+        count: Number of generated profiles
+        seed: Random seed for the generator
+        
+    Returns:
+        Boolean indicating if every batch decision matches the reference
+    """
+    cases = generate_filter_cases(count, seed)
+    engine = FilterEngine(CONFIG["exclude_locations"], CONFIG["preferred_formats"])
+    
+    start = time.perf_counter()
+    results = engine.evaluate_batch(cases)
+    elapsed = time.perf_counter() - start
+    
+    mismatches = [(case, result) for case, result in zip(cases, results)
+                  if result.relevant != reference_filter(case)]
+    for case, result in mismatches[:5]:
+        log_message(f"Filter Fuzz: FAILED - got {result.relevant} ({result.reasons}) for {case}")
+    
+    if mismatches:
+        log_message(f"Filter Fuzz: FAILED - {len(mismatches)} of {count} generated cases disagree")
+        return False
+    log_message(f"Filter Fuzz: PASSED - {count} generated cases in {elapsed * 1000:.1f} ms")
+    return True
+
+# Location forms of the relevance fuzz; "missing" profiles have no location field
+RELEVANCE_FORMS = ("city", "city_country", "country", "area", "hybrid", "remote_region",
+                   "remote_country", "free_text", "unknown", "missing")
+UNKNOWN_PLACES = ["Atlantis", "Middle-earth", "Gotham", "Shangri-La", "El Dorado"]
+# Free-text wrappings the gazetteer does not parse, as in "Based in Russia"
+FREE_TEXT_FORMS = ["Based in {}", "{}-based", "{} Remote", "Anywhere in {}", "{} and CIS", "{}.",
+                   "Near {}", "{} / Hybrid", "Relocating from {}"]
+
+def generate_relevance_cases(count, seed):
+    """
+    Generate profiles whose location is written from a known place.
+    
+    Locations are cities, "city, country" pairs (sometimes with a country the
+    city is not in), countries, "Greater ... Area" names, hybrid and remote
+    variants, free text around excluded or unknown places, unknown places and
+    missing fields, in varied case and spacing.
+    
+    Args:
+        count: Number of profiles to generate
+        seed: Random seed, so failures are reproducible
+        
+    Returns:
+        List of (form, profile, Place the location was written from) tuples
+    """
+    rng = random.Random(seed)
+    cities = sorted(CITIES)
+    countries = sorted(COUNTRIES)
+    excluded = sorted(excluded_names())
+    words = ["VP", "Growth", "SaaS", "Partnerships", "Revenue", "Remote", "Hybrid", "Russia", "Porto", "Lead"]
+    
+    def vary(text):
+        text = rng.choice([text, text.lower(), text.upper(), text.title()])
+        return rng.choice(["", " "]) + text.replace(" ", rng.choice([" ", "  "])) + rng.choice(["", " "])
+    
+    cases = []
+    for _ in range(count):
+        form = rng.choice(RELEVANCE_FORMS)
+        city = rng.choice(cities)
+        home = CITIES[city]
+        country = home if rng.random() < 0.7 else rng.choice(countries)
+        region = rng.choice(REGIONS)
+        if form == "city":
+            location, place = city, Place(city, home, COUNTRIES[home], False)
+        elif form == "city_country":
+            location = f"{city}, {country}"
+            place = Place(city if country == home else None, country, COUNTRIES[country], False)
+        elif form == "country":
+            # Singapore is a city as well as a country
+            location, place = country, Place(country if country in CITIES else None, country,
+                                             COUNTRIES[country], False)
+        elif form == "area":
+            location, place = f"Greater {city} Area", Place(city, home, COUNTRIES[home], False)
+        elif form == "hybrid":
+            location = f"{city} ({country}) - Hybrid"
+            place = Place(city if country == home else None, country, COUNTRIES[country], False)
+        elif form == "remote_region":
+            location, place = f"Remote, {region}", Place(None, None, region, True)
+        elif form == "remote_country":
+            location, place = f"Remote - {country}", Place(None, country, COUNTRIES[country], True)
+        elif form == "free_text":
+            # Excluded names are checked on the text alone, so their place is left unknown
+            name = rng.choice(excluded if rng.random() < 0.7 else UNKNOWN_PLACES)
+            if rng.random() < 0.3:
+                name = name.replace(" ", "-")
+            location, place = rng.choice(FREE_TEXT_FORMS).format(name), UNKNOWN
+        elif form == "unknown":
+            location, place = rng.choice(UNKNOWN_PLACES), UNKNOWN
+        else:
+            location, place = None, UNKNOWN
+        
+        profile = {"headline": " ".join(rng.sample(words, 3)),
+                   "summary": " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))}
+        if location is not None:
+            profile["location"] = vary(location)
+        cases.append((form, profile, place))
+    return cases
+
+def canonical_name(term):
+    """Return the gazetteer's canonical name of a configured place name."""
+    term = term.strip().lower()
+    return ALIASES.get(term, term)
+
+def excluded_names():
+    """
+    List every written name of the excluded places, straight from the gazetteer tables.
+    
+    An excluded region also rules out its countries, an excluded country its
+    cities; aliases of any of them count too.
+    
+    Returns:
+        Set of lowercase names
+    """
+    excluded = {canonical_name(term) for term in CONFIG["exclude_locations"]}
+    names = {name for name in list(COUNTRIES) + list(CITIES) + REGIONS
+             if excluded & {name, CITIES.get(name), COUNTRIES.get(name), COUNTRIES.get(CITIES.get(name))}}
+    names.update(alias for alias, name in ALIASES.items() if name in names)
+    names.update(term.strip().lower() for term in CONFIG["exclude_locations"])
+    return names
+
+def mentions(text, name):
+    """Check whether a name occurs in a text as a run of whole words, whatever the punctuation between them."""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    name_words = re.findall(r"[a-z0-9]+", name)
+    return any(words[i:i + len(name_words)] == name_words for i in range(len(words) - len(name_words) + 1))
+
+def expected_relevance(place, location, excluded=None):
+    """
+    Decide from a generated case's place and written location whether it should pass the configured filter.
+    
+    Independent of the gazetteer lookup under test: a location naming an
+    excluded place as whole words, or written from a place in one, is ruled
+    out; with require_location_match, a known place must also have its city,
+    country, region or remote flag among the configured locations. Places
+    the generator made up pass.
+    
+    Args:
+        place: Place the case's location was written from
+        location: Location text of the case, or None when missing
+        excluded: Names of the excluded places (default: excluded_names())
+        
+    Returns:
+        Boolean expected from is_job_relevant
+    """
+    excluded = excluded_names() if excluded is None else excluded
+    if location and any(mentions(location, name) for name in excluded):
+        return False
+    values = {value for value in (place.city, place.country, place.region) if value}
+    if values & excluded:
+        return False
+    if CONFIG["require_location_match"] and (values or place.remote):
+        included = {canonical_name(term) for term in CONFIG["locations"]}
+        return bool(values & included) or (place.remote and "remote" in included)
+    return True
+
+def quiet_crawler(rate_limiter=None, call_policy=None, **overrides):
+    """
+    Create a crawler with the validation criteria that logs only warnings to the console.
+    
+    Fuzzing logs thousands of exclusions; they go to their own log file instead.
+    
+    Args:
+        rate_limiter: Rate limiter to use instead of the shared one
+        call_policy: Call policy to use instead of the shared one
+        **overrides: CONFIG entries to replace
+        
+    Returns:
+        LinkedInCrawler instance
+    """
+    config = dict(CONFIG, console_log_level="WARNING", log_file=CONFIG["fuzz_log_file"])
+    config.update(overrides)
+    return LinkedInCrawler(config, backend=CRAWLER.backend, rate_limiter=rate_limiter, call_policy=call_policy)
+
+def validate_relevance_properties(count, seed):
+    """
+    Fuzz is_job_relevant with generated profiles of known places.
+    
+    Checks that every decision matches the place the location was written
+    from (whatever its case, spacing, headline or summary) and that batch
+    evaluation agrees with one-by-one decisions.
+    
+    Args:
+        count: Number of generated profiles
+        seed: Random seed for the generator
+        
+    Returns:
+        Dictionary with "passed", the case counts per form and the mismatches found
+    """
+    cases = generate_relevance_cases(count, seed)
+    excluded = excluded_names()
+    crawler = quiet_crawler()
+    
+    start = time.perf_counter()
+    decisions = [crawler.is_job_relevant(profile) for _, profile, _ in cases]
+    elapsed = time.perf_counter() - start
+    batch = crawler.filter_engine.evaluate_batch([profile for _, profile, _ in cases])
+    
+    mismatches = []
+    batch_mismatches = 0
+    forms = {}
+    for (form, profile, place), decision, result in zip(cases, decisions, batch):
+        forms[form] = forms.get(form, 0) + 1
+        expected = expected_relevance(place, profile.get("location"), excluded)
+        if decision != expected:
+            mismatches.append({"form": form, "location": profile.get("location"),
+                               "expected": expected, "got": decision})
+        if result.relevant != decision:
+            batch_mismatches += 1
+    
+    for mismatch in mismatches[:5]:
+        log_message(f"Relevance Fuzz: FAILED - {mismatch}")
+    passed = not mismatches and not batch_mismatches
+    if passed:
+        log_message(f"Relevance Fuzz: PASSED - {count} generated profiles in {elapsed * 1000:.1f} ms")
+    else:
+        log_message(f"Relevance Fuzz: FAILED - {len(mismatches)} wrong decisions and "
+                    f"{batch_mismatches} batch disagreements in {count} profiles")
+    return {
+        "passed": passed,
+        "cases": count,
+        "seed": seed,
+        "forms": forms,
+        "mismatches": len(mismatches),
+        "batch_mismatches": batch_mismatches,
+        "examples": mismatches[:5],
+        "profiles_per_second": round(count / elapsed, 1) if elapsed else None
+    }
+
+def validate_call_policy():
+    """
+    Check the call policy's handling of permanent errors on a private policy.
+    
+    A permanent error (a missing client library, a malformed call) must fail
+    at once without retries, and one raised by the half-open trial call must
+    not leave the circuit rejecting every later call.
+    
+    Returns:
+        Dictionary with "passed", the failures found and the breaker's final state
+    """
+    endpoint = "validation"
+    policy = CallPolicy({"default": dict(CALL_POLICIES["default"], max_attempts=3, backoff_base=0.01,
+                                         hedge_quantile=None, breaker_failures=1, breaker_reset=0.0)})
+    failures = []
+    
+    attempts = [0]
+    def missing_library():
+        attempts[0] += 1
+        raise ModuleNotFoundError("No module named 'data_api'")
+    try:
+        policy.call(endpoint, missing_library)
+        failures.append("missing library did not raise")
+    except ImportError:
+        if attempts[0] != 1:
+            failures.append(f"missing library tried {attempts[0]} times")
+    
+    # One server error opens the circuit; the next call is the half-open trial
+    policy.call(endpoint, lambda: {"success": False, "message": "503 Service Unavailable"})
+    def malformed():
+        raise ValueError("malformed request")
+    try:
+        policy.call(endpoint, malformed)
+        failures.append("malformed trial did not raise")
+    except CircuitOpenError:
+        failures.append("malformed trial was rejected")
+    except ValueError:
+        pass
+    for number in range(3):
+        try:
+            policy.call(endpoint, lambda: {"success": True, "data": {}})
+        except CircuitOpenError:
+            failures.append(f"call {number + 1} after a failed trial was rejected")
+    
+    breaker = policy.breaker(endpoint).stats()
+    if breaker["state"] != "closed":
+        failures.append(f"circuit left {breaker['state']}")
+    if failures:
+        log_message(f"Call Policy: FAILED - {'; '.join(failures)}")
+    else:
+        log_message("Call Policy: PASSED - permanent errors fail at once and free the half-open trial")
+    return {"passed": not failures, "failures": failures, "breaker": breaker}
+
+def smoke_test_crawl():
+    """
+    Crawl the local mock API with the validation criteria and time it.
+    
+    The crawl gets its own unthrottled rate limiter and call policy, so the
+    shared ones the other checks use are left alone.
+    
+    Returns:
+        Dictionary with "passed", throughput, p95 latency per operation and the thresholds
+    """
+    import mock_linkedin_api
+    from crawl_benchmark import LatencyRecorder, percentile
+    from crawl_engine import run_crawl
+    from query_planner import build_search_units
+    
+    settings = CONFIG["smoke"]
+    concurrency = settings["max_concurrency"]
+    mock = mock_linkedin_api.configure_mock(**settings["mock"])
+    
+    rate_limiter = RateLimiter()
+    for endpoint in (mock_linkedin_api.SEARCH_ENDPOINT, mock_linkedin_api.PROFILE_ENDPOINT):
+        rate_limiter.configure(endpoint, rate=settings["unthrottled_rate"],
+                               max_rate=settings["unthrottled_rate"], burst=concurrency)
+    
+    recorder = LatencyRecorder()
+    records = [0]
+    failed = [0]
+    
+    def count_page(unit, page, page_records):
+        records[0] += len(page_records)
+    
+    def count_unit(unit, stats):
+        failed[0] += stats.get("failed", 0)
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        crawler = quiet_crawler(log_file=settings["log_file"],
+                                profile_cache_file=os.path.join(workdir, "cache.sqlite"),
+                                seen_index_file=os.path.join(workdir, "seen.sqlite"),
+                                rate_limiter=rate_limiter, call_policy=CallPolicy())
+        # Room for hedged calls
+        crawler.backend = DataApiBackend(pool_size=2 * concurrency,
+                                         client_factory=mock_linkedin_api.FakeApiClient)
+        units = build_search_units(CONFIG["test_positions"], CONFIG["test_industries"])
+        start = time.perf_counter()
+        run_crawl(
+            units,
+            recorder.wrap("search", crawler.search_unit),
+            recorder.wrap("profile", crawler.get_profile_details),
+            crawler.is_job_relevant,
+            log=lambda message: None,
+            max_concurrency=concurrency,
+            on_unit_complete=count_unit,
+            on_page_complete=count_page,
+            pagination=settings["pagination"]
+        )
+        elapsed = time.perf_counter() - start
+        crawler.profile_cache.close()
+    
+    api_calls = sum(mock.calls.values())
+    calls_per_second = api_calls / elapsed if elapsed else 0.0
+    p95 = {name: round(percentile(values, 0.95) * 1000, 2) for name, values in recorder.samples.items()}
+    failures = []
+    if not records[0]:
+        failures.append("no relevant records")
+    if failed[0]:
+        failures.append(f"{failed[0]} failed calls")
+    if calls_per_second < settings["min_calls_per_second"]:
+        failures.append(f"{calls_per_second:.1f} calls/s < {settings['min_calls_per_second']}")
+    for name, ms in p95.items():
+        if ms > settings["max_p95_latency_ms"]:
+            failures.append(f"{name} p95 {ms} ms > {settings['max_p95_latency_ms']} ms")
+    
+    if failures:
+        log_message(f"Smoke Crawl: FAILED - {'; '.join(failures)}")
+    else:
+        log_message(f"Smoke Crawl: PASSED - {api_calls} calls at {calls_per_second:.1f} calls/s, p95 {p95}")
+    return {
+        "passed": not failures,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "api_calls": api_calls,
+        "calls_per_second": round(calls_per_second, 1),
+        "records": records[0],
+        "failed": failed[0],
+        "p95_latency_ms": p95,
+        "latency": recorder.summary(),
+        "min_calls_per_second": settings["min_calls_per_second"],
+        "max_p95_latency_ms": settings["max_p95_latency_ms"]
+    }
+
+def smoke_test_filter_throughput():
+    """
+    Time the filter engine on synthetic profiles.
+    
+    Returns:
+        Dictionary with "passed", the measured profiles per second and the threshold
+    """
+    from synthetic_data import SyntheticGenerator
+    
+    settings = CONFIG["smoke"]
+    count = settings["filter_profiles"]
+    generator = SyntheticGenerator(seed=CONFIG["filter_fuzz_seed"])
+    profiles = [generator.profile_data(number) for number in range(count)]
+    
+    start = time.perf_counter()
+    results = CRAWLER.filter_engine.evaluate_batch(profiles)
+    elapsed = time.perf_counter() - start
+    
+    rate = count / elapsed if elapsed else float("inf")
+    passed = rate >= settings["min_filter_profiles_per_second"]
+    log_message(f"Filter Throughput: {'PASSED' if passed else 'FAILED'} - {rate:,.0f} profiles/s "
+                f"(minimum {settings['min_filter_profiles_per_second']:,.0f})")
+    return {
+        "passed": passed,
+        "profiles": count,
+        "relevant": sum(result.relevant for result in results),
+        "seconds": round(elapsed, 4),
+        "profiles_per_second": round(rate, 1),
+        "min_profiles_per_second": settings["min_filter_profiles_per_second"]
+    }
+
+def run_check(name, check):
+    """
+    Run one check and time it.
+    
+    Args:
+        name: Check name used in the results
+        check: Callable returning a boolean or a dictionary with "passed"
+        
+    Returns:
+        Dictionary with "passed", "duration_ms" and the check's own figures
+    """
+    start = time.perf_counter()
+    try:
+        outcome = check()
+        result = dict(outcome) if isinstance(outcome, dict) else {"passed": bool(outcome)}
+    except Exception as e:
+        log_message(f"Error in {name} validation: {str(e)}", "ERROR")
+        result = {"passed": False, "error": str(e)}
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
 def save_validation_results(results):
     """
     Save validation results to a JSON file.
@@ -185,32 +730,56 @@ def save_validation_results(results):
             json.dump(results, f, indent=2)
         log_message(f"Validation results saved to {CONFIG['validation_results_file']}")
     except Exception as e:
-        log_message(f"Error saving validation results: {str(e)}")
+        log_message(f"Error saving validation results: {str(e)}", "ERROR")
 
-def main():
+def main(argv=None):
     """Main validation function."""
+    parser = argparse.ArgumentParser(description="Validate the LinkedIn job search")
+    parser.add_argument("--cases", type=int, default=None,
+                        help="generated profiles per fuzz check (default from CONFIG)")
+    parser.add_argument("--seed", type=int, default=CONFIG["filter_fuzz_seed"],
+                        help="random seed of the generated profiles")
+    parser.add_argument("--skip-smoke", action="store_true",
+                        help="skip the timed smoke tests against the mock API")
+    args = parser.parse_args(argv)
+    
     log_message("Starting LinkedIn job search validation")
+    started = time.perf_counter()
     
     validation_results = {
         "timestamp": datetime.now().isoformat(),
         "tests": {}
     }
     
-    # Validate API access
-    validation_results["tests"]["api_access"] = validate_api_access()
+    # Independent checks, run concurrently
+    checks = {
+        "api_access": validate_api_access,
+        "profile_retrieval": validate_profile_retrieval,
+        "filtering_logic": validate_filtering_logic,
+        "filter_engine_fuzz": lambda: validate_filter_engine_fuzz(
+            args.cases or CONFIG["filter_fuzz_cases"], args.seed),
+        "relevance_properties": lambda: validate_relevance_properties(
+            args.cases or CONFIG["relevance_fuzz_cases"], args.seed),
+        "call_policy": validate_call_policy
+    }
+    with ThreadPoolExecutor(max_workers=CONFIG["validation_workers"]) as pool:
+        futures = {name: pool.submit(run_check, name, check) for name, check in checks.items()}
+    for name, future in futures.items():
+        validation_results["tests"][name] = future.result()
     
-    # Validate profile retrieval
-    validation_results["tests"]["profile_retrieval"] = validate_profile_retrieval()
+    # Record the rate-limiter state alongside the test outcomes
+    validation_results["rate_limiter"] = RATE_LIMITER.stats()
+    validation_results["profile_cache"] = PROFILE_CACHE.stats()
     
-    # Validate filtering logic
-    try:
-        validation_results["tests"]["filtering_logic"] = validate_filtering_logic()
-    except Exception as e:
-        log_message(f"Error validating filtering logic: {str(e)}")
-        validation_results["tests"]["filtering_logic"] = False
+    # Timed smoke tests, one at a time so the timings do not disturb each other
+    if not args.skip_smoke:
+        validation_results["tests"]["smoke_crawl"] = run_check("smoke_crawl", smoke_test_crawl)
+        validation_results["tests"]["smoke_filter_throughput"] = run_check(
+            "smoke_filter_throughput", smoke_test_filter_throughput)
     
     # Overall validation result
-    validation_results["overall_success"] = all(validation_results["tests"].values())
+    validation_results["duration_seconds"] = round(time.perf_counter() - started, 3)
+    validation_results["overall_success"] = all(test["passed"] for test in validation_results["tests"].values())
     
     # Save validation results
     save_validation_results(validation_results)
@@ -218,7 +787,8 @@ def main():
     if validation_results["overall_success"]:
         log_message("Validation SUCCESSFUL - All tests passed")
     else:
-        log_message("Validation FAILED - Some tests did not pass")
+        failed = [name for name, test in validation_results["tests"].items() if not test["passed"]]
+        log_message(f"Validation FAILED - Some tests did not pass: {', '.join(failed)}")
     
     return validation_results["overall_success"]
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Buffered Logging Pipeline
+
+This module replaces per-line open/write/close logging with a queue drained by
+a background writer thread. Callers only enqueue a record; the writer formats
+records in batches, appends them to the log file as JSON lines and echoes the
+ones at or above the console level to stdout.
+"""
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Default pipeline settings
+LOG_DEFAULTS = {
+    "console_level": "INFO",
+    "file_level": "DEBUG",
+    "batch_size": 500,  # records written per flush at most
+    "flush_interval": 0.2  # seconds a record may wait in the queue
+}
+
+class LogPipeline:
+    """Asynchronous, batched writer of structured log records."""
+
+    def __init__(self, path, console_level=None, file_level=None, batch_size=None,
+                 flush_interval=None):
+        self.path = path
+        self.console_level = LEVELS[console_level or LOG_DEFAULTS["console_level"]]
+        self.file_level = LEVELS[file_level or LOG_DEFAULTS["file_level"]]
+        self.min_level = min(self.console_level, self.file_level)
+        self.batch_size = batch_size or LOG_DEFAULTS["batch_size"]
+        self.flush_interval = flush_interval or LOG_DEFAULTS["flush_interval"]
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def set_console_level(self, level):
+        """
+        Change which records are echoed to stdout.
+
+        Args:
+            level: DEBUG, INFO, WARNING or ERROR
+        """
+        self.console_level = LEVELS[level]
+        self.min_level = min(self.console_level, self.file_level)
+
+    def _start(self):
+        """Start the writer thread on first use."""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self.thread.start()
+
+    def log(self, message, level="INFO", **fields):
+        """
+        Enqueue a log record.
+
+        Args:
+            message: Log message
+            level: DEBUG, INFO, WARNING or ERROR
+            **fields: Extra structured fields stored with the record
+        """
+        levelno = LEVELS.get(level, 20)
+        if levelno < self.min_level or self.closed:
+            return
+        if self.thread is None:
+            self._start()
+        self.queue.put((time.time(), level, levelno, message, fields))
+
+    def _run(self):
+        """Drain the queue in batches until a stop marker arrives."""
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            running = True
+            while running:
+                try:
+                    batch = [self.queue.get(timeout=self.flush_interval)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                file_lines = []
+                console_lines = []
+                markers = []
+                for record in batch:
+                    if isinstance(record, threading.Event):
+                        markers.append(record)
+                        continue
+                    if record is None:
+                        running = False
+                        continue
+                    created, level, levelno, message, fields = record
+                    timestamp = datetime.fromtimestamp(created)
+                    if levelno >= self.file_level:
+                        entry = {"timestamp": timestamp.isoformat(timespec="milliseconds"),
+                                 "level": level, "message": message}
+                        entry.update(fields)
+                        file_lines.append(json.dumps(entry, default=str) + "\n")
+                    if levelno >= self.console_level:
+                        console_lines.append(f"[{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
+
+                if file_lines:
+                    log_file.write("".join(file_lines))
+                    log_file.flush()
+                if console_lines:
+                    sys.stdout.write("".join(console_lines))
+                    sys.stdout.flush()
+                for marker in markers:
+                    marker.set()
+
+    def flush(self, timeout=5.0):
+        """Block until every record enqueued so far has been written."""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        marker = threading.Event()
+        self.queue.put(marker)
+        marker.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write all pending records and stop the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout)
+
+_PIPELINES = {}
+_PIPELINES_LOCK = threading.Lock()
+
+def get_log_pipeline(path, **settings):
+    """
+    Return the shared pipeline for a log file, creating it on first use.
+
+    Args:
+        path: Log file path
+        **settings: LogPipeline settings used when the pipeline is created
+
+    Returns:
+        LogPipeline instance
+    """
+    with _PIPELINES_LOCK:
+        if path not in _PIPELINES:
+            _PIPELINES[path] = LogPipeline(path, **settings)
+        return _PIPELINES[path]
+
+@atexit.register
+def close_all():
+    """Flush and stop every pipeline at interpreter exit."""
+    with _PIPELINES_LOCK:
+        pipelines = list(_PIPELINES.values())
+    for pipeline in pipelines:
+        pipeline.close()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Crawl Instrumentation
+
+This module records where a crawl spends its time: per-endpoint API latency
+histograms, call and outcome counters, and wall-clock timings per stage
+(API calls, rate-limit waits, filtering, serialization). At the end of a run
+the registry is written as a JSON summary and as a Prometheus text file, and
+an optional cProfile hook saves a profile of the whole run.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from rate_limiter import is_rate_limit_message
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Metric descriptions written to the Prometheus file
+METRIC_HELP = {
+    "api_call_seconds": "Latency of LinkedIn API calls",
+    "api_calls_total": "LinkedIn API calls by outcome",
+    "api_retries_total": "LinkedIn API calls retried after a transient failure",
+    "api_hedges_total": "Duplicate LinkedIn API calls sent for slow requests",
+    "api_deadline_exceeded_total": "LinkedIn API calls abandoned at their deadline",
+    "api_circuit_open_total": "LinkedIn API calls rejected by an open circuit breaker",
+    "stage_seconds": "Wall-clock time spent per crawl stage"
+}
+
+def label_key(labels):
+    """Return a hashable, ordered key for a label dictionary."""
+    return tuple(sorted(labels.items()))
+
+class Histogram:
+    """Fixed-bucket histogram with running count, sum, min and max."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """Add one observation."""
+        position = 0
+        while position < len(self.buckets) and value > self.buckets[position]:
+            position += 1
+        self.counts[position] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, fraction):
+        """
+        Estimate a quantile by linear interpolation inside its bucket.
+
+        Args:
+            fraction: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None without observations
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for position, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[position - 1] if position else 0.0
+                upper = self.buckets[position] if position < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (rank - seen) / count
+                return min(max(value, self.min), self.max)
+            seen += count
+        return self.max
+
+    def summary(self):
+        """Return count, sum, mean, min, max and p50/p90/p99 as a dictionary."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99)
+        }
+
+class MetricsRegistry:
+    """Thread-safe store of labelled counters and histograms."""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+    def increment(self, name, amount=1, **labels):
+        """
+        Add to a counter.
+
+        Args:
+            name: Metric name
+            amount: Value to add
+            **labels: Label values, e.g. endpoint and outcome
+        """
+        key = (name, label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """
+        Record a value, usually a duration in seconds, in a histogram.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            **labels: Label values
+        """
+        key = (name, label_key(labels))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def quantile(self, name, fraction, min_count=1, **labels):
+        """
+        Estimate a quantile of a histogram.
+
+        Args:
+            name: Metric name
+            fraction: Quantile between 0 and 1
+            min_count: Observations required for an estimate
+            **labels: Label values
+
+        Returns:
+            Estimated value, or None with fewer than min_count observations
+        """
+        with self.lock:
+            histogram = self.histograms.get((name, label_key(labels)))
+            if histogram is None or histogram.count < min_count:
+                return None
+            return histogram.quantile(fraction)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the enclosed block into a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name, **labels):
+        """Decorator timing every call of a function into a histogram."""
+        def decorate(func):
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            wrapper.__wrapped__ = func
+            return wrapper
+        return decorate
+
+    def record_api_call(self, endpoint, seconds, response):
+        """
+        Record the latency and outcome of one API call.
+
+        Args:
+            endpoint: API endpoint name
+            seconds: Call duration
+            response: Response dictionary returned by the API
+        """
+        if response and response.get("success", False):
+            outcome = "success"
+        elif is_rate_limit_message((response or {}).get("message", "")):
+            outcome = "rate_limited"
+        else:
+            outcome = "error"
+        self.observe("api_call_seconds", seconds, endpoint=endpoint)
+        self.increment("api_calls_total", endpoint=endpoint, outcome=outcome)
+
+    def reset(self):
+        """Drop every recorded value."""
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.started = time.time()
+
+    def summary(self):
+        """
+        Return the registry as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with run duration, counters and histogram summaries
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: histogram.summary() for key, histogram in self.histograms.items()}
+        return {
+            "run_seconds": round(time.time() - self.started, 3),
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in sorted(counters.items())],
+            "histograms": [{"name": name, "labels": dict(labels), **values}
+                           for (name, labels), values in sorted(histograms.items())]
+        }
+
+    def to_prometheus(self):
+        """
+        Render the registry in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        def render_labels(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+
+        described = set()
+        for (name, labels), value in counters:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{render_labels(labels)} {value}")
+
+        for (name, labels), histogram in histograms:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{render_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_bucket{render_labels(labels, [('le', '+Inf')])} {histogram.count}")
+            lines.append(f"{name}_sum{render_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{render_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path=None, prometheus_path=None):
+        """
+        Write the JSON summary and/or the Prometheus text file.
+
+        Args:
+            json_path: JSON summary path
+            prometheus_path: Prometheus text file path
+        """
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, indent=2)
+        if prometheus_path:
+            with open(prometheus_path, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+
+    def stage_report(self):
+        """Return one line per stage with its total and mean time, largest first."""
+        with self.lock:
+            stages = [(dict(labels).get("stage", ""), histogram.sum, histogram.count)
+                      for (name, labels), histogram in self.histograms.items()
+                      if name == "stage_seconds"]
+        return [f"{stage}: {total:.3f}s over {count} calls ({total / count * 1000:.2f} ms each)"
+                for stage, total, count in sorted(stages, key=lambda item: -item[1])]
+
+# Registry shared by every instrumented function
+METRICS = MetricsRegistry()
+
+@contextmanager
+def profiled(path=None, top=20, stop_threads=None):
+    """
+    Run the enclosed block under cProfile, including threads started inside it.
+
+    Each worker thread gets its own profiler, so the time the crawl spends in
+    the thread pool is reported next to the main thread's. A thread's profiler
+    can only be turned off by the thread itself, so long-lived pools started in
+    the block must end with it: stop_threads is called before the profiles are
+    read.
+
+    Args:
+        path: File receiving the binary profile for pstats/snakeviz (None: not saved)
+        top: Number of functions in the text report
+        stop_threads: Optional callable ending the threads started in the block
+
+    Yields:
+        Dictionary whose "report" key holds the cumulative-time report once the block exits
+    """
+    # Loaded here, so runs without --profile do not pay for the profiler's imports
+    import cProfile
+    import io
+    import pstats
+
+    profiles = [cProfile.Profile()]
+    profiles_lock = threading.Lock()
+
+    def profile_thread(*args):
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Interpreters whose profiler already covers every thread
+            return
+        with profiles_lock:
+            profiles.append(profile)
+
+    result = {"report": ""}
+    threading.setprofile(profile_thread)
+    profiles[0].enable()
+    try:
+        yield result
+    finally:
+        profiles[0].disable()
+        threading.setprofile(None)
+        if stop_threads is not None:
+            stop_threads()
+        with profiles_lock:
+            stats = pstats.Stats(*profiles, stream=io.StringIO())
+        if path:
+            stats.dump_stats(path)
+        stats.sort_stats("cumulative").print_stats(top)
+        result["report"] = stats.stream.getvalue()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Local Mock LinkedIn API
+
+This module stands in for the LinkedIn data API during development and
+benchmarking. It serves LinkedIn/search_people,
+LinkedIn/get_user_profile_by_username and the bulk
+LinkedIn/get_user_profiles_by_usernames with configurable latency, slow-call
+tail, error rate, rate-limit responses and result volumes, either in-process
+through a fake data_api.ApiClient or over HTTP from a local server. Profiles and search
+results come from the seeded generator in synthetic_data.py.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from synthetic_data import SyntheticGenerator
+
+SEARCH_ENDPOINT = "LinkedIn/search_people"
+PROFILE_ENDPOINT = "LinkedIn/get_user_profile_by_username"
+PROFILES_ENDPOINT = "LinkedIn/get_user_profiles_by_usernames"
+
+# Default mock behaviour
+MOCK_DEFAULTS = {
+    "latency_ms": 50,  # mean response time
+    "latency_jitter_ms": 20,  # uniform +/- jitter around the mean
+    "tail_rate": 0.0,  # share of calls answered after tail_latency_ms instead
+    "tail_latency_ms": 2000,
+    "error_rate": 0.0,  # share of calls failing with a server error
+    "rate_limit_rate": 0.0,  # share of calls answered with a rate-limit response
+    "results_per_page": 10,
+    "total_results": 50,  # search results available per query
+    "profile_pool": 500,  # distinct usernames shared by all queries
+    "shared_pool": 100,  # profiles many queries find
+    "duplicate_rate": 0.2,  # share of search results drawn from the shared pool
+    "excluded_location_rate": 0.1,  # share of profiles located in Russia
+    "seed": 7
+}
+
+class MockLinkedInBackend:
+    """Deterministic LinkedIn API responses with injected latency and faults."""
+
+    def __init__(self, **settings):
+        self.settings = dict(MOCK_DEFAULTS)
+        self.settings.update(settings)
+        self.random = random.Random(self.settings["seed"])
+        self.lock = threading.Lock()
+        self.calls = {SEARCH_ENDPOINT: 0, PROFILE_ENDPOINT: 0, PROFILES_ENDPOINT: 0}
+        self.generator = SyntheticGenerator(
+            seed=self.settings["seed"],
+            population=self.settings["profile_pool"],
+            shared_pool=self.settings["shared_pool"],
+            duplicate_rate=self.settings["duplicate_rate"],
+            excluded_location_rate=self.settings["excluded_location_rate"],
+            results_per_page=self.settings["results_per_page"],
+            total_results=self.settings["total_results"],
+            username_prefix="mock-person"
+        )
+
+    def _roll(self):
+        """Draw a shared random number under the lock."""
+        with self.lock:
+            return self.random.random()
+
+    def _delay(self):
+        """Sleep for the configured latency."""
+        jitter = self.settings["latency_jitter_ms"]
+        delay_ms = self.settings["latency_ms"] + (self._roll() * 2 - 1) * jitter
+        if self._roll() < self.settings["tail_rate"]:
+            delay_ms = self.settings["tail_latency_ms"]
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def handle(self, endpoint, query=None):
+        """
+        Answer one API call.
+
+        Args:
+            endpoint: API endpoint name
+            query: Query parameters
+
+        Returns:
+            Response dictionary shaped like the data API's
+        """
+        query = query or {}
+        with self.lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        self._delay()
+
+        roll = self._roll()
+        if roll < self.settings["rate_limit_rate"]:
+            return {"success": False, "message": "429 Too Many Requests: rate limit exceeded (mock)"}
+        if roll < self.settings["rate_limit_rate"] + self.settings["error_rate"]:
+            return {"success": False, "message": "500 Internal Server Error (mock)"}
+
+        if endpoint == SEARCH_ENDPOINT:
+            return self.generator.search(query.get("keywords", ""), int(query.get("start", 0) or 0))
+        if endpoint == PROFILE_ENDPOINT:
+            return self.generator.profile(query.get("username", ""))
+        if endpoint == PROFILES_ENDPOINT:
+            usernames = query.get("usernames", "")
+            if isinstance(usernames, str):
+                usernames = [username for username in usernames.split(",") if username]
+            return {"success": True, "message": "Mock profile details",
+                    "data": {"profiles": {username: self.generator.profile(username)
+                                          for username in usernames}}}
+        return {"success": False, "message": f"Unknown endpoint: {endpoint}"}
+
+# Backend shared by every FakeApiClient
+_BACKEND = MockLinkedInBackend()
+
+def configure_mock(**settings):
+    """
+    Replace the shared backend with one using the given settings.
+
+    Args:
+        **settings: Overrides of MOCK_DEFAULTS
+
+    Returns:
+        The new MockLinkedInBackend
+    """
+    global _BACKEND
+    _BACKEND = MockLinkedInBackend(**settings)
+    return _BACKEND
+
+class FakeApiClient:
+    """Drop-in replacement for data_api.ApiClient served by the mock backend."""
+
+    def call_api(self, endpoint, query=None):
+        """Answer an API call from the shared mock backend."""
+        return _BACKEND.handle(endpoint, query)
+
+def install_fake_data_api(**settings):
+    """
+    Register a fake data_api module so scripts importing it use the mock.
+
+    Must be called before the scripts are imported.
+
+    Args:
+        **settings: Overrides of MOCK_DEFAULTS
+
+    Returns:
+        The configured MockLinkedInBackend
+    """
+    module = types.ModuleType("data_api")
+    module.ApiClient = FakeApiClient
+    sys.modules["data_api"] = module
+    return configure_mock(**settings)
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """Serves /LinkedIn/<endpoint>?query... as JSON."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        response = _BACKEND.handle(url.path.lstrip("/"), dict(parse_qsl(url.query)))
+        if response.get("success"):
+            status = 200
+        elif "429" in response.get("message", ""):
+            status = 429
+        else:
+            status = 500
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep the server quiet; the clients log their calls."""
+
+def start_server(host="127.0.0.1", port=0):
+    """
+    Start the mock HTTP server in a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+
+    Returns:
+        Tuple of (server, base URL)
+    """
+    server = ThreadingHTTPServer((host, port), MockRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-linkedin-api", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main(argv=None):
+    """Run the mock API server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local mock LinkedIn API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    for name, value in MOCK_DEFAULTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args(argv)
+
+    configure_mock(**{name: getattr(args, name) for name in MOCK_DEFAULTS})
+    server = ThreadingHTTPServer((args.host, args.port), MockRequestHandler)
+    print(f"Mock LinkedIn API listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
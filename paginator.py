@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Search Paginator
+
+This module streams search results page by page. While one page is being
+processed the next one is already fetched in the background, and pagination
+stops early once a page brings no new usernames, the page cap is reached or
+the relevance of the results falls below a threshold.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Default stop rules
+PAGINATION_DEFAULTS = {
+    "max_pages": 3,
+    "stop_on_no_new_usernames": True,
+    "min_page_relevance": None  # e.g. 0.3 to stop once pages drift off-topic
+}
+
+def keyword_relevance(keywords):
+    """
+    Build a scorer rating how well a search item matches the query keywords.
+
+    Args:
+        keywords: Search keywords
+
+    Returns:
+        Callable taking a search item and returning a score between 0 and 1
+    """
+    terms = {term for term in re.findall(r"\w+", keywords.lower()) if len(term) > 2}
+
+    def score(item):
+        if not terms:
+            return 1.0
+        text = f"{item.get('headline', '')} {item.get('summary', '')}".lower()
+        return sum(1 for term in terms if term in text) / len(terms)
+
+    return score
+
+def iter_search_pages(fetch_page, max_pages=None, stop_on_no_new_usernames=None,
+                      min_page_relevance=None, relevance_fn=None, prefetch=True, log=print,
+                      start=0, first_page=1, known_usernames=None):
+    """
+    Stream search result pages with early termination.
+
+    Args:
+        fetch_page: Callable taking a start offset and returning a search response
+        max_pages: Maximum number of pages to fetch
+        stop_on_no_new_usernames: Stop after a page that adds no unseen usernames
+        min_page_relevance: Stop after a page whose mean relevance is below this value
+        relevance_fn: Callable scoring a search item between 0 and 1
+        prefetch: Fetch the next page in the background while the current one is processed
+        log: Logging callable
+        start: Start offset of the first page to fetch
+        first_page: Number of the first page, when resuming a partial crawl
+        known_usernames: Optional container of usernames seen in earlier runs; they do not
+            count as new for stop_on_no_new_usernames
+
+    Yields:
+        Page dictionaries with "page", "start", "next_start", "items" and the raw "response";
+        a failed search is yielded once with its response and ends the stream
+    """
+    if max_pages is None:
+        max_pages = PAGINATION_DEFAULTS["max_pages"]
+    if stop_on_no_new_usernames is None:
+        stop_on_no_new_usernames = PAGINATION_DEFAULTS["stop_on_no_new_usernames"]
+    if min_page_relevance is None:
+        min_page_relevance = PAGINATION_DEFAULTS["min_page_relevance"]
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    seen_usernames = set()
+    try:
+        for page_number in range(first_page, max_pages + 1):
+            response = pending.result() if pending else fetch_page(start)
+            pending = None
+
+            items = response.get("data", {}).get("items", []) if response.get("success", False) else []
+            next_start = start + len(items)
+            page = {"page": page_number, "start": start, "next_start": next_start,
+                    "items": items, "response": response}
+            if not response.get("success", False) or not items:
+                yield page
+                return
+
+            # Decide on the stop rules before spending a call on the next page
+            usernames = {item.get("username") for item in items if item.get("username")}
+            new_usernames = usernames - seen_usernames
+            seen_usernames.update(usernames)
+            if known_usernames is not None:
+                new_usernames = {username for username in new_usernames if username not in known_usernames}
+            total = response.get("data", {}).get("total")
+
+            stop_reason = None
+            if page_number >= max_pages:
+                stop_reason = "page limit reached"
+            elif isinstance(total, int) and next_start >= total:
+                stop_reason = "all results fetched"
+            elif stop_on_no_new_usernames and not new_usernames:
+                stop_reason = "no new usernames"
+            elif min_page_relevance is not None and relevance_fn is not None:
+                relevance = sum(relevance_fn(item) for item in items) / len(items)
+                if relevance < min_page_relevance:
+                    stop_reason = f"relevance {relevance:.2f} below {min_page_relevance}"
+
+            if stop_reason is None and executor is not None:
+                pending = executor.submit(fetch_page, next_start)
+
+            yield page
+
+            if stop_reason is not None:
+                log(f"Stopping pagination after page {page_number}: {stop_reason}")
+                return
+            start = next_start
+    finally:
+        if executor is not None:
+            # Wait for an in-flight prefetch so its call is accounted for
+            executor.shutdown(wait=True)
+
+def iter_search_items(fetch_page, **options):
+    """
+    Stream individual search items across pages.
+
+    Args:
+        fetch_page: Callable taking a start offset and returning a search response
+        **options: Stop rules accepted by iter_search_pages
+
+    Yields:
+        Search result items
+    """
+    for page in iter_search_pages(fetch_page, **options):
+        yield from page["items"]
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Incremental Poll Schedule
+
+This module decides which search queries a long-running watch re-polls and
+when. Every query has its own poll interval: a poll that finds new or changed
+relevant profiles halves it, a poll that finds nothing doubles it, within
+fixed bounds. Each watch cycle polls the due queries with the best yield per
+API call first, as far as a call allowance refilled at the configured hourly
+quota permits, and stretches all intervals when their combined steady-state
+cost would exceed that quota. The schedule is saved after every cycle, so a
+restarted watch continues where the last one stopped.
+"""
+
+import json
+import os
+import time
+
+from query_planner import expected_cost, unit_key
+
+# Default watch settings (times are in seconds)
+WATCH_DEFAULTS = {
+    "cycle_seconds": 60,  # time between the starts of two cycles
+    "cycle_time_budget": 45,  # stop starting new queries after this long in a cycle
+    "calls_per_hour": 600,  # steady-state API quota of the watch
+    "min_interval": 300,  # high-yield queries are polled at most this often
+    "max_interval": 6 * 3600,  # stale queries are polled at least this often
+    "initial_interval": 900,
+    "speedup": 0.5,  # interval multiplier after a poll that found new profiles
+    "slowdown": 2.0  # interval multiplier after a poll that found nothing
+}
+
+class PollSchedule:
+    """Per-query poll intervals and a call allowance refilled at the hourly quota."""
+
+    def __init__(self, path=None, settings=None):
+        self.path = path
+        self.settings = dict(WATCH_DEFAULTS)
+        self.settings.update(settings or {})
+        self.entries = {}
+        self.allowance = 0.0
+        self.refilled_at = None
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def entry(self, unit):
+        """Return the schedule entry of a unit, creating a due one for a new query."""
+        key = unit_key(unit)
+        if key not in self.entries:
+            self.entries[key] = {"interval": self.settings["initial_interval"], "next_due": 0.0,
+                                 "last_polled": None, "polls": 0, "new_profiles": 0, "calls": 0}
+        return self.entries[key]
+
+    def expected_calls(self, unit):
+        """Estimate the API calls one poll of a unit costs."""
+        entry = self.entry(unit)
+        if entry["polls"]:
+            return max(1.0, entry["calls"] / entry["polls"])
+        return unit.get("expected_calls") or expected_cost(None)
+
+    def refill(self, now=None):
+        """
+        Add the calls earned since the last refill, capped at one cycle's quota.
+
+        Returns:
+            Calls the current cycle may spend
+        """
+        now = time.time() if now is None else now
+        per_second = self.settings["calls_per_hour"] / 3600.0
+        cap = per_second * self.settings["cycle_seconds"]
+        if self.refilled_at is None:
+            self.allowance = cap
+        else:
+            self.allowance = min(cap, self.allowance + (now - self.refilled_at) * per_second)
+        self.refilled_at = now
+        return self.allowance
+
+    def due(self, units, now=None):
+        """
+        Select the units to poll in this cycle.
+
+        Due units are ranked by yield per call, taking the long-overdue first
+        among equals, and taken while their expected calls fit the allowance.
+        The first due unit is always taken, so a quota below one poll per
+        cycle still makes progress.
+
+        Args:
+            units: Crawl units of the search plan
+            now: Current time
+
+        Returns:
+            List of units to poll, best first
+        """
+        now = time.time() if now is None else now
+        due = [unit for unit in units if self.entry(unit)["next_due"] <= now]
+
+        def priority(unit):
+            entry = self.entry(unit)
+            if entry["polls"]:
+                rate = entry["new_profiles"] / entry["polls"]
+            else:
+                rate = unit.get("expected_yield", 1.0)
+            return (rate / self.expected_calls(unit), now - entry["next_due"])
+
+        due.sort(key=priority, reverse=True)
+        selected = []
+        spent = 0.0
+        for unit in due:
+            calls = self.expected_calls(unit)
+            if selected and spent + calls > self.allowance:
+                break
+            selected.append(unit)
+            spent += calls
+        return selected
+
+    def record(self, unit, new_profiles, calls, now=None):
+        """
+        Record a finished poll and reschedule its unit.
+
+        Args:
+            unit: Polled crawl unit
+            new_profiles: Relevant profiles that were new or changed
+            calls: API calls the poll made
+            now: Current time
+        """
+        now = time.time() if now is None else now
+        settings = self.settings
+        entry = self.entry(unit)
+        factor = settings["speedup"] if new_profiles else settings["slowdown"]
+        entry["interval"] = min(settings["max_interval"],
+                                max(settings["min_interval"], entry["interval"] * factor))
+        entry["next_due"] = now + entry["interval"]
+        entry["last_polled"] = now
+        entry["polls"] += 1
+        entry["new_profiles"] += new_profiles
+        entry["calls"] += calls
+        self.allowance -= calls
+
+    def steady_calls_per_hour(self, units):
+        """Return the calls per hour the current intervals cost in steady state."""
+        return sum(3600.0 * self.expected_calls(unit) / self.entry(unit)["interval"] for unit in units)
+
+    def fit_to_quota(self, units):
+        """
+        Stretch all intervals proportionally if their steady-state cost exceeds the quota.
+
+        Args:
+            units: Crawl units of the search plan
+
+        Returns:
+            The factor the intervals were multiplied by (1.0 if they already fit)
+        """
+        cost = self.steady_calls_per_hour(units)
+        if cost <= self.settings["calls_per_hour"]:
+            return 1.0
+        factor = cost / self.settings["calls_per_hour"]
+        for unit in units:
+            entry = self.entry(unit)
+            stretched = min(self.settings["max_interval"], entry["interval"] * factor)
+            entry["next_due"] += stretched - entry["interval"]
+            entry["interval"] = stretched
+        return factor
+
+    def next_due(self, units):
+        """Return the earliest time a unit becomes due."""
+        return min((self.entry(unit)["next_due"] for unit in units), default=None)
+
+    def save(self):
+        """Write the schedule to its file."""
+        if not self.path:
+            return
+        with open(self.path, "w") as f:
+            json.dump(self.entries, f, indent=2)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Search Hit Pre-Filter
+
+This module is the cheap first phase of a two-phase crawl. Search items
+already carry location, headline and summary, so every page of hits is run
+through the filter engine and ranked by keyword relevance to its query before
+any profile is fetched. Only the surviving candidates are hydrated, best
+first, and a per-run budget caps how many profile lookups the crawl may make.
+
+The budget counts backend calls only: profiles already in the cache, or
+already fetched for another query of the same run, are free. Ranking is
+within a page, and budget is handed out as pages arrive, so a tight budget
+goes to the pages crawled first. The search plan starts with the queries of
+the highest expected yield, which makes those the pages it favors.
+"""
+
+import threading
+
+from paginator import keyword_relevance
+
+# Default pre-filter settings
+PREFILTER_DEFAULTS = {
+    "format_bonus": 0.5,  # added to the score of hits mentioning a preferred format
+    "min_score": 0.0  # hits scoring below this are not fetched
+}
+
+class SearchPrefilter:
+    """Filters and ranks search hits and enforces the profile lookup budget.
+
+    Without a filter engine, hits are kept in search order and only the budget applies.
+    """
+
+    def __init__(self, filter_engine=None, budget=None, min_score=None, format_bonus=None, is_cached=None):
+        self.filter_engine = filter_engine
+        self.budget = budget
+        self.is_cached = is_cached
+        self.min_score = PREFILTER_DEFAULTS["min_score"] if min_score is None else min_score
+        self.format_bonus = PREFILTER_DEFAULTS["format_bonus"] if format_bonus is None else format_bonus
+        self.scorers = {}
+        self.lock = threading.Lock()
+        self.seen = 0
+        self.rejected = 0
+        self.low_score = 0
+        self.reserved = 0
+        self.cached = 0
+        self.over_budget = 0
+        self.fetched_usernames = set()
+
+    def _scorer(self, query):
+        """Return the memoized keyword scorer of a query."""
+        scorer = self.scorers.get(query)
+        if scorer is None:
+            scorer = self.scorers[query] = keyword_relevance(query)
+        return scorer
+
+    def score(self, query, item, reasons=()):
+        """
+        Rate a search hit.
+
+        Args:
+            query: Search keywords of the unit
+            item: Search result item
+            reasons: Filter reasons of the item
+
+        Returns:
+            Keyword relevance, plus format_bonus if a preferred format matched
+        """
+        score = self._scorer(query)(item)
+        if any(reason.startswith("preferred format") for reason in reasons):
+            score += self.format_bonus
+        return score
+
+    def select(self, unit, items):
+        """
+        Drop hits ruled out by their search fields and order the rest best first.
+
+        Args:
+            unit: Crawl unit the items were found for
+            items: New search items of one page
+
+        Returns:
+            Items worth fetching, highest score first
+        """
+        if self.filter_engine is None:
+            with self.lock:
+                self.seen += len(items)
+            return list(items)
+        scored = []
+        rejected = 0
+        low_score = 0
+        for item, result in zip(items, self.filter_engine.evaluate_batch(items)):
+            if not result.relevant:
+                rejected += 1
+                continue
+            score = self.score(unit["query"], item, result.reasons)
+            if score < self.min_score:
+                low_score += 1
+                continue
+            scored.append((score, item))
+        with self.lock:
+            self.seen += len(items)
+            self.rejected += rejected
+            self.low_score += low_score
+        scored.sort(key=lambda entry: -entry[0])
+        return [item for _, item in scored]
+
+    def reserve(self, username=None):
+        """
+        Take one profile lookup from the budget.
+
+        A username fetched earlier in the run, or found in the cache, costs nothing.
+
+        Args:
+            username: LinkedIn username to be fetched
+
+        Returns:
+            True if the lookup may be made
+        """
+        with self.lock:
+            if username in self.fetched_usernames:
+                return True
+        # Only a limited budget is worth a cache lookup
+        cached = (self.budget is not None and username is not None and self.is_cached is not None
+                  and self.is_cached(username))
+        with self.lock:
+            if cached:
+                self.cached += 1
+                return True
+            if username in self.fetched_usernames:
+                return True
+            if self.budget is not None and self.reserved >= self.budget:
+                self.over_budget += 1
+                return False
+            self.reserved += 1
+            if username is not None:
+                self.fetched_usernames.add(username)
+            return True
+
+    def budgeted(self, should_fetch=None, on_over_budget=None):
+        """
+        Combine a should_fetch hook with the budget.
+
+        Args:
+            should_fetch: Optional callable deciding from a search item whether to fetch its profile
+            on_over_budget: Optional callable receiving items dropped for lack of budget;
+                it is never called for a username fetched earlier in the run
+
+        Returns:
+            should_fetch callable for the crawl engine
+        """
+        def fetch(item):
+            if should_fetch is not None and not should_fetch(item):
+                return False
+            if self.reserve(item.get("username")):
+                return True
+            if on_over_budget is not None:
+                on_over_budget(item)
+            return False
+        return fetch
+
+    @property
+    def exhausted(self):
+        """Whether any hit went unfetched for lack of budget."""
+        with self.lock:
+            return self.over_budget > 0
+
+    def stats(self):
+        """Return pre-filter counts."""
+        with self.lock:
+            return {"hits": self.seen, "rejected": self.rejected, "low_score": self.low_score,
+                    "fetched": self.reserved, "cached": self.cached, "over_budget": self.over_budget,
+                    "budget": self.budget}
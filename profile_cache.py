@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Profile Cache
+
+This module stores profile responses in a SQLite database keyed by username,
+so repeated lookups of the same profile within the TTL never reach the API.
+The cache is bounded in size (least recently used entries are evicted) and
+concurrent lookups of the same username share a single API call.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+# Default cache settings
+CACHE_DEFAULTS = {
+    "ttl_hours": 24,
+    "max_entries": 50000
+}
+
+class ProfileCache:
+    """Persistent, size-bounded profile cache with a time-to-live."""
+
+    def __init__(self, path, ttl_hours=None, max_entries=None):
+        self.path = path
+        ttl_hours = CACHE_DEFAULTS["ttl_hours"] if ttl_hours is None else ttl_hours
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries or CACHE_DEFAULTS["max_entries"]
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connection = None
+
+    def _connect(self):
+        """Open the database on first use."""
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                "username TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS profiles_accessed ON profiles (accessed_at)"
+            )
+            self.connection.commit()
+        return self.connection
+
+    def get(self, username):
+        """
+        Look up a cached profile response.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Cached response dictionary, or None if missing or expired
+        """
+        now = time.time()
+        with self.lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT response, fetched_at FROM profiles WHERE username = ?", (username,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE profiles SET accessed_at = ? WHERE username = ?", (now, username)
+            )
+            connection.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def contains(self, username):
+        """Return True if a username has an unexpired cached profile, without counting a lookup."""
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT fetched_at FROM profiles WHERE username = ?", (username,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl
+
+    def put(self, username, response):
+        """
+        Store a profile response and evict the oldest entries over the size limit.
+
+        Args:
+            username: LinkedIn username
+            response: Profile response dictionary
+        """
+        now = time.time()
+        payload = json.dumps(response)
+        with self.lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO profiles (username, response, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)", (username, payload, now, now)
+            )
+            count = connection.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                connection.execute(
+                    "DELETE FROM profiles WHERE username IN ("
+                    "SELECT username FROM profiles ORDER BY accessed_at LIMIT ?)", (excess,)
+                )
+                self.evictions += excess
+            connection.commit()
+
+    def get_or_fetch(self, username, fetch):
+        """
+        Return a cached profile, fetching and caching it on a miss.
+
+        Concurrent callers asking for the same username wait for the first
+        caller's fetch instead of issuing their own API call.
+
+        Args:
+            username: LinkedIn username
+            fetch: Callable taking the username and returning a profile response
+
+        Returns:
+            Profile response dictionary
+        """
+        cached = self.get(username)
+        if cached is not None:
+            return cached
+
+        with self.lock:
+            pending = self.in_flight.get(username)
+            if pending is None:
+                pending = self.in_flight[username] = {"event": threading.Event(), "response": None}
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            pending["event"].wait()
+            if pending["response"] is not None:
+                with self.lock:
+                    self.misses -= 1
+                    self.hits += 1
+                return pending["response"]
+            return fetch(username)
+
+        try:
+            response = fetch(username)
+            if response.get("success", False):
+                self.put(username, response)
+                pending["response"] = response
+            return response
+        finally:
+            with self.lock:
+                del self.in_flight[username]
+            pending["event"].set()
+
+    def purge_expired(self):
+        """Delete all entries older than the TTL and return how many were removed."""
+        with self.lock:
+            connection = self._connect()
+            cursor = connection.execute(
+                "DELETE FROM profiles WHERE fetched_at < ?", (time.time() - self.ttl,)
+            )
+            connection.commit()
+            return cursor.rowcount
+
+    def fetched_times(self, usernames):
+        """
+        Look up when profiles were fetched.
+
+        Args:
+            usernames: LinkedIn usernames
+
+        Returns:
+            Dictionary of username -> fetch time (epoch seconds) for cached profiles
+        """
+        usernames = list(dict.fromkeys(usernames))
+        times = {}
+        with self.lock:
+            connection = self._connect()
+            # Stay below SQLite's limit on bound parameters
+            for start in range(0, len(usernames), 500):
+                chunk = usernames[start:start + 500]
+                times.update(connection.execute(
+                    f"SELECT username, fetched_at FROM profiles WHERE username IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+        return times
+
+    def stats(self):
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate, size and evictions
+        """
+        with self.lock:
+            size = self._connect().execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "size": size,
+                "evictions": self.evictions
+            }
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Search Query Planner
+
+This module turns the search configuration into an optimized search plan:
+queries whose location is covered by a broader configured location are
+dropped, the remaining queries are ordered by their expected yield of new
+profiles from past runs, and the plan is cut to fit an API-call budget.
+"""
+
+import json
+import os
+
+from gazetteer import GAZETTEER, normalize_location
+
+# Planning defaults
+PLANNER_DEFAULTS = {
+    "expected_results_per_search": 10,  # profile lookups a search usually triggers
+    "unseen_query_yield": None  # None: assume the best yield seen so far
+}
+
+def build_search_units(positions, industries, locations=None):
+    """
+    Expand the configured search criteria into crawl units.
+
+    Args:
+        positions: Positions to search for
+        industries: Industries combined with every position
+        locations: Optional locations combined with every position/industry pair
+
+    Returns:
+        List of units, each holding the search query and the record fields
+    """
+    units = []
+    for position in positions:
+        for industry in industries:
+            query = f"{position} {industry}"
+            if locations is None:
+                units.append({
+                    "query": query,
+                    "fields": {"position": position, "industry": industry}
+                })
+                continue
+            for location in locations:
+                units.append({
+                    "query": query,
+                    "location": location,
+                    "fields": {"position": position, "industry": industry, "location": location}
+                })
+    return units
+
+def location_ancestors(location):
+    """
+    List the broader areas that cover a location.
+
+    Args:
+        location: Location name
+
+    Returns:
+        List of covering areas, nearest first (lowercase)
+    """
+    return GAZETTEER.ancestors(location)
+
+def drop_subsumed_locations(locations):
+    """
+    Split locations into those worth searching and those covered by another one.
+
+    Args:
+        locations: Configured locations
+
+    Returns:
+        Tuple of (kept locations, {dropped location: covering location})
+    """
+    # Key configured areas by canonical name, so "UK" covers a location in "united kingdom"
+    configured = {}
+    for location in locations:
+        key = GAZETTEER.term_key(location)
+        configured[key[1] if key else normalize_location(location)] = location
+    kept = []
+    dropped = {}
+    for location in locations:
+        covering = [configured[area] for area in location_ancestors(location) if area in configured]
+        if covering:
+            # Report the broadest configured area that covers it
+            dropped[location] = covering[-1]
+        else:
+            kept.append(location)
+    return kept, dropped
+
+def unit_key(unit):
+    """Return the stable history key of a crawl unit."""
+    return " | ".join(unit["fields"].values())
+
+def load_query_history(path):
+    """
+    Load per-query yield statistics from previous runs.
+
+    Args:
+        path: History file path
+
+    Returns:
+        Dictionary mapping query keys to their statistics
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def record_query_yields(path, unit_stats):
+    """
+    Merge the yields of a finished run into the history file.
+
+    Args:
+        path: History file path
+        unit_stats: Dictionary mapping query keys to {"new_profiles", "calls"}
+    """
+    history = load_query_history(path)
+    for key, stats in unit_stats.items():
+        entry = history.setdefault(key, {"runs": 0, "new_profiles": 0, "calls": 0})
+        entry["runs"] += 1
+        entry["new_profiles"] += stats.get("new_profiles", 0)
+        entry["calls"] += stats.get("calls", 0)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+def expected_cost(entry):
+    """Estimate the API calls one run of a query costs."""
+    if entry and entry.get("runs"):
+        return max(1.0, entry["calls"] / entry["runs"])
+    return 1.0 + PLANNER_DEFAULTS["expected_results_per_search"]
+
+def expected_yield(entry, unseen_yield):
+    """Estimate the new profiles one run of a query finds."""
+    if entry and entry.get("runs"):
+        return entry["new_profiles"] / entry["runs"]
+    return unseen_yield
+
+def build_search_plan(positions, industries, locations=None, budget=None, history=None,
+                      drop_subsumed=True):
+    """
+    Build an optimized search plan.
+
+    Args:
+        positions: Positions to search for
+        industries: Industries combined with every position
+        locations: Optional locations combined with every position/industry pair
+        budget: Optional maximum number of API calls the plan may spend
+        history: Query history loaded with load_query_history
+        drop_subsumed: Drop locations covered by a broader configured location
+
+    Returns:
+        Plan dictionary with the ordered units, dropped locations, cut units
+        and the estimated number of API calls
+    """
+    history = history or {}
+    dropped = {}
+    if locations is not None and drop_subsumed:
+        locations, dropped = drop_subsumed_locations(locations)
+
+    units = build_search_units(positions, industries, locations)
+
+    unseen_yield = PLANNER_DEFAULTS["unseen_query_yield"]
+    if unseen_yield is None:
+        # Explore queries without history before ones known to yield little
+        known = [expected_yield(entry, 0.0) for entry in history.values() if entry.get("runs")]
+        unseen_yield = max(known) if known else 1.0
+
+    for unit in units:
+        entry = history.get(unit_key(unit))
+        unit["expected_yield"] = expected_yield(entry, unseen_yield)
+        unit["expected_calls"] = expected_cost(entry)
+
+    # Highest yield per API call first; the sort is stable so ties keep config order
+    units.sort(key=lambda unit: unit["expected_yield"] / unit["expected_calls"], reverse=True)
+
+    planned = []
+    cut = []
+    spent = 0.0
+    for unit in units:
+        if budget is not None and spent + unit["expected_calls"] > budget:
+            cut.append(unit)
+            continue
+        planned.append(unit)
+        spent += unit["expected_calls"]
+
+    return {
+        "units": planned,
+        "dropped_locations": dropped,
+        "cut": cut,
+        "estimated_calls": round(spent, 1),
+        "budget": budget
+    }
+
+def format_search_plan(plan):
+    """
+    Render a search plan as text for a dry run.
+
+    Args:
+        plan: Plan built by build_search_plan
+
+    Returns:
+        Multi-line plan description
+    """
+    lines = [f"Search plan: {len(plan['units'])} queries, ~{plan['estimated_calls']} API calls"
+             + (f" (budget {plan['budget']})" if plan["budget"] is not None else "")]
+    for location, covering in plan["dropped_locations"].items():
+        lines.append(f"  dropped location {location}: covered by {covering}")
+    for number, unit in enumerate(plan["units"], 1):
+        lines.append(f"  {number:3d}. {unit_key(unit)}"
+                     f"  (expected new profiles {unit['expected_yield']:.1f},"
+                     f" ~{unit['expected_calls']:.0f} calls)")
+    if plan["cut"]:
+        lines.append(f"  {len(plan['cut'])} queries cut to fit the budget:")
+        for unit in plan["cut"]:
+            lines.append(f"       {unit_key(unit)}")
+    return "\n".join(lines)
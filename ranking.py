@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Resume-to-Profile Relevance Ranking
+
+This module ranks collected LinkedIn profiles against the candidate's resume.
+Profiles and the resume are turned into hashed TF-IDF vectors and scored with
+batched NumPy cosine similarity. The vectors are kept in a persistent sparse
+index, so new profiles from later crawls are added incrementally.
+"""
+
+import argparse
+import json
+import os
+import re
+import zlib
+
+import numpy as np
+
+from records import ResultRecord
+from results_sink import iter_jsonl
+
+# Ranking configuration
+CONFIG = {
+    "results_file": "linkedin_job_results.json",
+    "resume_file": "resume_text.txt",
+    "index_file": "linkedin_rank_index.npz",
+    "top_k": 20,
+    "dimensions": 2 ** 18  # hashed feature space
+}
+
+STOPWORDS = {
+    "and", "the", "for", "with", "from", "that", "this", "are", "was", "were", "our",
+    "you", "your", "have", "has", "had", "into", "over", "such", "all", "any", "per",
+    "its", "but", "not", "who", "their", "them", "they", "will", "more", "than", "a",
+    "an", "of", "to", "in", "on", "at", "by", "as", "or", "is", "be", "it"
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+def tokenize(text):
+    """
+    Split text into lowercase terms without stopwords.
+
+    Args:
+        text: Free text
+
+    Returns:
+        List of terms
+    """
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+def profile_text(profile):
+    """
+    Collect the rankable text of a profile.
+
+    Args:
+        profile: records.Profile
+
+    Returns:
+        Headline, summary, experience and skills joined into one string
+    """
+    parts = [profile.headline, profile.summary]
+    for position in profile.experience:
+        parts += [position.title, position.company, position.description]
+    parts.extend(profile.skills)
+    return " ".join(parts)
+
+def profile_key(record):
+    """
+    Return a stable identifier for a result record.
+
+    Args:
+        record: ResultRecord
+
+    Returns:
+        Username when known, otherwise a name/headline based key
+    """
+    if record.username:
+        return record.username
+    profile = record.profile
+    return profile.username or "|".join((profile.first_name, profile.last_name, profile.headline))
+
+def load_records(path):
+    """
+    Load result records from a JSON array or JSON Lines file.
+
+    Args:
+        path: Results file path
+
+    Returns:
+        List of ResultRecord objects
+    """
+    if path.endswith(".jsonl"):
+        return [ResultRecord.from_dict(record) for record in iter_jsonl(path)]
+    with open(path, encoding="utf-8") as f:
+        return [ResultRecord.from_dict(record) for record in json.load(f)]
+
+class RankingIndex:
+    """Persistent sparse TF-IDF index over hashed terms."""
+
+    def __init__(self, dimensions=None):
+        self.dimensions = dimensions or CONFIG["dimensions"]
+        self.ids = []
+        self.positions = {}
+        self.fingerprints = []
+        self.deleted = np.zeros(0, dtype=bool)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float32)
+        self.document_frequency = np.zeros(self.dimensions, dtype=np.int32)
+        self.pending = []
+
+    def _vectorize(self, text):
+        """Return the hashed feature indices and sublinear term weights of a text."""
+        counts = {}
+        for token in tokenize(text):
+            feature = zlib.crc32(token.encode("utf-8")) % self.dimensions
+            counts[feature] = counts.get(feature, 0) + 1
+        if not counts:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+        indices = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        weights = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        return indices, weights
+
+    def add(self, doc_id, text):
+        """
+        Add or update a document.
+
+        Args:
+            doc_id: Unique document identifier
+            text: Document text
+
+        Returns:
+            True if the index changed, False if the document was already indexed unchanged
+        """
+        fingerprint = zlib.crc32(text.encode("utf-8"))
+        position = self.positions.get(doc_id)
+        if position is not None:
+            if self.fingerprints[position] == fingerprint:
+                return False
+            self._delete(position)
+
+        indices, weights = self._vectorize(text)
+        self.positions[doc_id] = len(self.ids)
+        self.ids.append(doc_id)
+        self.fingerprints.append(fingerprint)
+        self.pending.append((indices, weights))
+        np.add.at(self.document_frequency, indices, 1)
+        return True
+
+    def _delete(self, position):
+        """Mark a document as deleted and remove it from the document frequencies."""
+        self._consolidate()
+        start, end = self.indptr[position], self.indptr[position + 1]
+        np.subtract.at(self.document_frequency, self.indices[start:end], 1)
+        self.deleted[position] = True
+
+    def _consolidate(self):
+        """Append pending documents to the sparse arrays."""
+        if not self.pending:
+            return
+        lengths = np.array([len(indices) for indices, _ in self.pending], dtype=np.int64)
+        self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(lengths)])
+        self.indices = np.concatenate([self.indices] + [indices for indices, _ in self.pending])
+        self.weights = np.concatenate([self.weights] + [weights for _, weights in self.pending])
+        self.deleted = np.concatenate([self.deleted, np.zeros(len(self.pending), dtype=bool)])
+        self.pending = []
+
+    def __len__(self):
+        return len(self.ids) - int(self.deleted.sum())
+
+    def search(self, text, top_k=None):
+        """
+        Score every indexed document against a query text.
+
+        Args:
+            text: Query text, e.g. the resume
+            top_k: Number of results to return
+
+        Returns:
+            List of (doc_id, score) tuples, best first
+        """
+        self._consolidate()
+        top_k = top_k or CONFIG["top_k"]
+        count = len(self.ids)
+        if not count:
+            return []
+
+        live = count - int(self.deleted.sum())
+        idf = np.log((1.0 + live) / (1.0 + self.document_frequency)) + 1.0
+
+        rows = np.repeat(np.arange(count), np.diff(self.indptr))
+        weighted = self.weights * idf[self.indices]
+        norms = np.sqrt(np.bincount(rows, weights=weighted * weighted, minlength=count))
+
+        query_indices, query_weights = self._vectorize(text)
+        query = np.zeros(self.dimensions, dtype=np.float64)
+        query[query_indices] = query_weights * idf[query_indices]
+        query_norm = np.linalg.norm(query)
+        if not query_norm:
+            return []
+
+        dots = np.bincount(rows, weights=weighted * query[self.indices], minlength=count)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, dots / (norms * query_norm), 0.0)
+        scores[self.deleted] = -np.inf
+
+        top_k = min(top_k, live)
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.ids[position], float(scores[position])) for position in best]
+
+    def save(self, path):
+        """
+        Write the index to an .npz file.
+
+        Args:
+            path: Index file path
+        """
+        self._consolidate()
+        np.savez_compressed(
+            path,
+            dimensions=np.array([self.dimensions]),
+            ids=np.array(self.ids, dtype=str),
+            fingerprints=np.array(self.fingerprints, dtype=np.uint32),
+            deleted=self.deleted,
+            indptr=self.indptr,
+            indices=self.indices,
+            weights=self.weights,
+            document_frequency=self.document_frequency
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index written by save(), or return an empty index if it does not exist.
+
+        Args:
+            path: Index file path
+
+        Returns:
+            RankingIndex instance
+        """
+        if not os.path.exists(path):
+            return cls()
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(int(data["dimensions"][0]))
+            index.ids = data["ids"].tolist()
+            index.fingerprints = data["fingerprints"].tolist()
+            index.deleted = data["deleted"]
+            index.indptr = data["indptr"]
+            index.indices = data["indices"]
+            index.weights = data["weights"]
+            index.document_frequency = data["document_frequency"]
+        index.positions = {doc_id: position for position, doc_id in enumerate(index.ids)
+                           if not index.deleted[position]}
+        return index
+
+def rank_profiles(resume_text, records, index=None, top_k=None):
+    """
+    Rank result records against a resume.
+
+    Args:
+        resume_text: Resume text
+        records: ResultRecord objects
+        index: Optional existing RankingIndex to update
+        top_k: Number of results to return
+
+    Returns:
+        Tuple of (list of (record, score) tuples best first, updated index)
+    """
+    index = index or RankingIndex()
+    by_key = {}
+    for record in records:
+        key = profile_key(record)
+        by_key[key] = record
+        index.add(key, profile_text(record.profile))
+    ranked = [(by_key[key], score) for key, score in index.search(resume_text, len(index))
+              if key in by_key]
+    return ranked[:top_k or CONFIG["top_k"]], index
+
+def main(argv=None):
+    """Rank the collected profiles against the resume and print the top matches."""
+    parser = argparse.ArgumentParser(description="Rank LinkedIn profiles against a resume")
+    parser.add_argument("--results", default=CONFIG["results_file"],
+                        help="results file (.json or .jsonl)")
+    parser.add_argument("--resume", default=CONFIG["resume_file"], help="resume text file")
+    parser.add_argument("--index", default=CONFIG["index_file"], help="persistent index file")
+    parser.add_argument("--top", type=int, default=CONFIG["top_k"], help="number of results")
+    args = parser.parse_args(argv)
+
+    with open(args.resume, encoding="utf-8") as f:
+        resume_text = f.read()
+
+    index = RankingIndex.load(args.index)
+    ranked, index = rank_profiles(resume_text, load_records(args.results), index, args.top)
+    index.save(args.index)
+
+    for number, (record, score) in enumerate(ranked, 1):
+        profile = record.profile
+        print(f"{number:3d}. {score:.3f}  {profile.full_name or profile_key(record)} - {profile.headline}")
+    return ranked
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+LinkedIn API Rate Limiter
+
+This module provides one shared, thread-safe rate limiter for all LinkedIn API
+callers. Every endpoint has its own token bucket whose refill rate adapts to
+API responses: it grows additively while calls succeed and is cut
+multiplicatively when errors or rate-limit responses come back.
+"""
+
+import threading
+import time
+
+SEARCH_ENDPOINT = "LinkedIn/search_people"
+PROFILE_ENDPOINT = "LinkedIn/get_user_profile_by_username"
+PROFILES_ENDPOINT = "LinkedIn/get_user_profiles_by_usernames"  # bulk lookup, where supported
+
+# Per-endpoint budgets (rates are in calls per second)
+RATE_LIMITS = {
+    "default": {
+        "rate": 2.0,
+        "min_rate": 0.2,
+        "max_rate": 10.0,
+        "burst": 4,
+        "increase_step": 0.05,  # added to the rate after each success
+        "error_backoff": 0.7,  # rate multiplier after an error
+        "rate_limit_backoff": 0.5  # rate multiplier after a rate-limit response
+    },
+    SEARCH_ENDPOINT: {
+        "rate": 1.0,
+        "max_rate": 5.0,
+        "burst": 2
+    },
+    PROFILE_ENDPOINT: {
+        "rate": 3.0,
+        "max_rate": 15.0,
+        "burst": 6
+    },
+    PROFILES_ENDPOINT: {
+        "rate": 1.0,
+        "max_rate": 5.0,
+        "burst": 2
+    }
+}
+
+RATE_LIMIT_MARKERS = ("rate limit", "ratelimit", "too many requests", "429", "quota")
+
+def is_rate_limit_message(message):
+    """
+    Check whether an API error message signals a rate-limit response.
+
+    Args:
+        message: Error message or exception text
+
+    Returns:
+        Boolean indicating if the message reports a rate limit
+    """
+    message = str(message or "").lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate follows additive-increase/multiplicative-decrease."""
+
+    def __init__(self, endpoint, rate, min_rate, max_rate, burst, increase_step,
+                 error_backoff, rate_limit_backoff):
+        self.endpoint = endpoint
+        self.rate = float(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.burst = float(burst)
+        self.increase_step = float(increase_step)
+        self.error_backoff = float(error_backoff)
+        self.rate_limit_backoff = float(rate_limit_backoff)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.successes = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.last_wait = 0.0
+        self.total_wait = 0.0
+
+    def _refill(self, now):
+        """Add the tokens earned since the last update."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            # Tokens may go negative: each caller reserves its slot and sleeps it off
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.calls += 1
+            self.last_wait = wait
+            self.total_wait += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self):
+        """
+        Take one token only if it is available now.
+
+        Returns:
+            True if a token was taken
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            self.calls += 1
+            self.last_wait = 0.0
+            return True
+
+    def record_success(self):
+        """Speed up after a successful call."""
+        with self.lock:
+            self.successes += 1
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def record_failure(self, rate_limited=False):
+        """
+        Back off after a failed call.
+
+        Args:
+            rate_limited: True if the API reported a rate limit
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            if rate_limited:
+                self.rate_limited += 1
+                self.rate = max(self.min_rate, self.rate * self.rate_limit_backoff)
+                # Drain the bucket so the next callers pause before retrying
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.errors += 1
+                self.rate = max(self.min_rate, self.rate * self.error_backoff)
+
+    def stats(self):
+        """
+        Report the current state of the bucket.
+
+        Returns:
+            Dictionary with the current rate, wait times and call counts
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "tokens": round(self.tokens, 3),
+                "wait_time": round(max(0.0, 1.0 - self.tokens) / self.rate, 3),
+                "last_wait": round(self.last_wait, 3),
+                "average_wait": round(self.total_wait / self.calls, 3) if self.calls else 0.0,
+                "calls": self.calls,
+                "successes": self.successes,
+                "errors": self.errors,
+                "rate_limited": self.rate_limited
+            }
+
+class RateLimiter:
+    """Registry of adaptive token buckets, one per API endpoint."""
+
+    def __init__(self, limits=None):
+        self.limits = limits if limits is not None else RATE_LIMITS
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, endpoint):
+        """Return the bucket for an endpoint, creating it on first use."""
+        with self.lock:
+            if endpoint not in self.buckets:
+                settings = dict(self.limits.get("default", {}))
+                settings.update(self.limits.get(endpoint, {}))
+                self.buckets[endpoint] = AdaptiveTokenBucket(endpoint, **settings)
+            return self.buckets[endpoint]
+
+    def configure(self, endpoint, **settings):
+        """
+        Override the budget of an endpoint.
+
+        Args:
+            endpoint: API endpoint name
+            **settings: Bucket settings such as rate, max_rate or burst
+        """
+        bucket = self.bucket(endpoint)
+        with bucket.lock:
+            for name, value in settings.items():
+                setattr(bucket, name, float(value))
+            bucket.tokens = min(bucket.tokens, bucket.burst)
+
+    def acquire(self, endpoint):
+        """Wait for permission to call an endpoint and return the seconds waited."""
+        return self.bucket(endpoint).acquire()
+
+    def try_acquire(self, endpoint):
+        """Take a token for an endpoint without waiting and return True if one was available."""
+        return self.bucket(endpoint).try_acquire()
+
+    def report(self, endpoint, response):
+        """
+        Adapt the endpoint rate to an API response.
+
+        Args:
+            endpoint: API endpoint name
+            response: Response dictionary returned by the API
+        """
+        bucket = self.bucket(endpoint)
+        if response and response.get("success", False):
+            bucket.record_success()
+        else:
+            message = response.get("message", "") if response else ""
+            bucket.record_failure(is_rate_limit_message(message))
+
+    def report_error(self, endpoint, error):
+        """
+        Adapt the endpoint rate to an exception raised by the API client.
+
+        Args:
+            endpoint: API endpoint name
+            error: Exception raised by the call
+        """
+        self.bucket(endpoint).record_failure(is_rate_limit_message(error))
+
+    def stats(self):
+        """Return the bucket statistics of every endpoint used so far."""
+        with self.lock:
+            buckets = dict(self.buckets)
+        return {endpoint: bucket.stats() for endpoint, bucket in buckets.items()}
+
+# Shared limiter used by all scripts
+RATE_LIMITER = RateLimiter()
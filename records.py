@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Compact Profile and Result Records
+
+This module replaces the nested dictionaries that carry profiles through a
+crawl with slotted dataclasses. A result record keeps its profile as the
+compact JSON text of the API response and parses it into a typed Profile only
+when a caller first reads it; repeated strings such as position, industry,
+location and skills are interned so every record shares one copy. Records are
+turned back into dictionaries or JSON only at the serialization boundary.
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+
+# Separators of the compact JSON written to the results stream
+COMPACT_SEPARATORS = (",", ":")
+
+def intern_text(value):
+    """Return a shared copy of a string; other values are returned unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _text(value):
+    """Return a string for a possibly missing API field."""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+@dataclass(slots=True)
+class Experience:
+    """One position from a profile's work history."""
+
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    description: str = ""
+    start_date: str = ""
+    end_date: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build an experience entry from an API dictionary.
+
+        Args:
+            data: Experience dictionary from the API
+
+        Returns:
+            Experience instance
+        """
+        return cls(
+            title=intern_text(_text(data.get("title"))),
+            company=intern_text(_text(data.get("company"))),
+            location=intern_text(_text(data.get("location"))),
+            description=_text(data.get("description")),
+            start_date=_text(data.get("startDate")),
+            end_date=intern_text(_text(data.get("endDate")))
+        )
+
+@dataclass(slots=True)
+class Profile:
+    """Typed view of a LinkedIn profile response."""
+
+    username: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    headline: str = ""
+    location: str = ""
+    summary: str = ""
+    experience: tuple = ()
+    skills: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a profile from the "data" dictionary of an API response.
+
+        Args:
+            data: Profile dictionary from the API
+
+        Returns:
+            Profile instance
+        """
+        data = data or {}
+        skills = []
+        for skill in data.get("skills") or []:
+            if isinstance(skill, dict):
+                skill = skill.get("name")
+            name = _text(skill)
+            if name:
+                skills.append(intern_text(name))
+        return cls(
+            username=_text(data.get("username") or data.get("publicIdentifier")),
+            first_name=_text(data.get("firstName")),
+            last_name=_text(data.get("lastName")),
+            headline=_text(data.get("headline")),
+            location=intern_text(_text(data.get("location"))),
+            summary=_text(data.get("summary")),
+            experience=tuple(Experience.from_dict(entry) for entry in data.get("experience") or []
+                             if isinstance(entry, dict)),
+            skills=tuple(skills)
+        )
+
+    @property
+    def full_name(self):
+        """First and last name joined by a space."""
+        return f"{self.first_name} {self.last_name}".strip()
+
+@dataclass(slots=True)
+class ResultRecord:
+    """One relevant profile found by a search unit."""
+
+    position: str
+    industry: str
+    location: str | None
+    username: str
+    profile_json: str = field(repr=False)
+    _profile: Profile | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_api(cls, fields, username, profile_data):
+        """
+        Build a record from a unit's fields and a profile response.
+
+        Args:
+            fields: Unit fields ({"position", "industry"[, "location"]})
+            username: LinkedIn username
+            profile_data: "data" dictionary of the profile response
+
+        Returns:
+            ResultRecord instance
+        """
+        return cls(
+            position=intern_text(fields.get("position", "")),
+            industry=intern_text(fields.get("industry", "")),
+            location=intern_text(fields.get("location")),
+            username=username,
+            profile_json=json.dumps(profile_data, separators=COMPACT_SEPARATORS)
+        )
+
+    @classmethod
+    def from_dict(cls, record):
+        """
+        Build a record from a dictionary read back from a results file.
+
+        Args:
+            record: Dictionary as written by to_dict()
+
+        Returns:
+            ResultRecord instance
+        """
+        profile_data = record.get("profile_data") or {}
+        username = record.get("username") or profile_data.get("username") or ""
+        return cls.from_api(record, username, profile_data)
+
+    @property
+    def profile(self):
+        """The profile, parsed from its JSON text on first access."""
+        if self._profile is None:
+            self._profile = Profile.from_dict(self.profile_data)
+        return self._profile
+
+    @property
+    def profile_data(self):
+        """A fresh copy of the profile response dictionary."""
+        return json.loads(self.profile_json)
+
+    def to_dict(self):
+        """
+        Return the record in the dictionary layout of the results files.
+
+        Returns:
+            Dictionary with position, industry, [location,] username and profile_data
+        """
+        record = {"position": self.position, "industry": self.industry}
+        if self.location is not None:
+            record["location"] = self.location
+        record["username"] = self.username
+        record["profile_data"] = self.profile_data
+        return record
+
+    def to_json(self):
+        """
+        Return the record as compact JSON without re-encoding the profile.
+
+        The text equals json.dumps(self.to_dict(), separators=(",", ":")).
+        """
+        parts = ['{"position":', json.dumps(self.position), ',"industry":', json.dumps(self.industry)]
+        if self.location is not None:
+            parts += [',"location":', json.dumps(self.location)]
+        parts += [',"username":', json.dumps(self.username), ',"profile_data":', self.profile_json, "}"]
+        return "".join(parts)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Crawl Results Sink
+
+This module streams result records to an append-only JSON Lines file as they
+are produced and keeps a checkpoint of the (position, industry, location,
+page) units that are done. After a crash, a resumed crawl truncates the
+results file to the last checkpointed write and skips every completed unit.
+"""
+
+import json
+import os
+import textwrap
+
+from records import ResultRecord
+
+def iter_jsonl(path):
+    """
+    Stream records from a JSON Lines file.
+
+    Args:
+        path: File path
+
+    Yields:
+        Decoded records; a torn last line from a crash is ignored
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def write_json_array(records, path):
+    """
+    Write records as a pretty-printed JSON array without holding them in memory.
+
+    The output is identical to json.dump(list(records), f, indent=2).
+
+    Args:
+        records: Iterable of JSON-serializable records
+        path: Output file path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        first = True
+        for record in records:
+            f.write("[\n" if first else ",\n")
+            f.write(textwrap.indent(json.dumps(record, indent=2), "  "))
+            first = False
+        f.write("[]" if first else "\n]")
+
+class JsonlResultsSink:
+    """Append-only JSON Lines file that is flushed to disk after every batch."""
+
+    def __init__(self, path, resume=False, truncate_to=None):
+        self.path = path
+        self.written = 0
+        if resume and truncate_to is not None and os.path.exists(path):
+            # Drop records written after the last checkpoint; their page is refetched
+            with open(path, "r+b") as f:
+                f.truncate(truncate_to)
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def write(self, records):
+        """
+        Append records and force them to disk.
+
+        Args:
+            records: Iterable of ResultRecord objects or JSON-serializable records
+
+        Returns:
+            File offset after the write
+        """
+        lines = [(record.to_json() if isinstance(record, ResultRecord)
+                  else json.dumps(record, separators=(",", ":"))) + "\n" for record in records]
+        if lines:
+            self.file.write("".join(lines))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.written += len(lines)
+        return self.file.tell()
+
+    def close(self):
+        """Close the file."""
+        self.file.close()
+
+class CrawlCheckpoint:
+    """Append-only log of completed crawl pages and units."""
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.units = {}
+        self.results_offset = 0
+        if resume:
+            for entry in iter_jsonl(path):
+                state = self.units.setdefault(entry["unit"], {"done": False, "page": 0, "next_start": 0,
+                                                              "usernames": set()})
+                if entry.get("done"):
+                    state["done"] = True
+                else:
+                    state["page"] = entry["page"]
+                    state["next_start"] = entry["next_start"]
+                    state["usernames"].update(entry.get("usernames", ()))
+                    self.results_offset = entry["results_offset"]
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _append(self, entry):
+        """Write one checkpoint entry and force it to disk."""
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def page_done(self, unit, page, next_start, results_offset, usernames=()):
+        """
+        Record a finished page.
+
+        Args:
+            unit: Unit key
+            page: Page number
+            next_start: Start offset of the following page
+            results_offset: Results file offset after the page's records
+            usernames: Usernames of the page's search hits, which a resumed
+                unit must not process again
+        """
+        usernames = list(usernames)
+        self._append({"unit": unit, "page": page, "next_start": next_start,
+                      "results_offset": results_offset, "usernames": usernames})
+        state = self.units.setdefault(unit, {"usernames": set()})
+        state.update({"done": False, "page": page, "next_start": next_start})
+        state["usernames"].update(usernames)
+
+    def unit_done(self, unit):
+        """Record that every page of a unit has been processed."""
+        self._append({"unit": unit, "done": True})
+        self.units.setdefault(unit, {"page": 0, "next_start": 0, "usernames": set()})["done"] = True
+
+    def is_done(self, unit):
+        """Return True if a unit finished in an earlier run."""
+        return self.units.get(unit, {}).get("done", False)
+
+    def resume_point(self, unit):
+        """
+        Return where a partially crawled unit continues.
+
+        Args:
+            unit: Unit key
+
+        Returns:
+            Dictionary with the next "page" number, "start" offset and the
+            "usernames" already processed, or None
+        """
+        state = self.units.get(unit)
+        if not state or state["done"] or not state["page"]:
+            return None
+        return {"page": state["page"] + 1, "start": state["next_start"],
+                "usernames": sorted(state["usernames"])}
+
+    def close(self):
+        """Close the file."""
+        self.file.close()
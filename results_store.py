@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Columnar Results Store
+
+This module keeps every relevant profile a crawl has found, across runs, as
+flat NumPy columns on disk. Each run appends its rows; readers memory-map
+only the columns a query touches, so filters and group-bys over hundreds of
+thousands of accumulated profiles run as vectorized array operations without
+parsing the JSON results files.
+
+Repeated strings (position, industry, locations, company, username, skills)
+are dictionary-encoded as int32 codes; free text (name, headline) is stored
+as UTF-8 bytes with end offsets. The row count and file sizes are committed to
+meta.json last, so a write torn by a crash is ignored and overwritten by the
+next append.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import time
+
+import numpy as np
+
+from paginator import keyword_relevance
+from records import ResultRecord
+
+# Default store settings
+STORE_DEFAULTS = {
+    "path": "linkedin_results_store",
+    "results_file": "linkedin_job_results.json",
+    "top": 20
+}
+
+# Column name -> kind ("category", "text", "tags" or a NumPy dtype)
+SCHEMA = {
+    "position": "category",
+    "industry": "category",
+    "search_location": "category",  # location of the search unit, if any
+    "location": "category",  # location on the profile
+    "company": "category",  # company of the most recent position
+    "username": "category",
+    "full_name": "text",
+    "headline": "text",
+    "skills": "tags",
+    "relevance": "float32",  # keyword relevance of the profile to its position query
+    "preferred_formats": "int16",  # preferred formats mentioned in headline and summary
+    "fetched_at": "float64",  # when the profile was fetched (epoch seconds)
+    "run": "int32"  # run that found the profile (-1 if unknown)
+}
+
+STORE_VERSION = 1
+
+def _files(name, kind):
+    """Return the (file name, dtype) pairs of a column; dtype None marks a dictionary file."""
+    if kind == "category":
+        return [(f"{name}.codes", np.int32), (f"{name}.dict", None)]
+    if kind == "text":
+        return [(f"{name}.ends", np.int64), (f"{name}.bytes", np.uint8)]
+    if kind == "tags":
+        return [(f"{name}.ends", np.int64), (f"{name}.codes", np.int32), (f"{name}.dict", None)]
+    return [(f"{name}.values", np.dtype(kind))]
+
+def flatten_records(records, filter_engine=None):
+    """
+    Flatten result records into the fields of store rows.
+
+    Args:
+        records: Iterable of ResultRecord objects or result dictionaries
+        filter_engine: Optional FilterEngine counting preferred formats
+
+    Returns:
+        List of dictionaries with one value per SCHEMA column except fetched_at and run
+    """
+    records = [record if isinstance(record, ResultRecord) else ResultRecord.from_dict(record)
+               for record in records]
+    profiles = [record.profile for record in records]
+    formats = [0] * len(records)
+    if filter_engine is not None:
+        formats = [sum(1 for reason in result.reasons if reason.startswith("preferred format"))
+                   for result in filter_engine.evaluate_batch(profiles)]
+    scorers = {}
+    rows = []
+    for record, profile, format_count in zip(records, profiles, formats):
+        scorer = scorers.get(record.position)
+        if scorer is None:
+            scorer = scorers[record.position] = keyword_relevance(record.position)
+        rows.append({
+            "position": record.position,
+            "industry": record.industry,
+            "search_location": record.location or "",
+            "location": profile.location,
+            "company": profile.experience[0].company if profile.experience else "",
+            "username": record.username or profile.username,
+            "full_name": profile.full_name,
+            "headline": profile.headline,
+            "skills": profile.skills,
+            "relevance": scorer({"headline": profile.headline, "summary": profile.summary}),
+            "preferred_formats": format_count
+        })
+    return rows
+
+class ResultsStore:
+    """Append-only columnar store of result rows with memory-mapped reads."""
+
+    def __init__(self, path=None):
+        self.path = path or STORE_DEFAULTS["path"]
+        self.meta = self._read_meta()
+        self.arrays = {}
+        self.dictionaries = {}
+        self.code_maps = {}
+
+    def _read_meta(self):
+        """Read meta.json, or describe an empty store if there is none."""
+        try:
+            with open(os.path.join(self.path, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return {"version": STORE_VERSION, "schema": dict(SCHEMA), "rows": 0, "files": {}}
+        if meta.get("schema") != SCHEMA:
+            raise ValueError(f"{self.path} was written with a different schema")
+        return meta
+
+    def _write_meta(self):
+        """Commit meta.json atomically."""
+        temporary = os.path.join(self.path, "meta.json.tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, os.path.join(self.path, "meta.json"))
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    # Reading
+
+    def _array(self, file_name, dtype):
+        """Return a committed data file as a read-only memory map."""
+        if file_name not in self.arrays:
+            size = self.meta["files"].get(file_name, 0)
+            count = size // np.dtype(dtype).itemsize
+            if count == 0:
+                self.arrays[file_name] = np.zeros(0, dtype=dtype)
+            else:
+                self.arrays[file_name] = np.memmap(os.path.join(self.path, file_name), dtype=dtype,
+                                                   mode="r", shape=(count,))
+        return self.arrays[file_name]
+
+    def _kind(self, name):
+        """Return the kind of a column, rejecting unknown names."""
+        if name not in SCHEMA:
+            raise KeyError(f"unknown column: {name} (known: {', '.join(SCHEMA)})")
+        return SCHEMA[name]
+
+    def column(self, name):
+        """
+        Return the raw array of a column.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Codes of category and tags columns (per tag for tags), end offsets
+            of text columns, values of numeric columns
+        """
+        kind = self._kind(name)
+        file_name, dtype = _files(name, kind)[1 if kind == "tags" else 0]
+        return self._array(file_name, dtype)
+
+    def dictionary(self, name):
+        """Return the values of a category or tags column, indexed by code."""
+        if name not in self.dictionaries:
+            size = self.meta["files"].get(f"{name}.dict", 0)
+            values = []
+            if size:
+                with open(os.path.join(self.path, f"{name}.dict"), "rb") as f:
+                    values = [json.loads(line) for line in f.read(size).splitlines()]
+            self.dictionaries[name] = values
+        return self.dictionaries[name]
+
+    def code_map(self, name):
+        """Return value -> code of a category or tags column."""
+        if name not in self.code_maps:
+            self.code_maps[name] = {value: code for code, value in enumerate(self.dictionary(name))}
+        return self.code_maps[name]
+
+    def _tag_rows(self, name):
+        """Return the row of every tag of a tags column."""
+        ends = self._array(f"{name}.ends", np.int64)
+        counts = np.diff(ends, prepend=0)
+        return np.repeat(np.arange(len(ends)), counts)
+
+    def _text_mask(self, name, pattern):
+        """
+        Mark rows whose text column matches a regular expression (case-insensitive).
+
+        Each row is searched on its own, through a zero-copy view of the
+        mapped file, so a match cannot span two rows and ^ and $ anchor at
+        the start and end of the row's text.
+        """
+        expression = re.compile(pattern.encode("utf-8"), re.IGNORECASE)
+        size = self.meta["files"].get(f"{name}.bytes", 0)
+        if not size:
+            # Every row is empty
+            return np.full(len(self), expression.search(b"") is not None, dtype=bool)
+        ends = self._array(f"{name}.ends", np.int64).tolist()
+        search = expression.search
+        with open(os.path.join(self.path, f"{name}.bytes"), "rb") as f:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+                view = memoryview(data)
+                try:
+                    mask = np.fromiter((search(view[start:end]) is not None
+                                        for start, end in zip([0] + ends[:-1], ends)),
+                                       dtype=bool, count=len(ends))
+                finally:
+                    view.release()
+        return mask
+
+    def mask(self, latest=False, **filters):
+        """
+        Select rows.
+
+        Args:
+            latest: Keep only the most recent row of each username
+            **filters: Column conditions, all of which must hold:
+                category and tags columns take a value or a list of values (any matches),
+                text columns take a case-insensitive regular expression,
+                numeric columns take a value or a (low, high) range with low <= x < high;
+                None leaves a range end open
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, condition in filters.items():
+            kind = self._kind(name)
+            if kind in ("category", "tags"):
+                values = [condition] if isinstance(condition, str) else list(condition)
+                wanted = [self.code_map(name)[value] for value in values if value in self.code_map(name)]
+                hits = np.isin(self.column(name), np.array(wanted, dtype=np.int32))
+                if kind == "category":
+                    mask &= hits
+                else:
+                    rows = np.zeros(len(self), dtype=bool)
+                    rows[self._tag_rows(name)[hits]] = True
+                    mask &= rows
+            elif kind == "text":
+                mask &= self._text_mask(name, condition)
+            elif isinstance(condition, tuple):
+                low, high = condition
+                values = self.column(name)
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values < high
+            else:
+                mask &= self.column(name) == condition
+        if latest and len(self):
+            codes = self.column("username")
+            _, last = np.unique(codes[::-1], return_index=True)
+            newest = np.zeros(len(self), dtype=bool)
+            newest[len(codes) - 1 - last] = True
+            mask &= newest
+        return mask
+
+    def _group_codes(self, by, mask):
+        """Return the group code of every selected row (every selected tag for tags columns)."""
+        kind = self._kind(by)
+        if kind == "category":
+            return self.column(by)[mask] if mask is not None else np.asarray(self.column(by))
+        if kind == "tags":
+            codes = self.column(by)
+            return codes[mask[self._tag_rows(by)]] if mask is not None else np.asarray(codes)
+        raise ValueError(f"cannot group by {kind} column {by}")
+
+    def group_count(self, by, mask=None, top=None):
+        """
+        Count rows per value of a category or tags column.
+
+        Args:
+            by: Column to group by
+            mask: Optional row selection from mask()
+            top: Optional number of groups to return
+
+        Returns:
+            List of (value, count) tuples, largest first
+        """
+        counts = np.bincount(self._group_codes(by, mask), minlength=len(self.dictionary(by)))
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0][:top]
+        values = self.dictionary(by)
+        return [(values[code], int(counts[code])) for code in order]
+
+    def group_mean(self, column, by, mask=None, top=None):
+        """
+        Average a numeric column per value of a category column.
+
+        Args:
+            column: Numeric column to average
+            by: Category column to group by
+            mask: Optional row selection from mask()
+            top: Optional number of groups to return
+
+        Returns:
+            List of (value, mean, count) tuples, highest mean first
+        """
+        if self._kind(by) != "category":
+            raise ValueError(f"cannot average per value of {self._kind(by)} column {by}")
+        values = self.column(column)
+        codes = self._group_codes(by, mask)
+        values = values[mask] if mask is not None else values
+        size = len(self.dictionary(by))
+        counts = np.bincount(codes, minlength=size)
+        sums = np.bincount(codes, weights=values, minlength=size)
+        present = np.flatnonzero(counts)
+        means = sums[present] / counts[present]
+        order = np.argsort(-means, kind="stable")[:top]
+        names = self.dictionary(by)
+        return [(names[present[i]], float(means[i]), int(counts[present[i]])) for i in order]
+
+    def _value(self, name, row):
+        """Decode the value of one column in one row."""
+        kind = SCHEMA[name]
+        if kind == "category":
+            return self.dictionary(name)[self.column(name)[row]]
+        if kind == "tags":
+            ends = self._array(f"{name}.ends", np.int64)
+            start = ends[row - 1] if row else 0
+            return [self.dictionary(name)[code] for code in self.column(name)[start:ends[row]]]
+        if kind == "text":
+            ends = self._array(f"{name}.ends", np.int64)
+            start = ends[row - 1] if row else 0
+            return self._array(f"{name}.bytes", np.uint8)[start:ends[row]].tobytes().decode("utf-8")
+        return self.column(name)[row].item()
+
+    def rows(self, mask=None, columns=None, limit=None, order_by=None):
+        """
+        Decode selected rows into dictionaries.
+
+        Args:
+            mask: Optional row selection from mask()
+            columns: Columns to decode (default all)
+            limit: Maximum number of rows
+            order_by: Optional numeric column to sort by, highest first
+
+        Returns:
+            List of row dictionaries
+        """
+        selected = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        if order_by is not None:
+            selected = selected[np.argsort(-self.column(order_by)[selected], kind="stable")]
+        columns = columns or list(SCHEMA)
+        return [{name: self._value(name, row) for name in columns} for row in selected[:limit]]
+
+    # Writing
+
+    def append(self, records, run=None, fetched_at=None, filter_engine=None):
+        """
+        Append result records as new rows.
+
+        Args:
+            records: Iterable of ResultRecord objects or result dictionaries
+            run: Run identifier stored with every row
+            fetched_at: Optional callable mapping a list of usernames to {username: fetch time};
+                rows without one get the current time
+            filter_engine: Optional FilterEngine counting preferred formats
+
+        Returns:
+            Number of rows appended
+        """
+        rows = flatten_records(records, filter_engine)
+        if not rows:
+            return 0
+        now = time.time()
+        times = fetched_at([row["username"] for row in rows]) if fetched_at is not None else {}
+        for row in rows:
+            row["fetched_at"] = times.get(row["username"]) or now
+            row["run"] = -1 if run is None else run
+
+        os.makedirs(self.path, exist_ok=True)
+        files = self.meta["files"]
+        chunks = {}
+        added = {}
+        for name, kind in SCHEMA.items():
+            values = [row[name] for row in rows]
+            if kind == "category":
+                chunks[f"{name}.codes"] = np.array([self._encode(name, value, added) for value in values],
+                                                   dtype=np.int32)
+            elif kind == "tags":
+                codes = [self._encode(name, tag, added) for tags in values for tag in tags]
+                chunks[f"{name}.codes"] = np.array(codes, dtype=np.int32)
+                base = files.get(f"{name}.codes", 0) // np.dtype(np.int32).itemsize
+                chunks[f"{name}.ends"] = base + np.cumsum([len(tags) for tags in values], dtype=np.int64)
+            elif kind == "text":
+                encoded = [str(value or "").encode("utf-8") for value in values]
+                chunks[f"{name}.bytes"] = b"".join(encoded)
+                chunks[f"{name}.ends"] = files.get(f"{name}.bytes", 0) + np.cumsum(
+                    [len(text) for text in encoded], dtype=np.int64)
+            else:
+                chunks[f"{name}.values"] = np.array(values, dtype=kind)
+        for name, values in added.items():
+            chunks[f"{name}.dict"] = "".join(json.dumps(value) + "\n" for value in values).encode("utf-8")
+
+        for file_name, chunk in chunks.items():
+            data = chunk if isinstance(chunk, bytes) else chunk.tobytes()
+            with open(os.path.join(self.path, file_name), "ab") as f:
+                # Drop bytes of a torn earlier append before writing after the committed size
+                f.truncate(files.get(file_name, 0))
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            files[file_name] = files.get(file_name, 0) + len(data)
+        self.meta["rows"] += len(rows)
+        self._write_meta()
+        self.arrays = {}
+        return len(rows)
+
+    def _encode(self, name, value, added):
+        """Return the code of a category value, collecting new values per column in added."""
+        value = "" if value is None else str(value)
+        code_map = self.code_map(name)
+        code = code_map.get(value)
+        if code is None:
+            code = code_map[value] = len(self.dictionary(name))
+            self.dictionary(name).append(value)
+            added.setdefault(name, []).append(value)
+        return code
+
+def _parse_filters(conditions):
+    """Turn "column=value" arguments into mask() keyword arguments."""
+    filters = {}
+    for condition in conditions or ():
+        name, _, value = condition.partition("=")
+        kind = SCHEMA.get(name)
+        if kind in ("category", "tags"):
+            filters.setdefault(name, []).append(value)
+        elif kind == "text":
+            filters[name] = value
+        elif kind is not None and ".." in value:
+            low, high = (float(part) if part else None for part in value.split("..", 1))
+            filters[name] = (low, high)
+        elif kind is not None:
+            filters[name] = float(value)
+        else:
+            raise SystemExit(f"unknown column: {name}")
+    return filters
+
+def main(argv=None):
+    """Import results into the store or report over it."""
+    parser = argparse.ArgumentParser(description="Columnar store of accumulated LinkedIn results")
+    parser.add_argument("command", choices=["import", "report", "rows"])
+    parser.add_argument("--store", default=STORE_DEFAULTS["path"], help="store directory")
+    parser.add_argument("--results", default=STORE_DEFAULTS["results_file"],
+                        help="results file to import (.json or .jsonl)")
+    parser.add_argument("--where", action="append",
+                        help="filter such as industry=Fintech, headline=growth or relevance=0.5..")
+    parser.add_argument("--by", default="industry", help="column to group the report by")
+    parser.add_argument("--mean", default=None, help="numeric column to average per group")
+    parser.add_argument("--latest", action="store_true", help="only the latest row per profile")
+    parser.add_argument("--top", type=int, default=STORE_DEFAULTS["top"], help="number of groups or rows")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.store)
+    if args.command == "import":
+        from ranking import load_records
+        added = store.append(load_records(args.results))
+        print(f"Imported {added} rows into {args.store} ({len(store)} total)")
+        return added
+
+    started = time.perf_counter()
+    mask = store.mask(latest=args.latest, **_parse_filters(args.where))
+    if args.command == "rows":
+        result = store.rows(mask, limit=args.top, order_by=args.mean)
+        for row in result:
+            print(json.dumps(row, ensure_ascii=False))
+    elif args.mean:
+        result = store.group_mean(args.mean, args.by, mask, args.top)
+        for value, mean, count in result:
+            print(f"{mean:8.3f} {count:8d}  {value or '-'}")
+    else:
+        result = store.group_count(args.by, mask, args.top)
+        for value, count in result:
+            print(f"{count:8d}  {value or '-'}")
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{int(mask.sum())} of {len(store)} rows selected in {elapsed:.1f} ms")
+    return result
+
+if __name__ == "__main__":
+    main()
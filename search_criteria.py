@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Job Search Criteria
+
+This module holds the filter criteria shared by the search scripts, the
+validation script and the filter command. It imports nothing, so checking
+locations against the criteria does not load the crawler.
+"""
+
+# Filter criteria merged into each script's CONFIG
+FILTER_CONFIG = {
+    "locations": [
+        "Porto",
+        "Lisbon",
+        "Portugal",
+        "Remote",
+        "Europe"
+    ],
+    "exclude_locations": ["Russia", "Russian Federation"],
+    "require_location_match": True,  # results must lie in one of "locations" (see gazetteer.py)
+    "preferred_formats": ["hybrid", "remote"]
+}
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Cross-Run Seen Index
+
+This module remembers every profile a crawl has seen, keyed by username,
+together with a fingerprint of the search-result fields that describe it. A
+crawl asks the index about each search hit before fetching its profile, so
+profiles that are unchanged since the last run cost no API call, and at the
+end of the run the index produces a delta report of new, changed and
+disappeared profiles.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+# Search-result fields whose change marks a profile as changed
+FINGERPRINT_FIELDS = ("fullName", "headline", "location", "summary")
+
+NEW = "new"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+
+def profile_fingerprint(item):
+    """
+    Fingerprint the fields of a search hit or profile that we care about.
+
+    Args:
+        item: Search result item or profile dictionary
+
+    Returns:
+        Tuple of (hex digest, {field: value})
+    """
+    fields = {}
+    for name in FINGERPRINT_FIELDS:
+        value = item.get(name)
+        if name == "fullName" and value is None and (item.get("firstName") or item.get("lastName")):
+            value = f"{item.get('firstName', '')} {item.get('lastName', '')}".strip()
+        fields[name] = "" if value is None else str(value).strip()
+    payload = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest(), fields
+
+class SeenIndex:
+    """Persistent username -> fingerprint index with per-run delta tracking."""
+
+    def __init__(self, path, skip_unchanged=True):
+        self.path = path
+        self.skip_unchanged = skip_unchanged
+        self.lock = threading.Lock()
+        self.connection = None
+        self.run_id = None
+        self.previous_run = None
+        self.observed = {}
+        self.relevant = set()
+
+    def _connect(self):
+        """Open the database on first use."""
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                "username TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, fields TEXT NOT NULL, "
+                "relevant INTEGER NOT NULL DEFAULT 0, first_seen REAL NOT NULL, "
+                "last_seen REAL NOT NULL, last_run INTEGER NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS seen_last_run ON seen (last_run)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, started REAL NOT NULL, finished REAL, "
+                "complete INTEGER NOT NULL DEFAULT 0, summary TEXT)"
+            )
+            self.connection.commit()
+        return self.connection
+
+    def start_run(self):
+        """
+        Begin a run; observations are compared with the last finished run.
+
+        Returns:
+            Identifier of the new run
+        """
+        with self.lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT MAX(id) FROM runs WHERE finished IS NOT NULL").fetchone()
+            self.previous_run = row[0]
+            cursor = connection.execute("INSERT INTO runs (started) VALUES (?)", (time.time(),))
+            connection.commit()
+            self.run_id = cursor.lastrowid
+            self.observed = {}
+            self.relevant = set()
+            return self.run_id
+
+    def observe(self, item):
+        """
+        Classify a search hit against the index.
+
+        The first observation of a username in a run decides whether its
+        profile is fetched. A username can appear under several queries with
+        slightly different search fields; it counts as unchanged if any of
+        them matches the stored fingerprint. Nothing is written until
+        finish_run().
+
+        Args:
+            item: Search result item with a "username"
+
+        Returns:
+            "new", "changed" or "unchanged"
+        """
+        username = item.get("username")
+        if not username:
+            return NEW
+        fingerprint, fields = profile_fingerprint(item)
+        with self.lock:
+            known = self.observed.get(username)
+            if known is not None:
+                status = known["status"]
+                known["variants"].setdefault(fingerprint, fields)
+                if known["stored"] == fingerprint:
+                    known["status"] = UNCHANGED
+                return status
+            row = self._connect().execute(
+                "SELECT fingerprint, fields FROM seen WHERE username = ?", (username,)
+            ).fetchone()
+            if row is None:
+                status = NEW
+                stored, previous_fields = None, None
+            else:
+                status = UNCHANGED if row[0] == fingerprint else CHANGED
+                stored, previous_fields = row[0], json.loads(row[1])
+            self.observed[username] = {"status": status, "stored": stored,
+                                       "previous_fields": previous_fields,
+                                       "variants": {fingerprint: fields}}
+            return status
+
+    def should_fetch(self, item):
+        """Observe a search hit; return False if its unchanged profile should be skipped."""
+        return self.observe(item) != UNCHANGED or not self.skip_unchanged
+
+    def status(self, username):
+        """Return the status of a username observed in this run, or None."""
+        with self.lock:
+            known = self.observed.get(username)
+            return known["status"] if known is not None else None
+
+    def usernames(self):
+        """Return the set of all usernames stored by finished runs."""
+        with self.lock:
+            return {row[0] for row in self._connect().execute("SELECT username FROM seen")}
+
+    def defer(self, item):
+        """
+        Forget a new or changed hit whose profile was not fetched, so the next run fetches it.
+
+        A username that passed the relevance filter in this run was fetched
+        under another query and keeps its observation.
+        """
+        with self.lock:
+            username = item.get("username")
+            known = self.observed.get(username)
+            if known is not None and known["status"] != UNCHANGED and username not in self.relevant:
+                del self.observed[username]
+
+    def mark_relevant(self, usernames):
+        """Record usernames that passed the relevance filter in this run."""
+        with self.lock:
+            self.relevant.update(usernames)
+
+    def finish_run(self, complete=True):
+        """
+        Persist this run's observations and build the delta report.
+
+        Args:
+            complete: Whether the run covered the whole search plan; profiles
+                are only reported as disappeared after a complete run
+
+        Returns:
+            Delta report dictionary
+        """
+        now = time.time()
+        with self.lock:
+            connection = self._connect()
+            report = {"run": self.run_id, "previous_run": self.previous_run,
+                      "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)),
+                      "new": [], "changed": [], "disappeared": []}
+            unchanged = 0
+            for username, observation in sorted(self.observed.items()):
+                # Keep the stored variant if it was seen, else the smallest, so reruns agree
+                variants = observation["variants"]
+                if observation["stored"] in variants:
+                    observation["fingerprint"] = observation["stored"]
+                else:
+                    observation["fingerprint"] = min(variants)
+                observation["fields"] = variants[observation["fingerprint"]]
+
+                status = observation["status"]
+                if status == UNCHANGED:
+                    unchanged += 1
+                elif username in self.relevant:
+                    entry = {"username": username, **observation["fields"]}
+                    if status == CHANGED:
+                        previous = observation["previous_fields"] or {}
+                        entry["changed_fields"] = [name for name in FINGERPRINT_FIELDS
+                                                   if previous.get(name) != observation["fields"][name]]
+                    report[status].append(entry)
+
+            if complete and self.previous_run is not None:
+                rows = connection.execute(
+                    "SELECT username, fields FROM seen WHERE last_run = ? AND relevant = 1",
+                    (self.previous_run,)
+                ).fetchall()
+                report["disappeared"] = [{"username": username, **json.loads(fields)}
+                                         for username, fields in rows
+                                         if username not in self.observed]
+
+            # Skipped profiles keep their stored relevance, fetched ones get this run's
+            connection.executemany(
+                "INSERT INTO seen (username, fingerprint, fields, relevant, first_seen, last_seen, last_run) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(username) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                "fields = excluded.fields, last_seen = excluded.last_seen, last_run = excluded.last_run, "
+                "relevant = CASE WHEN ? THEN seen.relevant ELSE excluded.relevant END",
+                [(username, observation["fingerprint"],
+                  json.dumps(observation["fields"], separators=(",", ":")),
+                  int(username in self.relevant), now, now, self.run_id,
+                  int(observation["status"] == UNCHANGED and self.skip_unchanged))
+                 for username, observation in self.observed.items()]
+            )
+            report["counts"] = {"new": len(report["new"]), "changed": len(report["changed"]),
+                                "disappeared": len(report["disappeared"]),
+                                "skipped_unchanged": unchanged, "observed": len(self.observed)}
+            connection.execute(
+                "UPDATE runs SET finished = ?, complete = ?, summary = ? WHERE id = ?",
+                (now, int(complete), json.dumps(report["counts"]), self.run_id)
+            )
+            connection.commit()
+            return report
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+def format_delta_report(report):
+    """
+    Render a delta report as short human-readable text.
+
+    Args:
+        report: Dictionary returned by SeenIndex.finish_run()
+
+    Returns:
+        Multi-line summary
+    """
+    counts = report["counts"]
+    lines = [f"Delta since run {report['previous_run'] or '-'}: {counts['new']} new, "
+             f"{counts['changed']} changed, {counts['disappeared']} disappeared, "
+             f"{counts['skipped_unchanged']} unchanged profiles skipped"]
+    for status, marker in (("new", "+"), ("changed", "~"), ("disappeared", "-")):
+        for entry in report[status]:
+            detail = f" ({', '.join(entry['changed_fields'])})" if entry.get("changed_fields") else ""
+            lines.append(f"  {marker} {entry['username']}: {entry.get('headline', '')} "
+                         f"[{entry.get('location', '')}]{detail}")
+    return "\n".join(lines)
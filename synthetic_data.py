@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Synthetic LinkedIn Data Generator
+
+This module generates varied, realistic LinkedIn profiles and search pages on
+demand for load testing. Every profile and every search result is a pure
+function of the seed and its number or position, so data is reproducible,
+nothing is stored, and any slice of a population of millions can be produced
+without generating what comes before it. Field choices are drawn from a
+64-bit integer mix instead of a seeded random.Random per profile, which keeps
+generation cheap enough never to be the bottleneck of a benchmark.
+
+Search results mix a small shared pool of profiles, which different queries
+keep finding, with draws from the whole population; duplicate_rate sets the
+share drawn from the shared pool and so the overlap between queries.
+"""
+
+import argparse
+import json
+import time
+import zlib
+
+# Default generator settings
+SYNTHETIC_DEFAULTS = {
+    "seed": 7,
+    "population": 1000000,  # distinct profiles
+    "shared_pool": 1000,  # profiles that many queries find
+    "duplicate_rate": 0.2,  # share of search results drawn from the shared pool
+    "excluded_location_rate": 0.1,  # share of profiles located in an excluded country
+    "results_per_page": 10,
+    "total_results": 100,  # search results available per query
+    "username_prefix": "synthetic-person"
+}
+
+FIRST_NAMES = ["Ana", "João", "Maria", "Pedro", "Inês", "Miguel", "Sofia", "Tiago", "Laura", "David",
+               "Emma", "Lucas", "Olivia", "Noah", "Mia", "Liam", "Hannah", "Felix", "Clara", "Jonas",
+               "Elena", "Marco", "Giulia", "Pablo", "Lucía", "Ivan", "Olga", "Anna", "Tomás", "Rita",
+               "Sarah", "James", "Chloé", "Louis", "Eva", "Daan", "Sanne", "Aoife", "Conor", "Nina"]
+LAST_NAMES = ["Silva", "Santos", "Ferreira", "Pereira", "Costa", "Oliveira", "Martins", "Rodrigues",
+              "Müller", "Schmidt", "Schneider", "Fischer", "García", "Fernández", "López", "Martínez",
+              "Rossi", "Russo", "Bianchi", "Dubois", "Laurent", "Moreau", "de Jong", "Jansen", "Visser",
+              "Murphy", "Kelly", "Smith", "Johnson", "Brown", "Ivanov", "Petrov", "Novak", "Kowalski",
+              "Nowak", "Horvat", "Popescu", "Nielsen", "Hansen", "Berg"]
+LOCATIONS = ["Porto, Portugal", "Lisbon, Portugal", "Braga, Portugal", "Remote", "Remote, Europe",
+             "Berlin, Germany", "Munich, Germany", "Madrid, Spain", "Barcelona, Spain",
+             "Amsterdam, Netherlands", "Dublin, Ireland", "London, United Kingdom", "Paris, France",
+             "Milan, Italy", "Warsaw, Poland", "Prague, Czech Republic", "Stockholm, Sweden",
+             "Copenhagen, Denmark", "Zurich, Switzerland", "Vienna, Austria"]
+EXCLUDED_LOCATIONS = ["Moscow, Russian Federation", "Saint Petersburg, Russia", "Kazan, Russian Federation"]
+TITLES = ["Head of Growth", "VP of Business Development", "Revenue Strategist", "Growth Strategist",
+          "VP of Affiliate Marketing", "COO", "Partnerships Lead", "Director of Partnerships",
+          "Chief Revenue Officer", "Head of Performance Marketing", "Business Development Manager",
+          "Growth Marketing Manager", "VP of Sales", "Head of Ecommerce", "Commercial Director",
+          "Affiliate Manager", "Head of Partnerships", "General Manager", "Chief Growth Officer",
+          "Marketing Director"]
+INDUSTRIES = ["SaaS", "Digital Platforms", "Subscription", "Ecommerce", "Performance Marketing",
+              "Fintech", "Marketplaces", "AdTech", "iGaming", "EdTech"]
+COMPANY_WORDS = ["Nova", "Blue", "Atlas", "Bright", "Cloud", "Delta", "Echo", "Forge", "Lumen", "Orbit",
+                 "Peak", "Quantum", "Red", "Signal", "Summit", "Vertex", "Wave", "Zen", "North", "Prime"]
+COMPANY_KINDS = ["Labs", "Group", "Digital", "Media", "Commerce", "Technologies", "Ventures", "Networks",
+                 "Platforms", "Software"]
+SKILLS = ["Business Development", "SaaS", "Strategic Partnerships", "Affiliate Marketing", "Revenue Growth",
+          "Ecommerce", "Negotiation", "B2B Sales", "Performance Marketing", "Go-to-Market Strategy",
+          "Account Management", "Team Leadership", "Pricing", "Subscription Models", "CRM",
+          "Data-Driven Marketing", "Product Marketing", "Market Expansion", "P&L Management", "SEO"]
+WORK_FORMATS = ["Open to remote roles.", "Open to hybrid roles.", "Prefers on-site work.",
+                "Open to remote or hybrid roles.", ""]
+SCHOOLS = ["University of Porto", "NOVA SBE", "Católica Lisbon", "IE Business School", "ESADE",
+           "INSEAD", "LSE", "Trinity College Dublin", "TU Munich", "Bocconi University"]
+DEGREES = [("MBA", "Business Administration"), ("MSc", "Marketing"), ("BSc", "Economics"),
+           ("MSc", "Management"), ("BA", "Communication"), ("BSc", "Computer Science")]
+
+_MASK = (1 << 64) - 1
+
+def _mix(value):
+    """Scramble a 64-bit integer (splitmix64 finalizer)."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+def _text_key(text):
+    """Return a stable integer for a string."""
+    return zlib.crc32(text.encode("utf-8"))
+
+class SyntheticGenerator:
+    """Deterministic, stateless generator of LinkedIn profiles and search pages."""
+
+    def __init__(self, **settings):
+        self.settings = dict(SYNTHETIC_DEFAULTS)
+        self.settings.update(settings)
+        self.key = _mix(self.settings["seed"])
+        self.population = max(1, self.settings["population"])
+        self.shared_pool = max(1, min(self.settings["shared_pool"], self.population))
+        self.duplicate_threshold = int(self.settings["duplicate_rate"] * 65536)
+        self.excluded_threshold = int(self.settings["excluded_location_rate"] * 65536)
+        self.prefix = self.settings["username_prefix"]
+
+    def username(self, number):
+        """Return the username of a profile number."""
+        return f"{self.prefix}-{number}"
+
+    def number(self, username):
+        """
+        Return the profile number of a username.
+
+        Usernames not produced by this generator get a stable number derived from their text.
+        """
+        head, _, tail = username.rpartition("-")
+        if head == self.prefix and tail.isdigit():
+            return int(tail)
+        return _text_key(username) % self.population
+
+    def _core(self, number):
+        """Return the search-visible fields of a profile and the hash used for the rest."""
+        h = _mix(self.key ^ number)
+        h, first = divmod(h, len(FIRST_NAMES))
+        h, last = divmod(h, len(LAST_NAMES))
+        h, title = divmod(h, len(TITLES))
+        h, industry = divmod(h, len(INDUSTRIES))
+        h, word = divmod(h, len(COMPANY_WORDS))
+        h, kind = divmod(h, len(COMPANY_KINDS))
+        h, skill = divmod(h, len(SKILLS))
+        h, work_format = divmod(h, len(WORK_FORMATS))
+        h, years = divmod(h, 18)
+        h, headline_style = divmod(h, 3)
+        excluded, place = divmod(h & 0xFFFFFFFF, 65536)
+        if place < self.excluded_threshold:
+            location = EXCLUDED_LOCATIONS[excluded % len(EXCLUDED_LOCATIONS)]
+        else:
+            location = LOCATIONS[excluded % len(LOCATIONS)]
+
+        title = TITLES[title]
+        industry = INDUSTRIES[industry]
+        company = f"{COMPANY_WORDS[word]} {COMPANY_KINDS[kind]}"
+        if headline_style == 0:
+            headline = f"{title} at {company}"
+        elif headline_style == 1:
+            headline = f"{title} | {SKILLS[skill]} | {industry}"
+        else:
+            headline = f"{title} - {industry} - {company}"
+        summary = (f"{title} with {years + 3} years in {industry}, focused on "
+                   f"{SKILLS[skill].lower()}. {WORK_FORMATS[work_format]}").strip()
+        return {
+            "firstName": FIRST_NAMES[first],
+            "lastName": LAST_NAMES[last],
+            "headline": headline,
+            "location": location,
+            "summary": summary,
+            "title": title,
+            "company": company,
+            "industry": industry
+        }
+
+    def profile_data(self, number):
+        """
+        Generate the full profile of a profile number.
+
+        Args:
+            number: Profile number in [0, population)
+
+        Returns:
+            Profile dictionary shaped like the API's profile data
+        """
+        core = self._core(number)
+        h = _mix(self.key ^ ~number & _MASK)
+        h, jobs = divmod(h, 3)
+        h, skill_offset = divmod(h, len(SKILLS))
+        h, skill_count = divmod(h, 4)
+        h, school = divmod(h, len(SCHOOLS))
+        h, degree = divmod(h, len(DEGREES))
+        h, start_year = divmod(h, 12)
+
+        experience = [{
+            "title": core["title"],
+            "company": core["company"],
+            "location": core["location"],
+            "description": f"Leading {SKILLS[skill_offset].lower()} initiatives in {core['industry']}.",
+            "startDate": f"{2012 + start_year}-{(h % 12) + 1:02d}",
+            "endDate": "Present"
+        }]
+        for job in range(jobs):
+            previous = _mix(h ^ job)
+            previous, title = divmod(previous, len(TITLES))
+            previous, word = divmod(previous, len(COMPANY_WORDS))
+            previous, kind = divmod(previous, len(COMPANY_KINDS))
+            end_year = 2012 + start_year - 3 * job
+            experience.append({
+                "title": TITLES[title],
+                "company": f"{COMPANY_WORDS[word]} {COMPANY_KINDS[kind]}",
+                "location": LOCATIONS[previous % len(LOCATIONS)],
+                "description": f"Grew {SKILLS[(skill_offset + job + 1) % len(SKILLS)].lower()} revenue.",
+                "startDate": f"{end_year - 3}-01",
+                "endDate": f"{end_year}-01"
+            })
+
+        degree, field = DEGREES[degree]
+        return {
+            "username": self.username(number),
+            "firstName": core["firstName"],
+            "lastName": core["lastName"],
+            "headline": core["headline"],
+            "location": core["location"],
+            "summary": core["summary"],
+            "experience": experience,
+            "education": [{
+                "school": SCHOOLS[school],
+                "degree": degree,
+                "field": field,
+                "startDate": str(2000 + start_year),
+                "endDate": str(2002 + start_year)
+            }],
+            "skills": [SKILLS[(skill_offset + step * 7) % len(SKILLS)] for step in range(skill_count + 3)]
+        }
+
+    def profile(self, username):
+        """Return the profile response of a username."""
+        data = self.profile_data(self.number(username))
+        data["username"] = username
+        return {"success": True, "message": "Synthetic profile details", "data": data}
+
+    def search_item(self, number):
+        """Return the search result item of a profile number."""
+        core = self._core(number)
+        username = self.username(number)
+        return {
+            "fullName": f"{core['firstName']} {core['lastName']}",
+            "headline": core["headline"],
+            "summary": core["summary"],
+            "location": core["location"],
+            "profileURL": f"https://linkedin.com/in/{username}",
+            "username": username
+        }
+
+    def result_number(self, keywords, position):
+        """
+        Return the profile number at a position of a query's results.
+
+        Args:
+            keywords: Search keywords
+            position: Zero-based result position
+
+        Returns:
+            Profile number; a duplicate_rate share comes from the shared pool
+        """
+        h = _mix(self.key ^ _mix((_text_key(keywords) << 32) | position))
+        if h & 0xFFFF < self.duplicate_threshold:
+            return (h >> 16) % self.shared_pool
+        return (h >> 16) % self.population
+
+    def search(self, keywords, start=0):
+        """
+        Return one page of search results for a query.
+
+        Args:
+            keywords: Search keywords
+            start: Pagination offset
+
+        Returns:
+            Search response dictionary
+        """
+        total = self.settings["total_results"]
+        end = min(total, start + self.settings["results_per_page"])
+        items = [self.search_item(self.result_number(keywords, position))
+                 for position in range(max(0, start), end)]
+        return {"success": True, "message": "Synthetic search results",
+                "data": {"total": total, "items": items}}
+
+    def iter_profiles(self, count, start=0):
+        """
+        Stream profile data dictionaries.
+
+        Args:
+            count: Number of profiles
+            start: First profile number
+
+        Yields:
+            Profile data dictionaries
+        """
+        for number in range(start, start + count):
+            yield self.profile_data(number % self.population)
+
+    def iter_search_pages(self, queries, pages=None):
+        """
+        Stream search pages for several queries.
+
+        Args:
+            queries: Search keyword strings
+            pages: Pages per query (default: all results)
+
+        Yields:
+            Tuples of (keywords, start, search response)
+        """
+        per_page = self.settings["results_per_page"]
+        total = self.settings["total_results"]
+        for keywords in queries:
+            for page, start in enumerate(range(0, total, per_page)):
+                if pages is not None and page >= pages:
+                    break
+                yield keywords, start, self.search(keywords, start)
+
+def main(argv=None):
+    """Stream synthetic profiles to a JSONL file and report the generation rate."""
+    parser = argparse.ArgumentParser(description="Generate synthetic LinkedIn profiles")
+    parser.add_argument("--count", type=int, default=100000, help="profiles to generate")
+    parser.add_argument("--seed", type=int, default=SYNTHETIC_DEFAULTS["seed"])
+    parser.add_argument("--population", type=int, default=SYNTHETIC_DEFAULTS["population"])
+    parser.add_argument("--output", default=None, help="JSONL file (default: generate only)")
+    args = parser.parse_args(argv)
+
+    generator = SyntheticGenerator(seed=args.seed, population=args.population)
+    started = time.perf_counter()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for profile in generator.iter_profiles(args.count):
+                f.write(json.dumps(profile, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+    else:
+        for _ in generator.iter_profiles(args.count):
+            pass
+    elapsed = time.perf_counter() - started
+    print(f"Generated {args.count} profiles in {elapsed:.2f}s "
+          f"({args.count / elapsed if elapsed else 0:.0f} profiles/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Durable Crawl Work Queue
+
+This module puts the units of a search plan into a SQLite work queue that
+several worker processes, on one machine or sharing one disk, and possibly
+using different API accounts, drain together. A worker leases units, crawls
+them with the regular crawl engine and reports every finished page back: its
+records and the next pagination offset are committed in one transaction.
+While a worker runs, a heartbeat renews the leases of its units, however long
+a page takes. A lease that is not renewed expires, so the units of a dead
+worker go back to the queue and resume from their last reported page.
+
+Usage:
+    python work_queue.py plan --script linkedin_search_automation
+    python work_queue.py work --script linkedin_search_automation --processes 4
+    python work_queue.py status
+    python work_queue.py collect --script linkedin_search_automation
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from crawl_engine import run_crawl
+from query_planner import unit_key
+
+# Default queue settings
+QUEUE_DEFAULTS = {
+    "path": "linkedin_work_queue.sqlite",
+    "lease_seconds": 120,  # a unit whose lease is not renewed for this long is re-queued
+    "max_attempts": 3,  # leases of a unit before it is marked failed
+    "poll_interval": 2.0  # seconds an idle worker waits for expired leases
+}
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+class WorkQueue:
+    """SQLite-backed queue of crawl units with leases and page-level progress."""
+
+    def __init__(self, path=None, lease_seconds=None, max_attempts=None):
+        self.path = path or QUEUE_DEFAULTS["path"]
+        self.lease_seconds = lease_seconds or QUEUE_DEFAULTS["lease_seconds"]
+        self.max_attempts = max_attempts or QUEUE_DEFAULTS["max_attempts"]
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def _connect(self):
+        """Open the database on first use."""
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                              check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS units ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, state TEXT NOT NULL, "
+                "worker TEXT, lease_expires REAL, attempts INTEGER NOT NULL DEFAULT 0, "
+                "page INTEGER NOT NULL DEFAULT 1, start INTEGER NOT NULL DEFAULT 0, "
+                "calls INTEGER NOT NULL DEFAULT 0, records INTEGER NOT NULL DEFAULT 0, "
+                "error TEXT, updated REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS units_state ON units (state, lease_expires)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT NOT NULL, page INTEGER NOT NULL, username TEXT NOT NULL, "
+                "record TEXT NOT NULL, PRIMARY KEY (key, page, username))"
+            )
+        return self.connection
+
+    def _transaction(self, statements):
+        """
+        Run a function inside an immediate (write-locked) transaction.
+
+        Args:
+            statements: Callable taking the connection
+
+        Returns:
+            The callable's return value
+        """
+        with self.lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def enqueue(self, units):
+        """
+        Add units to the queue; units already queued are left untouched.
+
+        Args:
+            units: Crawl units from a search plan
+
+        Returns:
+            Number of units added
+        """
+        now = time.time()
+        rows = [(unit_key(unit), json.dumps({name: value for name, value in unit.items() if name != "resume"}),
+                 PENDING, now) for unit in units]
+
+        def insert(connection):
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO units (key, payload, state, updated) VALUES (?, ?, ?, ?)", rows)
+            return connection.total_changes - before
+        return self._transaction(insert)
+
+    def lease(self, worker, limit=1):
+        """
+        Lease pending units and units whose lease expired.
+
+        Args:
+            worker: Worker identifier
+            limit: Maximum number of units to lease
+
+        Returns:
+            List of units, each with a "resume" point from its last reported page
+        """
+        def take(connection):
+            now = time.time()
+            rows = connection.execute(
+                "SELECT key, payload, page, start FROM units "
+                "WHERE state = ? OR (state = ? AND lease_expires < ?) ORDER BY rowid LIMIT ?",
+                (PENDING, LEASED, now, limit)
+            ).fetchall()
+            units = []
+            for key, payload, page, start in rows:
+                # Records stored from earlier pages are not emitted again
+                usernames = [row[0] for row in connection.execute(
+                    "SELECT DISTINCT username FROM results WHERE key = ?", (key,))]
+                connection.execute(
+                    "UPDATE units SET state = ?, worker = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated = ? WHERE key = ?",
+                    (LEASED, worker, now + self.lease_seconds, now, key)
+                )
+                unit = json.loads(payload)
+                unit["resume"] = {"page": page, "start": start, "usernames": usernames}
+                units.append(unit)
+            return units
+        return self._transaction(take)
+
+    def page_done(self, unit, worker, page, next_start, records):
+        """
+        Store a finished page's records, advance the unit and renew its lease.
+
+        Args:
+            unit: Leased crawl unit
+            worker: Worker identifier holding the lease
+            page: Number of the finished page
+            next_start: Offset of the following page
+            records: ResultRecord objects of the page
+
+        Returns:
+            False if the lease was lost to another worker and nothing was stored
+        """
+        key = unit_key(unit)
+        rows = [(key, page, record.username, record.to_json()) for record in records]
+
+        def store(connection):
+            now = time.time()
+            cursor = connection.execute(
+                "UPDATE units SET page = ?, start = ?, records = records + ?, "
+                "lease_expires = ?, updated = ? WHERE key = ? AND worker = ? AND state = ?",
+                (page + 1, next_start, len(rows), now + self.lease_seconds, now, key, worker, LEASED)
+            )
+            if cursor.rowcount == 0:
+                return False
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (key, page, username, record) VALUES (?, ?, ?, ?)", rows)
+            return True
+        return self._transaction(store)
+
+    def renew(self, units, worker):
+        """
+        Extend the leases a worker still holds on units.
+
+        Args:
+            units: Leased crawl units
+            worker: Worker identifier holding the leases
+
+        Returns:
+            Number of leases renewed; finished units and lost leases are skipped
+        """
+        now = time.time()
+        keys = [(now + self.lease_seconds, now, unit_key(unit), worker, LEASED) for unit in units]
+
+        def extend(connection):
+            before = connection.total_changes
+            connection.executemany(
+                "UPDATE units SET lease_expires = ?, updated = ? WHERE key = ? AND worker = ? AND state = ?",
+                keys)
+            return connection.total_changes - before
+        return self._transaction(extend)
+
+    def unit_done(self, unit, worker, stats):
+        """
+        Finish a leased unit, or put it back in the queue if its search failed.
+
+        Args:
+            unit: Leased crawl unit
+            worker: Worker identifier holding the lease
+            stats: Unit statistics from the crawl engine
+        """
+        key = unit_key(unit)
+
+        def finish(connection):
+            now = time.time()
+            if not stats["failed"]:
+                state = DONE
+            else:
+                attempts = connection.execute(
+                    "SELECT attempts FROM units WHERE key = ?", (key,)).fetchone()[0]
+                state = FAILED if attempts >= self.max_attempts else PENDING
+            connection.execute(
+                "UPDATE units SET state = ?, worker = NULL, lease_expires = NULL, "
+                "calls = calls + ?, error = ?, updated = ? WHERE key = ? AND worker = ? AND state = ?",
+                (state, stats["calls"], "search failed" if stats["failed"] else None, now,
+                 key, worker, LEASED)
+            )
+        self._transaction(finish)
+
+    def release(self, units, worker):
+        """Return units leased by a worker to the queue, e.g. after it crashed mid-batch."""
+        keys = [(PENDING, time.time(), unit_key(unit), worker, LEASED) for unit in units]
+
+        def put_back(connection):
+            connection.executemany(
+                "UPDATE units SET state = ?, worker = NULL, lease_expires = NULL, updated = ? "
+                "WHERE key = ? AND worker = ? AND state = ?", keys)
+        self._transaction(put_back)
+
+    def counts(self):
+        """
+        Count units per state; expired leases count as pending.
+
+        Returns:
+            Dictionary mapping state to number of units
+        """
+        with self.lock:
+            connection = self._connect()
+            counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+            for state, count in connection.execute("SELECT state, COUNT(*) FROM units GROUP BY state"):
+                counts[state] = count
+            expired = connection.execute(
+                "SELECT COUNT(*) FROM units WHERE state = ? AND lease_expires < ?",
+                (LEASED, time.time())
+            ).fetchone()[0]
+        counts[LEASED] -= expired
+        counts[PENDING] += expired
+        return counts
+
+    def stats(self):
+        """
+        Report queue progress.
+
+        Returns:
+            Dictionary with unit counts per state, stored records and active workers
+        """
+        counts = self.counts()
+        with self.lock:
+            connection = self._connect()
+            records = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            workers = [row[0] for row in connection.execute(
+                "SELECT DISTINCT worker FROM units WHERE state = ? AND lease_expires >= ?",
+                (LEASED, time.time()))]
+        return {"units": counts, "records": records, "active_workers": sorted(workers)}
+
+    def iter_records(self):
+        """
+        Stream the stored result records in unit and page order.
+
+        Yields:
+            Result record dictionaries
+        """
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT results.record FROM results JOIN units ON units.key = results.key "
+                "ORDER BY units.rowid, results.page, results.rowid"
+            ).fetchall()
+        for (record,) in rows:
+            yield json.loads(record)
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+def default_worker_id():
+    """Return a worker identifier unique to this host and process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+def run_worker(queue, worker, search_fn, profile_fn, relevance_fn, log=print, max_concurrency=8,
+               pagination=None, poll_interval=None, profiles_fn=None, profile_batch_size=1,
+               prefilter=None, should_fetch=None):
+    """
+    Lease and crawl units until the queue is drained.
+
+    Args:
+        queue: WorkQueue instance
+        worker: Worker identifier
+        search_fn: Callable taking a unit and a start offset and returning a search response
+        profile_fn: Callable taking a username and returning a profile response
+        relevance_fn: Callable deciding whether profile data is relevant
+        log: Logging callable
+        max_concurrency: Units leased at once and API calls in flight
+        pagination: Stop rules passed to the paginator
+        poll_interval: Seconds to wait while other workers hold the remaining leases
+        profiles_fn: Optional bulk callable taking a list of usernames and
+            returning {username: profile response}; used instead of profile_fn
+        profile_batch_size: Usernames per profiles_fn call
+        prefilter: Optional callable selecting and ordering a page's search items before fetching
+        should_fetch: Optional callable deciding from a search item whether to fetch its profile
+
+    Returns:
+        Dictionary with the units and records this worker completed
+    """
+    poll_interval = poll_interval or QUEUE_DEFAULTS["poll_interval"]
+    totals = {"units": 0, "records": 0, "lost_leases": 0}
+
+    def record_page(unit, page, records):
+        if queue.page_done(unit, worker, page["page"], page["next_start"], records):
+            totals["records"] += len(records)
+        else:
+            totals["lost_leases"] += 1
+
+    def record_unit(unit, stats):
+        queue.unit_done(unit, worker, stats)
+        totals["units"] += 1
+
+    def heartbeat(units, stop):
+        # One page's profile lookups may outlast the lease; page_done alone would renew too late
+        while not stop.wait(queue.lease_seconds / 4):
+            queue.renew(units, worker)
+
+    while True:
+        units = queue.lease(worker, max_concurrency)
+        if not units:
+            counts = queue.counts()
+            if not counts[PENDING] and not counts[LEASED]:
+                break
+            # Other workers still hold leases; wait in case one of them dies
+            time.sleep(poll_interval)
+            continue
+
+        log(f"Worker {worker} leased {len(units)} units")
+        stop = threading.Event()
+        renewer = threading.Thread(target=heartbeat, args=(units, stop), name="lease-heartbeat", daemon=True)
+        renewer.start()
+        try:
+            run_crawl(units, search_fn, profile_fn, relevance_fn, log=log,
+                      max_concurrency=max_concurrency, on_unit_complete=record_unit,
+                      on_page_complete=record_page, pagination=pagination,
+                      profiles_fn=profiles_fn, profile_batch_size=profile_batch_size,
+                      prefilter=prefilter, should_fetch=should_fetch)
+        except BaseException:
+            queue.release(units, worker)
+            raise
+        finally:
+            stop.set()
+            renewer.join()
+
+    log(f"Worker {worker} finished: {json.dumps(totals)}")
+    return totals
+
+def _worker_process(script_name, queue_path, worker):
+    """Entry point of a spawned worker process."""
+    crawler = importlib.import_module(script_name).CRAWLER
+    crawler.configure_rate_limits()
+    batch_size = crawler.backend.max_batch
+    prefilter = crawler.new_prefilter()
+    queue = WorkQueue(queue_path)
+    try:
+        run_worker(queue, worker, crawler.search_unit, crawler.get_profile_details,
+                   crawler.is_job_relevant, log=crawler.log_message,
+                   max_concurrency=crawler.config["max_concurrency"],
+                   pagination=crawler.config["pagination"],
+                   profiles_fn=crawler.get_profiles if batch_size > 1 else None,
+                   profile_batch_size=batch_size,
+                   prefilter=prefilter.select, should_fetch=prefilter.budgeted())
+        crawler.log_message(f"Worker {worker} pre-filter: {json.dumps(prefilter.stats())}")
+    finally:
+        queue.close()
+        crawler.profile_cache.close()
+        crawler.backend.close()
+
+def main(argv=None):
+    """Plan, work, inspect or collect a queued crawl."""
+    parser = argparse.ArgumentParser(description="Sharded LinkedIn crawl over a durable work queue")
+    parser.add_argument("command", choices=["plan", "work", "status", "collect"])
+    parser.add_argument("--script", default="linkedin_search_automation",
+                        help="search script providing the CRAWLER and its CONFIG")
+    parser.add_argument("--queue", default=QUEUE_DEFAULTS["path"], help="queue database file")
+    parser.add_argument("--budget", type=int, default=None, help="API call budget of the plan")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes to start")
+    parser.add_argument("--worker-id", default=None,
+                        help="worker name (default host-pid); run one per API account")
+    args = parser.parse_args(argv)
+
+    queue = WorkQueue(args.queue)
+    if args.command == "status":
+        print(json.dumps(queue.stats(), indent=2))
+        return queue.stats()
+
+    script = importlib.import_module(args.script)
+    if args.command == "plan":
+        plan = script.plan_search(args.budget)
+        added = queue.enqueue(plan["units"])
+        script.log_message(f"Queued {added} new units ({len(plan['units'])} planned) in {args.queue}")
+        return added
+
+    if args.command == "collect":
+        script.save_results(queue.iter_records())
+        script.export_results(queue.iter_records())
+        script.log_message(f"Collected queue results: {json.dumps(queue.stats())}")
+        return queue.stats()
+
+    base = args.worker_id or default_worker_id()
+    if args.processes == 1:
+        _worker_process(args.script, args.queue, base)
+    else:
+        # Spawned workers get fresh API clients, caches and rate limiters
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_worker_process, args=(args.script, args.queue, f"{base}-{number}"))
+                   for number in range(args.processes)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+    script.log_message(f"Work queue: {json.dumps(queue.stats())}")
+    return queue.stats()
+
+if __name__ == "__main__":
+    main()